@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 import struct
 
 from neo.crypto.hash import hash256
+from neo.io.binary_writer import encode_var_int as write_var_int
 
 # NEF magic number
 NEF_MAGIC = 0x3346454E  # "NEF3"
@@ -211,17 +212,6 @@ class NefFile:
 
         return nef
 
-def write_var_int(value: int) -> bytes:
-    """Write variable length integer."""
-    if value < 0xFD:
-        return bytes([value])
-    elif value <= 0xFFFF:
-        return bytes([0xFD]) + struct.pack('<H', value)
-    elif value <= 0xFFFFFFFF:
-        return bytes([0xFE]) + struct.pack('<I', value)
-    else:
-        return bytes([0xFF]) + struct.pack('<Q', value)
-
 def write_var_bytes(data: bytes) -> bytes:
     """Write variable length bytes."""
     return write_var_int(len(data)) + data
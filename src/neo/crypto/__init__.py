@@ -2,7 +2,7 @@
 
 from .hash import hash160, hash256, sha256, ripemd160
 from .ecdsa import verify_signature
-from .murmur3 import murmur32
+from .murmur3 import murmur32, murmur32_many
 from .murmur128 import murmur128
 from .ed25519 import ed25519_verify
 
@@ -13,6 +13,7 @@ __all__ = [
     "ripemd160",
     "verify_signature",
     "murmur32",
+    "murmur32_many",
     "murmur128",
     "ed25519_verify",
 ]
@@ -5,11 +5,29 @@ whether an element is a member of a set. False positive matches are possible,
 but false negatives are not.
 
 Reference: Neo.Cryptography.BloomFilter
+
+The per-function seeds are computed once per filter and each element is
+hashed under all of them with :func:`murmur32_many`. ``add_many`` and
+``check_many`` process a batch of elements; with NumPy installed the bit
+updates and lookups for large batches run vectorized over the same
+``bytearray``.
 """
 
 import math
+from collections.abc import Iterable
+
+from neo.crypto.murmur3 import murmur32_many
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
 
-from neo.crypto.murmur3 import murmur32
+# Batches with fewer bit positions than this stay on the pure-Python path,
+# where building the arrays would cost more than it saves.
+NUMPY_MIN_POSITIONS = 256
 
 
 class BloomFilter:
@@ -38,6 +56,12 @@ class BloomFilter:
         self.k = k
         self.seed = seed
         self.bits = bytearray((m + 7) // 8)
+        # Per-function seed matches C#: _seeds[p] = (uint)p * 0xFBA4C795 + nTweak
+        self._seeds = tuple((i * 0xFBA4C795 + seed) & 0xFFFFFFFF for i in range(k))
+
+    def _positions(self, element: bytes) -> list[int]:
+        m = self.m
+        return [h % m for h in murmur32_many(element, self._seeds)]
 
     def add(self, element: bytes) -> None:
         """Add an element to the Bloom filter.
@@ -45,13 +69,21 @@ class BloomFilter:
         Args:
             element: The element to add (as bytes)
         """
-        for i in range(self.k):
-            # Per-function seed matches C#: _seeds[p] = (uint)p * 0xFBA4C795 + nTweak
-            seed = (i * 0xFBA4C795 + self.seed) & 0xFFFFFFFF
-            h = murmur32(element, seed) % self.m
-            byte_index = h // 8
-            bit_index = h % 8
-            self.bits[byte_index] |= 1 << bit_index
+        bits = self.bits
+        for position in self._positions(element):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def add_many(self, elements: Iterable[bytes]) -> None:
+        """Add every element of ``elements`` to the filter."""
+        positions = [p for element in elements for p in self._positions(element)]
+        if HAS_NUMPY and len(positions) >= NUMPY_MIN_POSITIONS:
+            index = np.fromiter(positions, dtype=np.int64, count=len(positions))
+            bits = np.frombuffer(self.bits, dtype=np.uint8)
+            np.bitwise_or.at(bits, index >> 3, np.left_shift(1, index & 7).astype(np.uint8))
+            return
+        bits = self.bits
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
 
     def check(self, element: bytes) -> bool:
         """Check if an element might be in the set.
@@ -63,15 +95,47 @@ class BloomFilter:
             True if the element might be in the set (possible false positive),
             False if the element is definitely not in the set.
         """
-        for i in range(self.k):
-            seed = (i * 0xFBA4C795 + self.seed) & 0xFFFFFFFF
-            h = murmur32(element, seed) % self.m
-            byte_index = h // 8
-            bit_index = h % 8
-            if not (self.bits[byte_index] & (1 << bit_index)):
+        bits = self.bits
+        for position in self._positions(element):
+            if not (bits[position >> 3] & (1 << (position & 7))):
                 return False
         return True
 
+    def check_many(self, elements: Iterable[bytes]) -> list[bool]:
+        """Check each element of ``elements``, in order."""
+        groups = [self._positions(element) for element in elements]
+        if HAS_NUMPY and len(groups) * self.k >= NUMPY_MIN_POSITIONS:
+            index = np.array(groups, dtype=np.int64).reshape(len(groups), self.k)
+            bits = np.frombuffer(self.bits, dtype=np.uint8)
+            hits = (bits[index >> 3] >> (index & 7)) & 1
+            return [bool(hit) for hit in hits.all(axis=1)]
+        bits = self.bits
+        return [
+            all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+            for positions in groups
+        ]
+
+    def match_transactions(self, transactions: Iterable) -> list[bool]:
+        """Flag the transactions a light client filtering with this filter wants.
+
+        Mirrors C# ``RemoteNode`` filtering: a transaction matches when its
+        hash or any signer account (the witness script hash) is in the
+        filter. All hashes are checked in a single batch.
+        """
+        spans: list[int] = []
+        elements: list[bytes] = []
+        for tx in transactions:
+            elements.append(bytes(tx.hash))
+            elements.extend(bytes(signer.account) for signer in tx.signers)
+            spans.append(1 + len(tx.signers))
+        hits = self.check_many(elements)
+        flags = []
+        start = 0
+        for span in spans:
+            flags.append(any(hits[start:start + span]))
+            start += span
+        return flags
+
     def __contains__(self, element: bytes) -> bool:
         """Support 'in' operator."""
         return self.check(element)
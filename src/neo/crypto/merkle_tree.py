@@ -1,74 +1,119 @@
 """Neo N3 Merkle Tree.
 
 Reference: Neo.Cryptography.MerkleTree
+
+``MerkleTree`` keeps every level of the tree, so the root, proofs and
+partial trees are read from stored hashes instead of being rebuilt.
+Appending a leaf only rehashes the path from that leaf to the root. As in
+C#, a level with an odd number of nodes pairs its last node with itself.
 """
 
 from __future__ import annotations
 
-from neo.crypto.hash import hash256
+from collections.abc import Iterable, Sequence
+from hashlib import sha256
+
+
+def _hash_pair(left: bytes, right: bytes) -> bytes:
+    return sha256(sha256(left + right).digest()).digest()
+
+
+def _next_level(level: Sequence[bytes]) -> list[bytes]:
+    """Hash ``level`` pairwise into its parent level."""
+    count = len(level)
+    parents = [_hash_pair(level[i], level[i + 1]) for i in range(0, count - 1, 2)]
+    if count % 2:
+        parents.append(_hash_pair(level[-1], level[-1]))
+    return parents
+
 
 def compute_root(hashes: list[bytes]) -> bytes:
     """Compute merkle root from list of hashes."""
     if not hashes:
         return bytes(32)
-    working = list(hashes)
+    working: Sequence[bytes] = hashes
     while len(working) > 1:
-        if len(working) % 2 == 1:
-            working.append(working[-1])
-        working = [hash256(working[i] + working[i+1]) 
-                   for i in range(0, len(working), 2)]
+        working = _next_level(working)
     return working[0]
 
+
 class MerkleTree:
     """Merkle tree implementation."""
-    
-    def __init__(self, hashes: list[bytes]) -> None:
+
+    def __init__(self, hashes: Iterable[bytes] = ()) -> None:
         """Initialize merkle tree from leaf hashes."""
-        self._leaves = list(hashes)
-        self._root: bytes | None = None
-    
+        levels = [list(hashes)]
+        while len(levels[-1]) > 1:
+            levels.append(_next_level(levels[-1]))
+        self._levels = levels
+
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def depth(self) -> int:
+        """Number of levels, 0 for an empty tree."""
+        return len(self._levels) if self._levels[0] else 0
+
     @property
     def root(self) -> bytes:
         """Get the merkle root."""
-        if self._root is None:
-            self._root = compute_root(self._leaves)
-        return self._root
-    
+        top = self._levels[-1]
+        return top[0] if top else bytes(32)
+
+    def append(self, leaf: bytes) -> None:
+        """Add a leaf, rehashing only its path to the root."""
+        levels = self._levels
+        levels[0].append(leaf)
+        level = 0
+        index = len(levels[0]) - 1
+        while len(levels[level]) > 1:
+            nodes = levels[level]
+            left = index & ~1
+            right = left + 1 if left + 1 < len(nodes) else left
+            parent = _hash_pair(nodes[left], nodes[right])
+            if level + 1 == len(levels):
+                levels.append([])
+            index //= 2
+            parents = levels[level + 1]
+            if index == len(parents):
+                parents.append(parent)
+            else:
+                parents[index] = parent
+            level += 1
+
     @staticmethod
     def compute_root(hashes: list[bytes]) -> bytes:
         """Compute merkle root from list of hashes."""
         return compute_root(hashes)
-    
+
     @staticmethod
     def compute_root_from_data(data_list: list[bytes]) -> bytes:
         """Compute merkle root from list of data (hashes each item first)."""
-        hashes = [hash256(d) for d in data_list]
+        hashes = [sha256(sha256(d).digest()).digest() for d in data_list]
         return compute_root(hashes)
-    
+
     def get_proof(self, index: int) -> list[bytes]:
         """Get merkle proof for leaf at index."""
-        if index < 0 or index >= len(self._leaves):
-            raise IndexError("Index out of range")
-        
-        proof = []
-        working = list(self._leaves)
-        idx = index
-        
-        while len(working) > 1:
-            if len(working) % 2 == 1:
-                working.append(working[-1])
-            
-            # Get sibling
-            sibling_idx = idx ^ 1
-            proof.append(working[sibling_idx])
-            
-            # Move to next level
-            working = [hash256(working[i] + working[i+1]) 
-                       for i in range(0, len(working), 2)]
-            idx //= 2
-        
-        return proof
-    
+        return self.get_proofs([index])[0]
+
+    def get_proofs(self, indices: Sequence[int]) -> list[list[bytes]]:
+        """Get the proofs for several leaves in one walk up the tree."""
+        count = len(self._levels[0])
+        for index in indices:
+            if index < 0 or index >= count:
+                raise IndexError("Index out of range")
+
+        proofs: list[list[bytes]] = [[] for _ in indices]
+        positions = list(indices)
+        for nodes in self._levels[:-1]:
+            last = len(nodes) - 1
+            for k, position in enumerate(positions):
+                sibling = position ^ 1
+                proofs[k].append(nodes[min(sibling, last)])
+                positions[k] = position // 2
+        return proofs
+
     @staticmethod
     def verify_proof(
         leaf_hash: bytes,
@@ -79,12 +124,104 @@ class MerkleTree:
         """Verify a merkle proof."""
         current = leaf_hash
         idx = index
-        
+
         for sibling in proof:
             if idx % 2 == 0:
-                current = hash256(current + sibling)
+                current = _hash_pair(current, sibling)
             else:
-                current = hash256(sibling + current)
+                current = _hash_pair(sibling, current)
             idx //= 2
-        
+
         return current == root
+
+    @staticmethod
+    def verify_proofs(
+        leaves: Sequence[bytes],
+        proofs: Sequence[Sequence[bytes]],
+        root: bytes,
+        indices: Sequence[int],
+    ) -> bool:
+        """Verify several proofs against ``root`` in one pass.
+
+        Nodes shared between proofs are hashed once, and every proof must
+        agree on them.
+        """
+        if not (len(leaves) == len(proofs) == len(indices)) or not leaves:
+            return False
+        depth = len(proofs[0])
+        if any(len(proof) != depth for proof in proofs):
+            return False
+
+        known: dict[int, bytes] = {}
+        for index, leaf in zip(indices, leaves):
+            if known.setdefault(index, leaf) != leaf:
+                return False
+        owners = {index: k for k, index in enumerate(indices)}
+
+        for level in range(depth):
+            parents: dict[int, bytes] = {}
+            parent_owners: dict[int, int] = {}
+            for index, node in known.items():
+                owner = owners[index]
+                sibling = known.get(index ^ 1, proofs[owner][level])
+                if proofs[owner][level] != sibling:
+                    return False
+                if index % 2 == 0:
+                    parent = _hash_pair(node, sibling)
+                else:
+                    parent = _hash_pair(sibling, node)
+                if parents.setdefault(index // 2, parent) != parent:
+                    return False
+                parent_owners.setdefault(index // 2, owner)
+            known, owners = parents, parent_owners
+
+        return len(known) == 1 and next(iter(known.values())) == root
+
+    def get_partial_hashes(self, flags: Sequence[bool]) -> list[bytes]:
+        """Hashes of the tree trimmed to the flagged leaves, depth first.
+
+        Mirrors C# ``MerkleTree.Trim`` followed by ``ToHashArray``: a
+        subtree with no flagged leaf collapses to its root hash. Flags past
+        the end count as unset.
+        """
+        levels = self._levels
+        if not levels[0]:
+            return []
+        top = len(levels) - 1
+        collapsed: set[tuple[int, int]] = set()
+
+        def flag(position: int) -> bool:
+            return position < len(flags) and bool(flags[position])
+
+        def children(level: int, index: int) -> tuple[int, int]:
+            left = index * 2
+            return left, min(left + 1, len(levels[level - 1]) - 1)
+
+        # C# trims node objects, and a duplicated right child is the same
+        # object as its left sibling, so both visits act on one node.
+        def trim(level: int, index: int, position: int) -> None:
+            if level == 0 or (level, index) in collapsed:
+                return
+            if level == 1:
+                if not flag(position * 2) and not flag(position * 2 + 1):
+                    collapsed.add((level, index))
+                return
+            left, right = children(level, index)
+            trim(level - 1, left, position * 2)
+            trim(level - 1, right, position * 2 + 1)
+            if (level - 1, left) in collapsed and (level - 1, right) in collapsed:
+                collapsed.add((level, index))
+
+        trim(top, 0, 0)
+
+        hashes: list[bytes] = []
+        stack = [(top, 0)]
+        while stack:
+            level, index = stack.pop()
+            if level == 0 or (level, index) in collapsed:
+                hashes.append(levels[level][index])
+                continue
+            left, right = children(level, index)
+            stack.append((level - 1, right))
+            stack.append((level - 1, left))
+        return hashes
@@ -1,46 +1,79 @@
-"""Neo N3 Murmur3 Hash."""
+"""Neo N3 Murmur3 Hash.
 
+The 4-byte blocks are decoded with one ``struct`` call and mixed with the
+block constants once; only the seed-dependent accumulation runs per seed.
+That lets :func:`murmur32_many` hash one input under many seeds (as a
+Bloom filter does) for little more than the cost of a single hash.
+"""
 
-def murmur32(data: bytes, seed: int = 0) -> int:
-    """Murmur3 32-bit hash.
-    
-    Matches Neo C# implementation in Neo.Cryptography.Murmur32.
-    """
-    c1, c2 = 0xcc9e2d51, 0x1b873593
-    h = seed & 0xffffffff
+import struct
+from collections.abc import Iterable
+from functools import lru_cache
+
+_C1 = 0xcc9e2d51
+_C2 = 0x1b873593
+_MASK = 0xffffffff
+
+
+@lru_cache(maxsize=128)
+def _blocks(count: int) -> struct.Struct:
+    return struct.Struct(f'<{count}I')
+
+
+def _mix(data: bytes) -> tuple[list[int], int | None]:
+    """Seed-independent part: mixed blocks and the mixed tail, if any."""
     length = len(data)
-    
-    # Process 4-byte blocks
-    nblocks = length // 4
-    for i in range(nblocks):
-        k = int.from_bytes(data[i*4:(i+1)*4], 'little')
-        k = (k * c1) & 0xffffffff
-        k = ((k << 15) | (k >> 17)) & 0xffffffff
-        k = (k * c2) & 0xffffffff
-        h ^= k
-        h = ((h << 13) | (h >> 19)) & 0xffffffff
-        h = ((h * 5) + 0xe6546b64) & 0xffffffff
-    
-    # Process tail bytes (remaining bytes that don't form a complete block)
+    nblocks = length >> 2
+    mixed = []
+    if nblocks:
+        for k in _blocks(nblocks).unpack_from(data):
+            k = (k * _C1) & _MASK
+            k = ((k << 15) | (k >> 17)) & _MASK
+            mixed.append((k * _C2) & _MASK)
+
     tail_index = nblocks * 4
     tail_size = length & 3
-    k = 0
-    if tail_size >= 3:
-        k ^= data[tail_index + 2] << 16
+    if not tail_size:
+        return mixed, None
+    k = data[tail_index]
     if tail_size >= 2:
         k ^= data[tail_index + 1] << 8
-    if tail_size >= 1:
-        k ^= data[tail_index]
-        k = (k * c1) & 0xffffffff
-        k = ((k << 15) | (k >> 17)) & 0xffffffff
-        k = (k * c2) & 0xffffffff
+    if tail_size >= 3:
+        k ^= data[tail_index + 2] << 16
+    k = (k * _C1) & _MASK
+    k = ((k << 15) | (k >> 17)) & _MASK
+    return mixed, (k * _C2) & _MASK
+
+
+def _finish(h: int, mixed: list[int], tail: int | None, length: int) -> int:
+    for k in mixed:
         h ^= k
-    
+        h = ((h << 13) | (h >> 19)) & _MASK
+        h = (h * 5 + 0xe6546b64) & _MASK
+    if tail is not None:
+        h ^= tail
+
     # Finalization
     h ^= length
     h ^= h >> 16
-    h = (h * 0x85ebca6b) & 0xffffffff
+    h = (h * 0x85ebca6b) & _MASK
     h ^= h >> 13
-    h = (h * 0xc2b2ae35) & 0xffffffff
+    h = (h * 0xc2b2ae35) & _MASK
     h ^= h >> 16
     return h
+
+
+def murmur32(data: bytes, seed: int = 0) -> int:
+    """Murmur3 32-bit hash.
+
+    Matches Neo C# implementation in Neo.Cryptography.Murmur32.
+    """
+    mixed, tail = _mix(data)
+    return _finish(seed & _MASK, mixed, tail, len(data))
+
+
+def murmur32_many(data: bytes, seeds: Iterable[int]) -> list[int]:
+    """Murmur3 32-bit hashes of ``data`` under each of ``seeds``."""
+    mixed, tail = _mix(data)
+    length = len(data)
+    return [_finish(seed & _MASK, mixed, tail, length) for seed in seeds]
@@ -2,6 +2,13 @@
 BinaryReader - Binary deserialization helper.
 
 Reference: Neo.IO.MemoryReader
+
+The reader accepts ``bytes``, ``bytearray`` or ``memoryview`` and never
+copies the input. Fixed-width integers are decoded in place with
+``struct.unpack_from``. :meth:`BinaryReader.read_bytes` returns owned
+``bytes``; :meth:`BinaryReader.read_view` and
+:meth:`BinaryReader.read_var_view` return zero-copy views for large
+payloads the caller only inspects, hashes or re-parses.
 """
 
 import struct
@@ -14,14 +21,24 @@ if TYPE_CHECKING:
 
 T = TypeVar('T', bound='ISerializable')
 
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
 
 class BinaryReader:
     """Binary reader for deserializing Neo data structures."""
     
-    __slots__ = ("_data", "_position")
+    __slots__ = ("_data", "_view", "_position")
     
-    def __init__(self, data: bytes) -> None:
-        self._data = data
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        view = memoryview(data)
+        if view.format != 'B' or view.ndim != 1:
+            view = view.cast('B')
+        self._view = view
+        # Slicing ``bytes`` directly is the cheapest way to get owned
+        # copies of small fields; other buffers go through the view.
+        self._data = data if type(data) is bytes else view
         self._position = 0
     
     @property
@@ -39,6 +56,10 @@ class BinaryReader:
         """Remaining bytes to read."""
         return len(self._data) - self._position
     
+    def get_span(self, start: int) -> bytes:
+        """Bytes consumed between ``start`` and the current position."""
+        return self._view[start:self._position].tobytes()
+    
     def _check_size(self, size: int) -> None:
         """Check if enough bytes are available."""
         if self._position + size > len(self._data):
@@ -54,10 +75,25 @@ class BinaryReader:
     def read_bytes(self, count: int) -> bytes:
         """Read a fixed number of bytes."""
         self._check_size(count)
-        value = self._data[self._position:self._position + count]
+        start = self._position
+        self._position = end = start + count
+        data = self._data
+        if isinstance(data, bytes):
+            return data[start:end]
+        return data[start:end].tobytes()
+    
+    def read_view(self, count: int) -> memoryview:
+        """Read ``count`` bytes as a zero-copy view of the input."""
+        self._check_size(count)
+        value = self._view[self._position:self._position + count]
         self._position += count
         return value
     
+    def skip(self, count: int) -> None:
+        """Advance past ``count`` bytes."""
+        self._check_size(count)
+        self._position += count
+    
     def read_bool(self) -> bool:
         """Read a boolean."""
         return self.read_byte() != 0
@@ -70,7 +106,7 @@ class BinaryReader:
     def read_uint16(self) -> int:
         """Read an unsigned 16-bit integer (little-endian)."""
         self._check_size(2)
-        value = struct.unpack_from('<H', self._data, self._position)[0]
+        value = _U16.unpack_from(self._data, self._position)[0]
         self._position += 2
         return value
     
@@ -84,7 +120,7 @@ class BinaryReader:
     def read_uint32(self) -> int:
         """Read an unsigned 32-bit integer (little-endian)."""
         self._check_size(4)
-        value = struct.unpack_from('<I', self._data, self._position)[0]
+        value = _U32.unpack_from(self._data, self._position)[0]
         self._position += 4
         return value
     
@@ -98,7 +134,7 @@ class BinaryReader:
     def read_uint64(self) -> int:
         """Read an unsigned 64-bit integer (little-endian)."""
         self._check_size(8)
-        value = struct.unpack_from('<Q', self._data, self._position)[0]
+        value = _U64.unpack_from(self._data, self._position)[0]
         self._position += 8
         return value
     
@@ -111,15 +147,18 @@ class BinaryReader:
     
     def read_var_int(self, max_value: int = 0xFFFFFFFFFFFFFFFF) -> int:
         """Read a variable-length integer."""
-        fb = self.read_byte()
-        if fb == 0xFD:
-            value = self.read_uint16()
-        elif fb == 0xFE:
-            value = self.read_uint32()
-        elif fb == 0xFF:
-            value = self.read_uint64()
-        else:
+        self._check_size(1)
+        position = self._position
+        fb = self._data[position]
+        if fb < 0xFD:
             value = fb
+            self._position = position + 1
+        else:
+            codec = _U16 if fb == 0xFD else _U32 if fb == 0xFE else _U64
+            self._position = position = position + 1
+            self._check_size(codec.size)
+            value = codec.unpack_from(self._data, position)[0]
+            self._position = position + codec.size
         if value > max_value:
             raise ValueError(f"VarInt {value} exceeds max {max_value}")
         return value
@@ -129,6 +168,11 @@ class BinaryReader:
         length = self.read_var_int(max_length)
         return self.read_bytes(length)
     
+    def read_var_view(self, max_length: int = 0x1000000) -> memoryview:
+        """Read a variable-length byte array as a zero-copy view."""
+        length = self.read_var_int(max_length)
+        return self.read_view(length)
+    
     def read_var_string(self, max_length: int = 0x1000000) -> str:
         """Read a variable-length UTF-8 string."""
         return self.read_var_bytes(max_length).decode('utf-8')
@@ -2,6 +2,15 @@
 BinaryWriter - Binary serialization helper.
 
 Reference: Neo.IO.BinaryWriter extensions
+
+``BinaryWriter()`` appends to a growing ``bytearray``, which is the
+cheapest option for small payloads. ``BinaryWriter.sized(size)`` reserves
+the buffer up front when the caller already knows the serialized size; fields
+are then packed in place with ``struct.pack_into`` and large payloads
+(blocks, trimmed blocks) avoid repeated reallocation.
+
+The module-level var-int helpers are the single encoder shared by the
+payloads, native contract records and the stack item serializer.
 """
 
 import struct
@@ -12,6 +21,59 @@ if TYPE_CHECKING:
     from neo.types.uint160 import UInt160
     from neo.types.uint256 import UInt256
 
+_I8 = struct.Struct('<b')
+_U16 = struct.Struct('<H')
+_I16 = struct.Struct('<h')
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_U64 = struct.Struct('<Q')
+_I64 = struct.Struct('<q')
+
+_SMALL_VAR_INTS = tuple(bytes((value,)) for value in range(0xFD))
+
+
+def get_var_size(value: int) -> int:
+    """Encoded size of ``value`` as a var-int."""
+    if value < 0xFD:
+        return 1
+    elif value <= 0xFFFF:
+        return 3
+    elif value <= 0xFFFFFFFF:
+        return 5
+    return 9
+
+
+def get_var_bytes_size(length: int) -> int:
+    """Encoded size of a var-bytes field holding ``length`` bytes."""
+    return get_var_size(length) + length
+
+
+def encode_var_int(value: int) -> bytes:
+    """Encode ``value`` as a var-int."""
+    if value < 0:
+        raise ValueError("VarInt cannot be negative")
+    if value < 0xFD:
+        return _SMALL_VAR_INTS[value]
+    elif value <= 0xFFFF:
+        return b'\xfd' + _U16.pack(value)
+    elif value <= 0xFFFFFFFF:
+        return b'\xfe' + _U32.pack(value)
+    return b'\xff' + _U64.pack(value)
+
+
+def append_var_int(buf: bytearray, value: int) -> None:
+    """Append ``value`` as a var-int to ``buf``."""
+    if 0 <= value < 0xFD:
+        buf.append(value)
+    else:
+        buf += encode_var_int(value)
+
+
+def append_var_bytes(buf: bytearray, data: bytes) -> None:
+    """Append ``data`` prefixed with its var-int length to ``buf``."""
+    append_var_int(buf, len(data))
+    buf += data
+
 
 class BinaryWriter:
     """Binary writer for serializing Neo data structures."""
@@ -21,6 +83,13 @@ class BinaryWriter:
     def __init__(self) -> None:
         self._data = bytearray()
     
+    @classmethod
+    def sized(cls, capacity: int) -> "BinaryWriter":
+        """Writer over a buffer of ``capacity`` bytes, ideally the exact size."""
+        if capacity > 0:
+            return _SizedBinaryWriter(capacity)
+        return cls()
+    
     def to_bytes(self) -> bytes:
         """Get the written data as bytes."""
         return bytes(self._data)
@@ -36,7 +105,7 @@ class BinaryWriter:
     
     def write_bytes(self, data: bytes) -> None:
         """Write raw bytes."""
-        self._data.extend(data)
+        self._data += data
     
     def write_bool(self, value: bool) -> None:
         """Write a boolean."""
@@ -44,47 +113,38 @@ class BinaryWriter:
     
     def write_int8(self, value: int) -> None:
         """Write a signed 8-bit integer."""
-        self._data.extend(struct.pack('<b', value))
+        self._data += _I8.pack(value)
     
     def write_uint16(self, value: int) -> None:
         """Write an unsigned 16-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<H', value))
+        self._data += _U16.pack(value)
     
     def write_int16(self, value: int) -> None:
         """Write a signed 16-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<h', value))
+        self._data += _I16.pack(value)
     
     def write_uint32(self, value: int) -> None:
         """Write an unsigned 32-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<I', value))
+        self._data += _U32.pack(value)
     
     def write_int32(self, value: int) -> None:
         """Write a signed 32-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<i', value))
+        self._data += _I32.pack(value)
     
     def write_uint64(self, value: int) -> None:
         """Write an unsigned 64-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<Q', value))
+        self._data += _U64.pack(value)
     
     def write_int64(self, value: int) -> None:
         """Write a signed 64-bit integer (little-endian)."""
-        self._data.extend(struct.pack('<q', value))
+        self._data += _I64.pack(value)
     
     def write_var_int(self, value: int) -> None:
         """Write a variable-length integer."""
-        if value < 0:
-            raise ValueError("VarInt cannot be negative")
-        if value < 0xFD:
+        if 0 <= value < 0xFD:
             self.write_byte(value)
-        elif value <= 0xFFFF:
-            self.write_byte(0xFD)
-            self.write_uint16(value)
-        elif value <= 0xFFFFFFFF:
-            self.write_byte(0xFE)
-            self.write_uint32(value)
         else:
-            self.write_byte(0xFF)
-            self.write_uint64(value)
+            self.write_bytes(encode_var_int(value))
     
     def write_var_bytes(self, data: bytes) -> None:
         """Write a variable-length byte array."""
@@ -116,3 +176,81 @@ class BinaryWriter:
     def write_ec_point(self, point: bytes) -> None:
         """Write an EC point."""
         self.write_bytes(point)
+
+
+class _SizedBinaryWriter(BinaryWriter):
+    """Writer over a preallocated buffer, filled in place with ``pack_into``.
+
+    Writing past the reserved size still works; the buffer then grows.
+    """
+    
+    __slots__ = ("_position",)
+    
+    def __init__(self, capacity: int) -> None:
+        self._data = bytearray(capacity)
+        self._position = 0
+    
+    def to_bytes(self) -> bytes:
+        """Get the written data as bytes."""
+        if self._position == len(self._data):
+            return bytes(self._data)
+        with memoryview(self._data) as view:
+            return bytes(view[:self._position])
+    
+    @property
+    def length(self) -> int:
+        """Get the current length of written data."""
+        return self._position
+    
+    def _pack(self, codec: struct.Struct, value: int) -> None:
+        position = self._position
+        end = position + codec.size
+        if end <= len(self._data):
+            codec.pack_into(self._data, position, value)
+        else:
+            self._data[position:] = codec.pack(value)
+        self._position = end
+    
+    def write_byte(self, value: int) -> None:
+        """Write a single byte."""
+        position = self._position
+        if position < len(self._data):
+            self._data[position] = value & 0xFF
+        else:
+            self._data[position:] = bytes((value & 0xFF,))
+        self._position = position + 1
+    
+    def write_bytes(self, data: bytes) -> None:
+        """Write raw bytes."""
+        position = self._position
+        end = position + len(data)
+        self._data[position:min(end, len(self._data))] = data
+        self._position = end
+    
+    def write_int8(self, value: int) -> None:
+        """Write a signed 8-bit integer."""
+        self._pack(_I8, value)
+    
+    def write_uint16(self, value: int) -> None:
+        """Write an unsigned 16-bit integer (little-endian)."""
+        self._pack(_U16, value)
+    
+    def write_int16(self, value: int) -> None:
+        """Write a signed 16-bit integer (little-endian)."""
+        self._pack(_I16, value)
+    
+    def write_uint32(self, value: int) -> None:
+        """Write an unsigned 32-bit integer (little-endian)."""
+        self._pack(_U32, value)
+    
+    def write_int32(self, value: int) -> None:
+        """Write a signed 32-bit integer (little-endian)."""
+        self._pack(_I32, value)
+    
+    def write_uint64(self, value: int) -> None:
+        """Write an unsigned 64-bit integer (little-endian)."""
+        self._pack(_U64, value)
+    
+    def write_int64(self, value: int) -> None:
+        """Write a signed 64-bit integer (little-endian)."""
+        self._pack(_I64, value)
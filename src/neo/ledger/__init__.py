@@ -9,6 +9,7 @@ from neo.ledger.pool_item import PoolItem
 from neo.ledger.header_cache import HeaderCache
 from neo.ledger.mempool import MemoryPool
 from neo.ledger.blockchain import Blockchain
+from neo.ledger.block_importer import BlockImporter
 
 __all__ = [
     "VerifyResult",
@@ -16,4 +17,5 @@ __all__ = [
     "HeaderCache",
     "MemoryPool",
     "Blockchain",
+    "BlockImporter",
 ]
@@ -0,0 +1,158 @@
+"""
+BlockImporter - Pipelined block import.
+
+Reference: Neo.Ledger.Blockchain (block import during sync)
+
+Blocks are verified ahead of execution: deserialization, the merkle root,
+the consensus witness signature, state-independent transaction checks and
+standard-account witness signatures need no chain state, so blocks
+N+1..N+k are prepared on a worker pool while block N is persisted.
+Prepared blocks are handed to the serial persist stage strictly in order,
+which checks the chain link and that the witness belongs to the previous
+block's ``next_consensus``.
+
+Only signature and multi-signature redeem scripts are executed here.
+Transaction witnesses with any other verification script, or none, are
+not verified during import: ``Blockchain.persist`` does not verify
+witnesses either.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from neo.exceptions import InvalidOperationException
+from neo.ledger.block_verifier import BlockVerifier
+from neo.ledger.transaction_verifier import TransactionVerifier
+from neo.ledger.verify_result import VerifyResult
+from neo.smartcontract.helper import is_multi_sig_contract, is_signature_contract
+
+if TYPE_CHECKING:
+    from neo.ledger.blockchain import ApplicationExecuted, Blockchain
+    from neo.network.payloads.block import Block
+
+
+@dataclass
+class PreparedBlock:
+    """A block with the outcome of its stateless verification."""
+
+    block: Block
+    result: VerifyResult
+
+
+def prepare_block(item: Block | bytes) -> PreparedBlock:
+    """Deserialize ``item`` if needed and run every stateless check.
+
+    The block witness and standard-account transaction witnesses are
+    executed here; all other witnesses need chain state and are skipped.
+    """
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        from neo.io.binary_reader import BinaryReader
+        from neo.network.payloads.block import Block
+
+        block = Block.deserialize(BinaryReader(item))
+    else:
+        block = item
+
+    result = BlockVerifier.verify_structure(block)
+    if result == VerifyResult.SUCCEED and not BlockVerifier.verify_merkle_root(block):
+        result = VerifyResult.INVALID
+    if result == VerifyResult.SUCCEED and not BlockVerifier.verify_witness(block):
+        result = VerifyResult.INVALID_SIGNATURE
+    if result == VerifyResult.SUCCEED:
+        result = _verify_transactions(block)
+    return PreparedBlock(block, result)
+
+
+def _verify_transactions(block: Block) -> VerifyResult:
+    for tx in block.transactions:
+        result = TransactionVerifier.verify_state_independent(tx)
+        if result != VerifyResult.SUCCEED:
+            return result
+        if len(tx.witnesses) != len(tx.signers):
+            return VerifyResult.INVALID
+        for signer, witness in zip(tx.signers, tx.witnesses):
+            script = witness.verification_script
+            if not (is_signature_contract(script) or is_multi_sig_contract(script)):
+                continue
+            if not TransactionVerifier.verify_witness(tx, signer.account, witness, None):
+                return VerifyResult.INVALID_SIGNATURE
+    return VerifyResult.SUCCEED
+
+
+class BlockImporter:
+    """Persists a stream of blocks, verifying upcoming blocks in parallel."""
+
+    DEFAULT_LOOKAHEAD = 8
+
+    def __init__(
+        self,
+        blockchain: Blockchain,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+        executor: Executor | None = None,
+    ) -> None:
+        """``executor`` defaults to a private thread pool per import.
+
+        A ``ProcessPoolExecutor`` also works, since :func:`prepare_block`
+        is a module-level function over picklable payloads.
+        """
+        if lookahead < 1:
+            raise ValueError("lookahead must be at least 1")
+        self._blockchain = blockchain
+        self._lookahead = lookahead
+        self._executor = executor
+
+    def import_blocks(
+        self, items: Iterable[Block | bytes]
+    ) -> Iterator[tuple[Block, list[ApplicationExecuted]]]:
+        """Verify and persist ``items`` in order, yielding each result.
+
+        Raises InvalidOperationException at the first block that fails
+        verification; blocks before it stay persisted.
+        """
+        owned = self._executor is None
+        executor: Executor
+        if self._executor is None:
+            executor = ThreadPoolExecutor(max_workers=self._lookahead)
+        else:
+            executor = self._executor
+        try:
+            yield from self._run(executor, iter(items))
+        finally:
+            if owned:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(
+        self, executor: Executor, items: Iterator[Block | bytes]
+    ) -> Iterator[tuple[Block, list[ApplicationExecuted]]]:
+        pending: deque[Future[PreparedBlock]] = deque()
+
+        def refill() -> None:
+            while len(pending) < self._lookahead:
+                item = next(items, None)
+                if item is None:
+                    return
+                pending.append(executor.submit(prepare_block, item))
+
+        refill()
+        while pending:
+            prepared = pending.popleft().result()
+            refill()
+            block = prepared.block
+            result = prepared.result
+            previous = self._blockchain.current_block
+            if result == VerifyResult.SUCCEED:
+                result = BlockVerifier.verify_chain_link(block, previous)
+            if result == VerifyResult.SUCCEED:
+                result = BlockVerifier.verify_consensus(block, previous)
+            if result != VerifyResult.SUCCEED:
+                for future in pending:
+                    future.cancel()
+                raise InvalidOperationException(
+                    f"Block {block.index} failed verification: {result.name}"
+                )
+            yield block, self._blockchain.persist(block)
@@ -88,6 +88,49 @@ class BlockVerifier:
 
         return VerifyResult.SUCCEED
 
+    @staticmethod
+    def verify_witness(block: Block) -> bool:
+        """Run the block witness against the block hash.
+
+        The consensus witness is a standard (multi-)signature script, so
+        it needs no chain state. Any other verification script is
+        rejected. The genesis block carries no signed witness.
+        """
+        from neo.crypto.hash import hash160
+        from neo.smartcontract.helper import is_multi_sig_contract, is_signature_contract
+
+        if block.index == 0:
+            return True
+        witness = block.witness
+        if witness is None:
+            return False
+        script = witness.verification_script
+        if not (is_multi_sig_contract(script) or is_signature_contract(script)):
+            return False
+        return TransactionVerifier.verify_witness(block, hash160(script), witness, None)
+
+    @staticmethod
+    def verify_consensus(
+        block: Block,
+        prev_block: Block | None,
+    ) -> VerifyResult:
+        """Verify the block is signed by the previous block's ``next_consensus``."""
+        from neo.crypto.hash import hash160
+
+        if block.index == 0:
+            return VerifyResult.SUCCEED
+
+        if prev_block is None or block.witness is None:
+            return VerifyResult.INVALID
+
+        next_consensus = prev_block.next_consensus
+        if hasattr(next_consensus, "data"):
+            next_consensus = next_consensus.data
+        if hash160(block.witness.verification_script) != bytes(next_consensus):
+            return VerifyResult.INVALID_SIGNATURE
+
+        return VerifyResult.SUCCEED
+
     @staticmethod
     def verify_merkle_root(block: "Block") -> bool:
         """Verify the merkle root matches transactions."""
@@ -6,16 +6,24 @@ Reference: Neo.Ledger.Blockchain
 
 from __future__ import annotations
 
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import cache
 from threading import RLock
-from typing import TYPE_CHECKING
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, cast
 
 from neo.types.uint256 import UInt256
 
 if TYPE_CHECKING:
+    from neo.ledger.mempool import MemoryPool
+    from neo.native.ledger import LedgerContract
     from neo.network.payloads.block import Block
+    from neo.network.payloads.header import Header
+    from neo.persistence.data_cache import DataCache
     from neo.persistence.store import IStore
+    from neo.smartcontract.application_engine import ApplicationEngine
 
 @dataclass
 class ApplicationExecuted:
@@ -29,13 +37,74 @@ class ApplicationExecuted:
     stack: list = field(default_factory=list)
     notifications: list = field(default_factory=list)
 
+    @classmethod
+    def from_engine(
+        cls, engine: ApplicationEngine, trigger: str, tx_hash: UInt256 | None = None
+    ) -> ApplicationExecuted:
+        """Capture the outcome of an executed engine."""
+        fault = engine.uncaught_exception
+        exception: str | None = None
+        if fault is not None:
+            try:
+                exception = fault.get_bytes_unsafe().decode("utf-8", "replace")
+            except TypeError:
+                exception = str(fault)
+        result = engine.result_stack
+        return cls(
+            tx_hash=tx_hash,
+            trigger=trigger,
+            vm_state=engine.state.name,
+            gas_consumed=engine.gas_consumed,
+            exception=exception,
+            stack=[result.peek(i) for i in reversed(range(len(result)))],
+            notifications=list(engine.notifications),
+        )
+
+
+@dataclass
+class PersistTimings:
+    """Wall-clock seconds spent in each phase of the last persisted block."""
+
+    on_persist: float = 0.0
+    transactions: list[float] = field(default_factory=list)
+    post_persist: float = 0.0
+    commit: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.on_persist + sum(self.transactions) + self.post_persist + self.commit
+
+
 class Blockchain:
-    """Manages blockchain state and block persistence."""
+    """Manages blockchain state and block persistence.
+
+    ``persist`` mirrors C# Blockchain.Persist: OnPersist, every transaction
+    and PostPersist run through ApplicationEngine over one DataCache for
+    the block, and the cache is committed to the store only once all
+    phases have run.
+
+    Block hashes are indexed by height. Only the most recent block bodies
+    are kept in memory; older ones are rebuilt from LedgerContract
+    storage on demand. The headers of the latest ``PINNED_HEADERS``
+    blocks stay in memory for header lookups.
+    """
+
+    BLOCK_CACHE_SIZE = 128
+    PINNED_HEADERS = 2_000
     
-    def __init__(self, store: IStore) -> None:
+    def __init__(self, store: IStore, protocol_settings: Any | None = None) -> None:
+        if protocol_settings is None:
+            from neo.protocol_settings import ProtocolSettings
+
+            protocol_settings = ProtocolSettings()
         self._store = store
+        self._protocol_settings = protocol_settings
         self._lock = RLock()
-        self._block_cache: dict[UInt256, Block] = {}
+        self.last_timings = PersistTimings()
+        self._block_cache: OrderedDict[UInt256, Block] = OrderedDict()
+        self._block_hashes: list[UInt256] = []
+        self._block_indices: dict[UInt256, int] = {}
+        self._recent_headers: deque[Header] = deque(maxlen=self.PINNED_HEADERS)
         self._current_block: Block | None = None
         self._genesis_block: Block | None = None
         
@@ -66,23 +135,133 @@ class Blockchain:
     def get_block(self, block_hash: UInt256) -> Block | None:
         """Get block by hash."""
         with self._lock:
-            return self._block_cache.get(block_hash)
+            block = self._block_cache.get(block_hash)
+            if block is not None:
+                self._block_cache.move_to_end(block_hash)
+                return block
+            if block_hash not in self._block_indices:
+                return None
+            block = self._load_block(block_hash)
+            if block is not None:
+                self._cache_block(block_hash, block)
+            return block
     
     def get_block_by_index(self, index: int) -> Block | None:
         """Get block by index."""
+        block_hash = self.get_block_hash(index)
+        return self.get_block(block_hash) if block_hash is not None else None
+
+    def get_block_hash(self, index: int) -> UInt256 | None:
+        """Get the hash of the persisted block at ``index``."""
         with self._lock:
-            for block in self._block_cache.values():
-                if block.index == index:
-                    return block
+            if 0 <= index < len(self._block_hashes):
+                return self._block_hashes[index]
             return None
+
+    def get_header(self, index: int) -> Header | None:
+        """Get the header of the persisted block at ``index``.
+
+        Recent headers are served from memory; older ones are read from
+        LedgerContract storage.
+        """
+        with self._lock:
+            if self._recent_headers:
+                offset = index - self._recent_headers[0].index
+                if 0 <= offset < len(self._recent_headers):
+                    return self._recent_headers[offset]
+            block_hash = self.get_block_hash(index)
+            if block_hash is None:
+                return None
+            trimmed = self._load_trimmed_block(block_hash)
+            return trimmed.header if trimmed is not None else None
     
     def contains_block(self, block_hash: UInt256) -> bool:
         """Check if block exists."""
         with self._lock:
-            return block_hash in self._block_cache
+            return block_hash in self._block_indices
+
+    @staticmethod
+    def _header_of(block: Block) -> Header:
+        from neo.network.payloads.header import Header
+
+        return Header(
+            version=block.version,
+            prev_hash=block.prev_hash,
+            merkle_root=block.merkle_root,
+            timestamp=block.timestamp,
+            nonce=block.nonce,
+            index=block.index,
+            primary_index=block.primary_index,
+            next_consensus=block.next_consensus,
+            witness=block.witness,
+        )
+
+    def _cache_block(self, block_hash: UInt256, block: Block) -> None:
+        self._block_cache[block_hash] = block
+        self._block_cache.move_to_end(block_hash)
+        while len(self._block_cache) > self.BLOCK_CACHE_SIZE:
+            self._block_cache.popitem(last=False)
+
+    def _load_trimmed_block(self, block_hash: UInt256) -> Any | None:
+        from neo.native.native_contract import NativeContract
+        from neo.persistence.data_cache import DataCache
+
+        ledger = cast(
+            "LedgerContract | None", NativeContract.get_contract_by_name("LedgerContract")
+        )
+        if ledger is None:
+            return None
+        return ledger.get_trimmed_block(DataCache(self._store), block_hash)
+
+    def _load_block(self, block_hash: UInt256) -> Block | None:
+        """Rebuild a persisted block from LedgerContract storage."""
+        from neo.native.native_contract import NativeContract
+        from neo.network.payloads.block import Block
+        from neo.persistence.data_cache import DataCache
+
+        ledger = cast(
+            "LedgerContract | None", NativeContract.get_contract_by_name("LedgerContract")
+        )
+        if ledger is None:
+            return None
+        snapshot = DataCache(self._store)
+        trimmed = ledger.get_trimmed_block(snapshot, block_hash)
+        if trimmed is None:
+            return None
+        transactions = []
+        for tx_hash in trimmed.hashes:
+            state = ledger.get_transaction_state(snapshot, UInt256(tx_hash))
+            if state is None or state.transaction is None:
+                return None
+            transactions.append(state.transaction)
+        header = trimmed.header
+        return Block(
+            version=header.version,
+            prev_hash=header.prev_hash,
+            merkle_root=header.merkle_root,
+            timestamp=header.timestamp,
+            nonce=header.nonce,
+            index=header.index,
+            primary_index=header.primary_index,
+            next_consensus=header.next_consensus,
+            witness=header.witness,
+            transactions=transactions,
+        )
     
     def persist(self, block: Block) -> list[ApplicationExecuted]:
-        """Persist a block to the blockchain."""
+        """Persist a block to the blockchain.
+
+        Returns one ApplicationExecuted for OnPersist, one per transaction
+        and one for PostPersist. A faulting transaction only discards its
+        own changes; a faulting OnPersist or PostPersist aborts the block
+        without touching the store. Phase timings are kept in
+        ``last_timings``.
+        """
+        from neo.exceptions import InvalidOperationException
+        from neo.native.native_contract import NativeContract
+        from neo.persistence.data_cache import DataCache
+        from neo.smartcontract.trigger import TriggerType
+
         with self._lock:
             # Validate block index continuity
             if block.index != self.height + 1:
@@ -90,10 +269,68 @@ class Blockchain:
                     f"Block index {block.index} does not follow current height {self.height}"
                 )
 
-            results: list[ApplicationExecuted] = []
+            timings = PersistTimings()
+            snapshot = DataCache(self._store)
+            snapshot.persisting_block = block  # type: ignore[attr-defined]
 
-            # Cache the block
-            self._block_cache[block.hash] = block
+            start = perf_counter()
+            on_persist = self._execute(
+                TriggerType.SYSTEM,
+                snapshot,
+                block,
+                _system_script("System.Contract.NativeOnPersist"),
+                0,
+            )
+            timings.on_persist = perf_counter() - start
+            if on_persist.state.name != "HALT":
+                raise InvalidOperationException(f"OnPersist failed for block {block.index}")
+            results = [ApplicationExecuted.from_engine(on_persist, "OnPersist")]
+
+            ledger = cast(
+                "LedgerContract | None", NativeContract.get_contract_by_name("LedgerContract")
+            )
+            cloned = self._clone(snapshot, block)
+            for tx in block.transactions:
+                start = perf_counter()
+                engine = self._execute(
+                    TriggerType.APPLICATION, cloned, tx, tx.script, tx.system_fee
+                )
+                if engine.state.name == "HALT":
+                    cloned.commit()
+                else:
+                    cloned = self._clone(snapshot, block)
+                if ledger is not None:
+                    ledger.set_transaction_vm_state(snapshot, tx.hash, int(engine.state))
+                timings.transactions.append(perf_counter() - start)
+                results.append(ApplicationExecuted.from_engine(engine, "Application", tx.hash))
+
+            start = perf_counter()
+            post_persist = self._execute(
+                TriggerType.SYSTEM,
+                snapshot,
+                block,
+                _system_script("System.Contract.NativePostPersist"),
+                0,
+            )
+            timings.post_persist = perf_counter() - start
+            if post_persist.state.name != "HALT":
+                raise InvalidOperationException(f"PostPersist failed for block {block.index}")
+            results.append(ApplicationExecuted.from_engine(post_persist, "PostPersist"))
+
+            # Fire persist callbacks
+            for callback in self._on_persist:
+                callback(block)
+
+            start = perf_counter()
+            snapshot.commit()
+            timings.commit = perf_counter() - start
+            self.last_timings = timings
+
+            # Index and cache the block
+            self._block_hashes.append(block.hash)
+            self._block_indices[block.hash] = block.index
+            self._cache_block(block.hash, block)
+            self._recent_headers.append(self._header_of(block))
 
             # Update current block
             self._current_block = block
@@ -102,15 +339,43 @@ class Blockchain:
             if block.index == 0:
                 self._genesis_block = block
 
-            # Fire persist callbacks
-            for callback in self._on_persist:
-                callback(block)
-
             # Fire committed callbacks
             for callback in self._on_committed:
                 callback(block)
 
             return results
+
+    @staticmethod
+    def _clone(snapshot: DataCache, block: Block) -> DataCache:
+        from neo.persistence.data_cache import ClonedCache
+
+        cloned = ClonedCache(snapshot)
+        cloned.persisting_block = block  # type: ignore[attr-defined]
+        return cloned
+
+    def _execute(
+        self, trigger: Any, snapshot: DataCache, container: Any, script: bytes, gas_limit: int
+    ) -> ApplicationEngine:
+        """Run ``script`` in a fresh engine; out-of-gas ends in FAULT."""
+        from neo.exceptions import OutOfGasException
+        from neo.smartcontract.application_engine import ApplicationEngine
+        from neo.vm.execution_engine import VMState
+
+        engine = ApplicationEngine(
+            trigger=trigger,
+            gas_limit=gas_limit,
+            snapshot=snapshot,  # type: ignore[arg-type]
+            script_container=container,
+            network=self._protocol_settings.network,
+            protocol_settings=self._protocol_settings,
+        )
+        engine.persisting_block = snapshot.persisting_block  # type: ignore[attr-defined]
+        engine.load_script(script)
+        try:
+            engine.execute()
+        except OutOfGasException:
+            engine.state = VMState.FAULT
+        return engine
     
     def on_persist(self, callback: Callable[[Block], None]) -> None:
         """Register persist callback."""
@@ -119,3 +384,26 @@ class Blockchain:
     def on_committed(self, callback: Callable[[Block], None]) -> None:
         """Register committed callback."""
         self._on_committed.append(callback)
+
+    def attach_mempool(self, pool: MemoryPool) -> None:
+        """Update ``pool`` after every committed block.
+
+        Mirrors the C# Blockchain actor calling
+        MemoryPool.UpdatePoolForBlockPersisted on PersistCompleted: the
+        pool drops what the block settled and re-verifies the rest
+        against the committed store.
+        """
+        from neo.persistence.data_cache import DataCache
+
+        def update(block: Block) -> None:
+            pool.update_pool_for_block_persisted(block, DataCache(self._store))
+
+        self.on_committed(update)
+
+
+@cache
+def _system_script(name: str) -> bytes:
+    from neo.smartcontract.interop_service import get_interop_hash
+    from neo.vm.script_builder import ScriptBuilder
+
+    return ScriptBuilder().emit_syscall(get_interop_hash(name)).to_array()
@@ -6,36 +6,142 @@ Reference: Neo.Ledger.MemoryPool
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from heapq import heapify, heappop, heappush, nlargest
 from threading import RLock
-from typing import TYPE_CHECKING
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 from neo.ledger.pool_item import PoolItem
+from neo.ledger.tx_removal_reason import TransactionRemovalReason
+from neo.ledger.tx_verification_context import TransactionVerificationContext
 from neo.ledger.verify_result import VerifyResult
 from neo.types.uint256 import UInt256
 
 if TYPE_CHECKING:
     from neo.network.payloads.transaction import Transaction
 
+
+_Entry = tuple[tuple[bool, int, int, int], UInt256]
+
+
+class _SortedPool:
+    """Pool items by hash, plus a min-heap of ``(priority, hash)`` entries.
+
+    ``_entries`` maps each pooled hash to its live heap entry. Removing an
+    item only drops that mapping; the stale heap slot is discarded when it
+    reaches the top, or all at once when stale slots outnumber live ones.
+    """
+
+    __slots__ = ("_entries", "_heap", "items")
+
+    def __init__(self) -> None:
+        self.items: dict[UInt256, PoolItem] = {}
+        self._entries: dict[UInt256, _Entry] = {}
+        self._heap: list[_Entry] = []
+
+    def add(self, item: PoolItem) -> None:
+        tx_hash = item.tx.hash
+        entry = (item.priority, tx_hash)
+        self.items[tx_hash] = item
+        self._entries[tx_hash] = entry
+        heappush(self._heap, entry)
+
+    def absorb(self, other: _SortedPool) -> None:
+        """Move every item of ``other`` into this pool."""
+        self.items.update(other.items)
+        self._entries.update(other._entries)
+        self._heap = list(self._entries.values())
+        heapify(self._heap)
+        other.clear()
+
+    def pop(self, tx_hash: UInt256) -> PoolItem | None:
+        item = self.items.pop(tx_hash, None)
+        if item is not None:
+            del self._entries[tx_hash]
+            if len(self._heap) > 2 * len(self._entries) + 16:
+                self._heap = list(self._entries.values())
+                heapify(self._heap)
+        return item
+
+    def lowest(self) -> PoolItem | None:
+        heap = self._heap
+        entries = self._entries
+        while heap and entries.get(heap[0][1]) is not heap[0]:
+            heappop(heap)
+        return self.items[heap[0][1]] if heap else None
+
+    def descending(self, limit: int | None = None) -> list[PoolItem]:
+        """Up to ``limit`` items, highest priority first."""
+        entries = self._entries.values()
+        if limit is None:
+            ordered = sorted(entries, reverse=True)
+        else:
+            ordered = nlargest(limit, entries)
+        items = self.items
+        return [items[tx_hash] for _priority, tx_hash in ordered]
+
+    def clear(self) -> None:
+        self.items.clear()
+        self._entries.clear()
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, tx_hash: object) -> bool:
+        return tx_hash in self.items
+
+
 class MemoryPool:
-    """Cache for verified transactions before block inclusion."""
+    """Cache for verified transactions before block inclusion.
+
+    Verified and unverified transactions are each kept in priority order
+    (see :meth:`PoolItem.priority_of`). When the pool is full a new
+    transaction displaces the lowest-priority one, or is rejected with
+    ``OUT_OF_MEMORY`` if nothing in the pool ranks below it.
+    """
     
     DEFAULT_CAPACITY = 50_000
+
+    # Re-verification budget spent after each persisted block; the rest of
+    # the unverified transactions wait for later calls.
+    MAX_REVERIFY_PER_BLOCK = 512
+    REVERIFY_SECONDS_PER_BLOCK = 1.0
     
-    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        on_removed: Callable[[Transaction, TransactionRemovalReason], Any] | None = None,
+        verifier: Any = None,
+    ) -> None:
         self._capacity = capacity
         self._lock = RLock()
+        self._on_removed = on_removed
+        if verifier is None:
+            from neo.ledger.transaction_verifier import TransactionVerifier
+
+            verifier = TransactionVerifier
+        self._verifier = verifier
         
         # Verified transactions
-        self._verified: dict[UInt256, PoolItem] = {}
+        self._verified = _SortedPool()
         
         # Unverified transactions (valid in prior block)
-        self._unverified: dict[UInt256, PoolItem] = {}
+        self._unverified = _SortedPool()
+
+        # Fees committed per sender by verified transactions
+        self._context = TransactionVerificationContext()
     
     @property
     def capacity(self) -> int:
         """Maximum pool capacity."""
         return self._capacity
+
+    @property
+    def verification_context(self) -> TransactionVerificationContext:
+        """Per-sender fee totals of the verified transactions."""
+        return self._context
     
     @property
     def count(self) -> int:
@@ -63,63 +169,193 @@ class MemoryPool:
     def try_get(self, tx_hash: UInt256) -> Transaction | None:
         """Get transaction by hash."""
         with self._lock:
-            if tx_hash in self._verified:
-                return self._verified[tx_hash].tx
-            if tx_hash in self._unverified:
-                return self._unverified[tx_hash].tx
-            return None
+            item = self._verified.items.get(tx_hash) or self._unverified.items.get(tx_hash)
+            return item.tx if item is not None else None
     
     def get_verified_transactions(self) -> list[Transaction]:
-        """Get all verified transactions."""
+        """Get all verified transactions, highest priority first."""
+        return self.get_sorted_verified_transactions()
+
+    def get_sorted_verified_transactions(self, limit: int | None = None) -> list[Transaction]:
+        """Get up to ``limit`` verified transactions, highest priority first."""
         with self._lock:
-            return [item.tx for item in self._verified.values()]
+            return [item.tx for item in self._verified.descending(limit)]
     
-    def try_add(self, tx: Transaction) -> VerifyResult:
-        """Try to add a transaction to the pool."""
+    def try_add(self, tx: Transaction, snapshot: Any | None = None) -> VerifyResult:
+        """Try to add a transaction to the pool.
+
+        With a ``snapshot`` the sender must hold enough GAS to cover this
+        transaction on top of the fees of its other verified transactions.
+        """
         with self._lock:
             tx_hash = tx.hash
             
             # Check if already in pool
-            if tx_hash in self._verified:
-                return VerifyResult.ALREADY_IN_POOL
-            if tx_hash in self._unverified:
+            if tx_hash in self._verified or tx_hash in self._unverified:
                 return VerifyResult.ALREADY_IN_POOL
+
+            if snapshot is not None and not self._context.check_transaction(tx, snapshot):
+                return VerifyResult.INSUFFICIENT_FUNDS
+
+            item = PoolItem(tx)
             
             # Check capacity
-            if len(self._verified) >= self._capacity:
-                return VerifyResult.OUT_OF_MEMORY
+            if self.count >= self._capacity:
+                lowest = self._lowest()
+                if lowest is None or lowest[1].priority >= item.priority:
+                    return VerifyResult.OUT_OF_MEMORY
             
             # Add to verified pool
-            self._verified[tx_hash] = PoolItem(tx)
+            self._verified.add(item)
+            self._context.add_transaction(tx)
+
+            while self.count > self._capacity:
+                pool, evicted = self._lowest()  # type: ignore[misc]
+                self._remove_from(pool, evicted.tx.hash, TransactionRemovalReason.CAPACITY_EXCEEDED)
             return VerifyResult.SUCCEED
+
+    def _lowest(self) -> tuple[_SortedPool, PoolItem] | None:
+        """The lowest-priority item across both pools, with its pool."""
+        verified = self._verified.lowest()
+        unverified = self._unverified.lowest()
+        if unverified is not None and (
+            verified is None or unverified.priority <= verified.priority
+        ):
+            return self._unverified, unverified
+        if verified is not None:
+            return self._verified, verified
+        return None
+
+    def _remove_from(
+        self,
+        pool: _SortedPool,
+        tx_hash: UInt256,
+        reason: TransactionRemovalReason | None = None,
+    ) -> PoolItem | None:
+        item = pool.pop(tx_hash)
+        if item is None:
+            return None
+        if pool is self._verified:
+            self._context.remove_transaction(item.tx)
+        if reason is not None and self._on_removed is not None:
+            self._on_removed(item.tx, reason)
+        return item
     
     def remove(self, tx_hash: UInt256) -> bool:
         """Remove a transaction from the pool."""
         with self._lock:
-            if tx_hash in self._verified:
-                del self._verified[tx_hash]
-                return True
-            if tx_hash in self._unverified:
-                del self._unverified[tx_hash]
-                return True
-            return False
+            return (
+                self._remove_from(self._verified, tx_hash) is not None
+                or self._remove_from(self._unverified, tx_hash) is not None
+            )
     
     def invalidate_verified_transactions(self) -> None:
         """Move all verified transactions to unverified."""
         with self._lock:
-            self._unverified.update(self._verified)
-            self._verified.clear()
+            self._unverified.absorb(self._verified)
+            self._context.clear()
     
+    def update_pool_for_block_persisted(
+        self,
+        block: Any,
+        snapshot: Any,
+        max_count: int | None = None,
+        time_budget: float | None = None,
+    ) -> int:
+        """Drop what ``block`` settled, then re-verify the best of the rest.
+
+        Mirrors C# MemoryPool.UpdatePoolForBlockPersisted: transactions
+        included in the block leave the pool, as do pooled transactions
+        that conflict with it. Everything else becomes unverified and the
+        highest-priority part of it is re-verified within the budget.
+        Returns the number of transactions re-verified.
+        """
+        with self._lock:
+            persisted: set[UInt256] = set()
+            conflicts: dict[UInt256, set[bytes]] = {}
+            for tx in block.transactions:
+                persisted.add(tx.hash)
+                if self._remove_from(self._verified, tx.hash) is None:
+                    self._remove_from(self._unverified, tx.hash)
+                accounts = {signer.account.data for signer in tx.signers}
+                for conflict in _conflict_hashes(tx):
+                    conflicts.setdefault(conflict, set()).update(accounts)
+
+            if conflicts or persisted:
+                for pool in (self._verified, self._unverified):
+                    stale = [
+                        tx_hash
+                        for tx_hash, item in pool.items.items()
+                        if _conflicts_with(item.tx, conflicts, persisted)
+                    ]
+                    for tx_hash in stale:
+                        self._remove_from(pool, tx_hash, TransactionRemovalReason.CONFLICT)
+
+            self.invalidate_verified_transactions()
+            return self.reverify_top_unverified(
+                snapshot,
+                block.index,
+                self.MAX_REVERIFY_PER_BLOCK if max_count is None else max_count,
+                self.REVERIFY_SECONDS_PER_BLOCK if time_budget is None else time_budget,
+            )
+
+    def reverify_top_unverified(
+        self,
+        snapshot: Any,
+        block_height: int,
+        max_count: int,
+        time_budget: float | None = None,
+    ) -> int:
+        """Re-verify up to ``max_count`` unverified transactions, best first.
+
+        State-independent results are computed once per pool item; only the
+        state-dependent checks run again. Valid transactions move back to
+        the verified pool, the rest are removed. Stops early once
+        ``time_budget`` seconds have elapsed. Returns the number moved.
+        """
+        deadline = None if time_budget is None else perf_counter() + time_budget
+        verifier = self._verifier
+        moved = 0
+        with self._lock:
+            for item in self._unverified.descending(max_count):
+                if deadline is not None and perf_counter() >= deadline:
+                    break
+                tx = item.tx
+                if item.state_independent is None:
+                    item.state_independent = verifier.verify_state_independent(tx)
+                result = item.state_independent
+                if result == VerifyResult.SUCCEED:
+                    result = verifier.verify_state_dependent(tx, snapshot, block_height)
+                if result == VerifyResult.SUCCEED and not self._context.check_transaction(
+                    tx, snapshot
+                ):
+                    result = VerifyResult.INSUFFICIENT_FUNDS
+
+                self._unverified.pop(tx.hash)
+                if result == VerifyResult.SUCCEED:
+                    self._verified.add(item)
+                    self._context.add_transaction(tx)
+                    moved += 1
+                elif self._on_removed is not None:
+                    self._on_removed(
+                        tx,
+                        TransactionRemovalReason.EXPIRED
+                        if result == VerifyResult.EXPIRED
+                        else TransactionRemovalReason.INVALID,
+                    )
+        return moved
+
     def clear(self) -> None:
         """Clear all transactions from the pool."""
         with self._lock:
             self._verified.clear()
             self._unverified.clear()
+            self._context.clear()
     
     def __iter__(self) -> Iterator[Transaction]:
         """Iterate over all transactions."""
         with self._lock:
-            items = list(self._verified.values()) + list(self._unverified.values())
+            items = list(self._verified.items.values()) + list(self._unverified.items.values())
         for item in items:
             yield item.tx
     
@@ -130,3 +366,30 @@ class MemoryPool:
     def __contains__(self, tx_hash: UInt256) -> bool:
         """Check if hash in pool."""
         return self.contains_key(tx_hash)
+
+
+def _conflict_hashes(tx: Transaction) -> Iterator[UInt256]:
+    from neo.network.payloads.transaction_attribute import TransactionAttributeType
+
+    for attr in tx.attributes:
+        if int(getattr(attr, "type", -1)) != TransactionAttributeType.CONFLICTS:
+            continue
+        value = getattr(attr, "hash", None)
+        if value is not None:
+            yield value if isinstance(value, UInt256) else UInt256(bytes(value))
+
+
+def _conflicts_with(
+    tx: Transaction, conflicts: dict[UInt256, set[bytes]], persisted: set[UInt256]
+) -> bool:
+    """Whether pooled ``tx`` is invalidated by a persisted block.
+
+    Either a block transaction sharing a signer declared ``tx`` as a
+    conflict, or ``tx`` declares a conflict with a block transaction.
+    """
+    accounts = conflicts.get(tx.hash)
+    if accounts and any(
+        signer.account is not None and signer.account.data in accounts for signer in tx.signers
+    ):
+        return True
+    return any(conflict in persisted for conflict in _conflict_hashes(tx))
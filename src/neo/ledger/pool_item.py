@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from neo.ledger.verify_result import VerifyResult
     from neo.network.payloads.transaction import Transaction
 
 
@@ -25,3 +26,34 @@ class PoolItem:
     
     last_broadcast: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     """Timestamp when last broadcast to other nodes."""
+
+    priority: tuple[bool, int, int, int] = field(init=False, repr=False, compare=False)
+    """Ascending sort key; higher values are mined first and evicted last."""
+
+    state_independent: "VerifyResult | None" = field(default=None, repr=False, compare=False)
+    """Cached state-independent verification result, reused on re-verification."""
+
+    def __post_init__(self) -> None:
+        self.priority = self.priority_of(self.tx)
+
+    @staticmethod
+    def priority_of(tx: "Transaction") -> tuple[bool, int, int, int]:
+        """Sort key mirroring C# PoolItem.CompareTo.
+
+        HighPriority transactions first, then fee per byte, then network
+        fee, then the lower hash (hashes compare descending).
+        """
+        from neo.network.payloads.transaction_attribute import TransactionAttributeType
+
+        high_priority = any(
+            int(getattr(attr, "type", -1)) == TransactionAttributeType.HIGH_PRIORITY
+            for attr in tx.attributes
+        )
+        size = tx.size
+        fee_per_byte = tx.network_fee // size if size else 0
+        return (
+            high_priority,
+            fee_per_byte,
+            tx.network_fee,
+            -int.from_bytes(tx.hash.data, "little"),
+        )
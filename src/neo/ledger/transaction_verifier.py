@@ -6,7 +6,7 @@ Reference: Neo.Ledger.TransactionVerifier
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from neo.ledger.verify_result import VerifyResult
 
@@ -185,17 +185,20 @@ class TransactionVerifier:
 
         # Each witness must verify against its signer
         for i, (signer, witness) in enumerate(zip(tx.signers, tx.witnesses)):
-            if not TransactionVerifier._verify_witness(tx, signer, witness, snapshot):
+            if not TransactionVerifier.verify_witness(tx, signer.account, witness, snapshot):
                 return VerifyResult.INVALID
 
         return VerifyResult.SUCCEED
 
     @staticmethod
-    def _verify_witness(tx: Transaction, signer, witness, snapshot: Snapshot) -> bool:
+    def verify_witness(container: Any, account: Any, witness, snapshot: Snapshot | None) -> bool:
         """Verify a single witness by executing its scripts in the VM.
 
+        ``container`` is the signed payload (a transaction or a block
+        header) and ``account`` the script hash the witness must belong to.
+
         Neo N3 witness verification:
-        1. Hash the verification script and confirm it matches the signer account.
+        1. Hash the verification script and confirm it matches ``account``.
         2. Load the verification script first, then the invocation script on top.
         3. Execute — invocation runs first (pushes signatures), then verification
            consumes them and must leave ``True`` on the stack.
@@ -208,11 +211,13 @@ class TransactionVerifier:
         if verification:
             # Standard account — hash must match signer
             script_hash = hash160(verification)
-            if script_hash != bytes(signer.account):
+            if script_hash != bytes(account):
                 return False
         else:
             # Contract-based verification — fetch script from storage
-            contract = snapshot.get_contract(signer.account)
+            if snapshot is None:
+                return False
+            contract = snapshot.get_contract(account)
             if contract is None:
                 return False
             verification = getattr(contract, "script", b"")
@@ -229,7 +234,7 @@ class TransactionVerifier:
                 trigger=TriggerType.VERIFICATION,
                 gas_limit=50_000_000,  # 0.5 GAS cap for verification
                 snapshot=snapshot,
-                script_container=tx,
+                script_container=container,
             )
 
             # Load verification script first (entry script — executes second)
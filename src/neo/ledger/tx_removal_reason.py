@@ -10,3 +10,5 @@ class TransactionRemovalReason(IntEnum):
     INVALID = 2
     POLICY_VIOLATION = 3
     UNKNOWN = 4
+    CAPACITY_EXCEEDED = 5
+    CONFLICT = 6
@@ -1,9 +1,60 @@
-"""Neo N3 Transaction Verification Context."""
+"""Neo N3 Transaction Verification Context.
+
+Reference: Neo.Ledger.TransactionVerificationContext
+"""
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from neo.network.payloads.transaction import Transaction
+
 
 @dataclass
 class TransactionVerificationContext:
-    """Context for tx verification."""
+    """Tracks the fees each sender has committed to verified pool transactions."""
     sender_fee: dict[bytes, int] = field(default_factory=dict)
+
+    @staticmethod
+    def _fee(tx: Transaction) -> int:
+        return tx.system_fee + tx.network_fee
+
+    def add_transaction(self, tx: Transaction) -> None:
+        """Account for ``tx``'s fees against its sender."""
+        sender = tx.sender
+        self.sender_fee[sender] = self.sender_fee.get(sender, 0) + self._fee(tx)
+
+    def remove_transaction(self, tx: Transaction) -> None:
+        """Release ``tx``'s fees from its sender's total."""
+        sender = tx.sender
+        remaining = self.sender_fee.get(sender, 0) - self._fee(tx)
+        if remaining > 0:
+            self.sender_fee[sender] = remaining
+        else:
+            self.sender_fee.pop(sender, None)
+
+    def check_transaction(
+        self,
+        tx: Transaction,
+        snapshot: Any,
+        conflicting: Iterable[Transaction] = (),
+    ) -> bool:
+        """Whether the sender's GAS covers ``tx`` on top of its pooled fees.
+
+        Fees of ``conflicting`` transactions from the same sender are
+        discounted, since they leave the pool when ``tx`` is accepted.
+        """
+        if not tx.signers:
+            return False
+        sender = tx.sender
+        expected = self.sender_fee.get(sender, 0) + self._fee(tx)
+        for other in conflicting:
+            if other.sender == sender:
+                expected -= self._fee(other)
+        return snapshot.get_gas_balance(tx.signers[0].account) >= expected
+
+    def clear(self) -> None:
+        self.sender_fee.clear()
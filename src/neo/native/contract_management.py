@@ -58,6 +58,18 @@ def _hardfork_enabled(engine: Any, hardfork: Hardfork) -> bool:
         return False
 
 
+def _invalidate_contract_cache(engine: Any, contract_hash: UInt160) -> None:
+    """Tell the engine that a contract's state changed in storage.
+
+    Engines memoize data derived from contract state (manifest groups,
+    witness-check results); they must drop it once the contract is
+    deployed, updated or destroyed.
+    """
+    invalidate = getattr(engine, "invalidate_contract_cache", None)
+    if callable(invalidate):
+        invalidate(contract_hash)
+
+
 def _compute_nef_checksum(nef: Any) -> int:
     """Compute the NEF checksum, mirroring C# ``NefFile.ComputeChecksum``.
 
@@ -451,6 +463,8 @@ class ContractManagement(NativeContract):
         on the deployed contract with ``(data, update)`` and ``CallFlags.All``;
         always emit the ``Deploy`` (first deploy) or ``Update`` notification.
         """
+        if contract.hash is not None:
+            _invalidate_contract_cache(engine, contract.hash)
         if self._manifest_declares_deploy(manifest_obj):
             invoke = getattr(engine, "call_from_native_contract", None)
             if callable(invoke):
@@ -650,6 +664,7 @@ class ContractManagement(NativeContract):
         if not block_before_erase:
             self._block_and_clean(engine, policy, calling_hash, contract)
 
+        _invalidate_contract_cache(engine, calling_hash)
         engine.send_notification(self.hash, "Destroy", [calling_hash])
 
     @staticmethod
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 from abc import abstractmethod
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 from neo.types import UInt160
-from neo.native.native_contract import NativeContract, CallFlags, StorageItem
+from neo.native.native_contract import NativeContract, CallFlags, StorageItem, StorageKey
 
 # Storage prefixes
 PREFIX_TOTAL_SUPPLY = 11
 PREFIX_ACCOUNT = 20
 
+_ACCOUNT_PREFIX = bytes((PREFIX_ACCOUNT,))
+
 @dataclass
 class AccountState:
     """Base account state for fungible tokens."""
@@ -109,16 +112,42 @@ class FungibleToken(NativeContract):
 
     def balance_of(self, snapshot: Any, account: UInt160) -> int:
         """Get the balance of an account."""
-        key = self._create_storage_key(PREFIX_ACCOUNT, account.data)
+        key = self._account_key(account)
         item = snapshot.get(key)
         if item is None:
             return 0
         state = self._get_account_state(item)
         return state.balance
 
+    def _account_key(self, account: UInt160) -> StorageKey:
+        return StorageKey(self._id, _ACCOUNT_PREFIX + account.data)
+
+    def balances_of(self, snapshot: Any, accounts: Sequence[UInt160]) -> list[int]:
+        """Get the balances of many accounts, in the order given.
+
+        Each account is a point lookup, so the cost follows the number of
+        accounts asked for rather than the number of holders; use
+        :meth:`iter_balances` to walk every holder.
+        """
+        balances = []
+        for account in accounts:
+            item = snapshot.get(self._account_key(account))
+            balances.append(0 if item is None else self._get_account_state(item).balance)
+        return balances
+
+    def iter_balances(self, snapshot: Any) -> Iterator[tuple[UInt160, int]]:
+        """Yield ``(account, balance)`` for every holder in storage-key order."""
+        prefix = self._create_storage_key(PREFIX_ACCOUNT)
+        for key, item in snapshot.find(prefix):
+            yield UInt160(bytes(key.key[1:])), self._get_account_state(item).balance
+
     def _get_account_state(self, item: StorageItem) -> AccountState:
-        """Get account state from storage item. Override for custom state."""
-        return AccountState.from_bytes(item.value)
+        """Get the decoded account state held by a storage item.
+
+        The state is cached on the item, so mutations are written back when
+        the item's bytes are next read. Override for custom state.
+        """
+        return item.get_interoperable(AccountState)
 
     def _create_account_state(self) -> AccountState:
         """Create a new account state. Override for custom state."""
@@ -134,14 +163,13 @@ class FungibleToken(NativeContract):
             return
 
         # Update account balance
-        key = self._create_storage_key(PREFIX_ACCOUNT, account.data)
+        key = self._account_key(account)
         item = engine.snapshot.get_and_change(
             key, lambda: StorageItem(self._create_account_state().to_bytes())
         )
         state = self._get_account_state(item)
         self._on_balance_changing(engine, account, state, amount)
         state.balance += amount
-        item.value = state.to_bytes()
 
         # Update total supply
         supply_key = self._create_storage_key(PREFIX_TOTAL_SUPPLY)
@@ -158,7 +186,7 @@ class FungibleToken(NativeContract):
         if amount == 0:
             return
 
-        key = self._create_storage_key(PREFIX_ACCOUNT, account.data)
+        key = self._account_key(account)
         item = engine.snapshot.get_and_change(key)
         if item is None:
             raise ValueError("Insufficient balance")
@@ -173,7 +201,6 @@ class FungibleToken(NativeContract):
             engine.snapshot.delete(key)
         else:
             state.balance -= amount
-            item.value = state.to_bytes()
 
         # Update total supply
         supply_key = self._create_storage_key(PREFIX_TOTAL_SUPPLY)
@@ -195,7 +222,7 @@ class FungibleToken(NativeContract):
             if not engine.check_witness(from_account):
                 return False
 
-        key_from = self._create_storage_key(PREFIX_ACCOUNT, from_account.data)
+        key_from = self._account_key(from_account)
         storage_from = engine.snapshot.get_and_change(key_from)
 
         if amount == 0:
@@ -219,16 +246,14 @@ class FungibleToken(NativeContract):
                     engine.snapshot.delete(key_from)
                 else:
                     state_from.balance -= amount
-                    storage_from.value = state_from.to_bytes()
 
-                key_to = self._create_storage_key(PREFIX_ACCOUNT, to_account.data)
+                key_to = self._account_key(to_account)
                 storage_to = engine.snapshot.get_and_change(
                     key_to, lambda: StorageItem(self._create_account_state().to_bytes())
                 )
                 state_to = self._get_account_state(storage_to)
                 self._on_balance_changing(engine, to_account, state_to, amount)
                 state_to.balance += amount
-                storage_to.value = state_to.to_bytes()
 
         self._post_transfer(engine, from_account, to_account, amount, data, True)
         return True
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from neo.native.fungible_token import FungibleToken
+from neo.types import UInt160
 
 
 class GasToken(FungibleToken):
@@ -61,7 +62,11 @@ class GasToken(FungibleToken):
             # Burn system fee and network fee from sender
             total_fee = tx.system_fee + tx.network_fee
             if total_fee > 0:
-                self.burn(engine, tx.sender, total_fee)
+                sender = tx.sender
+                # Transaction.sender is the raw account bytes.
+                if isinstance(sender, (bytes, bytearray)):
+                    sender = UInt160(bytes(sender))
+                self.burn(engine, sender, total_fee)
             total_network_fee += tx.network_fee
             
             # Handle NotaryAssisted attribute (type 0x22)
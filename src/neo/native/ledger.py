@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -24,6 +27,10 @@ PREFIX_CURRENT_BLOCK = 12
 PREFIX_BLOCK = 5
 PREFIX_TRANSACTION = 11
 
+# Number of decoded TrimmedBlock/TransactionState records kept by the ledger's
+# lookup cache. Entries are validated against the stored bytes on every hit.
+RECORD_CACHE_SIZE = 1024
+
 @dataclass
 class HashIndexState:
     """Current block hash and index."""
@@ -79,6 +86,28 @@ class TransactionState:
             return writer.to_bytes()
         return b""
     
+    @staticmethod
+    def peek(data: bytes) -> tuple[int, bool]:
+        """Return ``(block_index, has_transaction)`` without decoding the transaction.
+
+        ``has_transaction`` is False exactly when :meth:`from_bytes` would
+        leave ``transaction`` as None, i.e. for conflict stubs.
+        """
+        if not data or len(data) < 4:
+            return 0, False
+        block_index = int.from_bytes(data[:4], 'little')
+        if len(data) <= 5:
+            return block_index, False
+        from neo.io.binary_reader import BinaryReader
+
+        reader = BinaryReader(data)
+        reader.skip(5)
+        try:
+            length = reader.read_var_int()
+        except ValueError:
+            return block_index, False
+        return block_index, 0 < length <= reader.remaining
+
     @classmethod
     def from_bytes(cls, data: bytes) -> TransactionState:
         state = cls()
@@ -90,18 +119,19 @@ class TransactionState:
                 from neo.io.binary_reader import BinaryReader
                 from neo.network.payloads.transaction import Transaction
 
+                reader = BinaryReader(data)
+                reader.skip(5)
                 try:
-                    reader = BinaryReader(data[5:])
-                    tx_bytes = reader.read_var_bytes(max_length=len(data) - 5)
+                    tx_view = reader.read_var_view(max_length=len(data) - 5)
                 except Exception:
                     # Backwards compatibility with older storage format.
-                    tx_bytes = b""
-                if tx_bytes:
+                    tx_view = memoryview(b"")
+                if tx_view:
                     try:
-                        tx_reader = BinaryReader(tx_bytes)
+                        tx_reader = BinaryReader(tx_view)
                         state.transaction = Transaction.deserialize(tx_reader)
                     except Exception:
-                        state.transaction = tx_bytes
+                        state.transaction = tx_view.tobytes()
         return state
 
 @dataclass
@@ -146,11 +176,13 @@ class TrimmedBlock:
         return cls(header=header, hashes=hashes)
 
     def to_bytes(self) -> bytes:
-        from neo.io.binary_writer import BinaryWriter
+        from neo.io.binary_writer import BinaryWriter, get_var_size
 
-        writer = BinaryWriter()
-        self.header.serialize(writer)
-        writer.write_var_int(len(self.hashes))
+        header = self.header.to_bytes()
+        count = len(self.hashes)
+        writer = BinaryWriter.sized(len(header) + get_var_size(count) + 32 * count)
+        writer.write_bytes(header)
+        writer.write_var_int(count)
         for h in self.hashes:
             writer.write_bytes(h)
         return writer.to_bytes()
@@ -160,7 +192,7 @@ class TrimmedBlock:
         from neo.io.binary_reader import BinaryReader
         from neo.network.payloads.header import Header
 
-        reader = BinaryReader(bytes(data))
+        reader = BinaryReader(data)
         header = Header.deserialize(reader)
         count = reader.read_var_int(0xFFFF)
         hashes = [reader.read_bytes(32) for _ in range(count)]
@@ -210,6 +242,16 @@ class LedgerContract(NativeContract):
     
     Stores blocks and transactions, provides query methods.
     """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Decoded records keyed by storage key, each paired with the stored
+        # bytes it was decoded from so a rewritten value is never served.
+        self._records: OrderedDict[Any, tuple[bytes, Any]] = OrderedDict()
+        # (current index, MaxTraceableBlocks) resolved once per engine.
+        self._trace_windows: weakref.WeakKeyDictionary[Any, tuple[int, int]] = (
+            weakref.WeakKeyDictionary()
+        )
     
     @property
     def name(self) -> str:
@@ -282,11 +324,39 @@ class LedgerContract(NativeContract):
         get_transaction_height, get_transaction_vm_state or get_transaction_signers.
         """
         key = self._create_storage_key(PREFIX_TRANSACTION, hash.data)
+        state = self._read_record(snapshot, key, TransactionState.from_bytes)
+        return state if state is not None and state.transaction is not None else None
+
+    def _read_record(
+        self, snapshot: Any, key: Any, decode: Callable[[bytes], Any]
+    ) -> Any | None:
+        """Read and decode the record at ``key`` through the lookup cache.
+
+        A cached record is returned only while the stored value is still the
+        one it was decoded from. Cached records are shared between callers
+        and must not be mutated.
+        """
         item = snapshot.get(key)
         if item is None:
             return None
-        state = TransactionState.from_bytes(item.value)
-        return state if state.transaction is not None else None
+        value = getattr(item, "value", item)
+        if value is None:
+            return None
+        records = self._records
+        cached = records.get(key)
+        if cached is not None and (cached[0] is value or cached[0] == value):
+            try:
+                records.move_to_end(key)
+            except KeyError:
+                pass
+            return cached[1]
+        if not isinstance(value, bytes):
+            value = bytes(value)
+        record = decode(value)
+        records[key] = (value, record)
+        if len(records) > RECORD_CACHE_SIZE:
+            records.popitem(last=False)
+        return record
     
     def _max_traceable_blocks(self, engine: Any) -> int:
         """Resolve the MaxTraceableBlocks value for the current engine state.
@@ -318,10 +388,26 @@ class LedgerContract(NativeContract):
         the block must not be in the future and must be within MaxTraceableBlocks
         of the current chain height.
         """
-        current_index = self.current_index(engine.snapshot)
+        current_index, max_traceable_blocks = self._trace_window(engine)
         if index > current_index:
             return False
-        return index + self._max_traceable_blocks(engine) > current_index
+        return index + max_traceable_blocks > current_index
+
+    def _trace_window(self, engine: Any) -> tuple[int, int]:
+        """Return ``(current_index, max_traceable_blocks)`` for ``engine``.
+
+        Resolved once per engine; ``post_persist`` and Policy's
+        setMaxTraceableBlocks drop it through :meth:`invalidate_trace_window`.
+        """
+        return self._per_snapshot(
+            self._trace_windows,
+            engine,
+            lambda: (self.current_index(engine.snapshot), self._max_traceable_blocks(engine)),
+        )
+
+    def invalidate_trace_window(self, engine: Any) -> None:
+        """Forget the traceability window cached for ``engine``."""
+        self._drop_snapshot(self._trace_windows, engine)
 
     @staticmethod
     def _item_bytes(item: Any) -> bytes | None:
@@ -348,10 +434,7 @@ class LedgerContract(NativeContract):
         be within ``max_traceable_blocks`` of the current chain height. Unlike the
         engine overload the MaxTraceableBlocks value is supplied by the caller.
         """
-        current_index = self.current_index(snapshot)
-        if index > current_index:
-            return False
-        return index + max_traceable_blocks > current_index
+        return self._in_window(index, self.current_index(snapshot), max_traceable_blocks)
 
     def contains_conflict_hash(
         self,
@@ -371,14 +454,16 @@ class LedgerContract(NativeContract):
         """
         hash_bytes = hash.data if hasattr(hash, "data") else bytes(hash)
 
-        # Check the dummy stub first to decide whether any conflict record exists.
+        # Only the block index and the presence of a transaction are needed, so
+        # the records are peeked at rather than decoded.
         stub_key = self._create_storage_key(PREFIX_TRANSACTION, hash_bytes)
         stub_value = self._item_bytes(snapshot.get(stub_key))
         if stub_value is None:
             return False
-        stub = TransactionState.from_bytes(stub_value)
-        if stub.transaction is not None or not self._is_traceable_block_snapshot(
-            snapshot, stub.block_index, max_traceable_blocks
+        block_index, has_transaction = TransactionState.peek(stub_value)
+        current_index = self.current_index(snapshot)
+        if has_transaction or not self._in_window(
+            block_index, current_index, max_traceable_blocks
         ):
             return False
 
@@ -392,24 +477,23 @@ class LedgerContract(NativeContract):
             state_value = self._item_bytes(snapshot.get(signer_key))
             if state_value is None:
                 continue
-            state = TransactionState.from_bytes(state_value)
-            if self._is_traceable_block_snapshot(
-                snapshot, state.block_index, max_traceable_blocks
-            ):
+            block_index, _ = TransactionState.peek(state_value)
+            if self._in_window(block_index, current_index, max_traceable_blocks):
                 return True
 
         return False
 
+    @staticmethod
+    def _in_window(index: int, current_index: int, max_traceable_blocks: int) -> bool:
+        return current_index >= index and index + max_traceable_blocks > current_index
+
     def get_trimmed_block(self, snapshot: Any, hash: UInt256) -> TrimmedBlock | None:
         """Read the stored TrimmedBlock for a block hash (no traceability gate).
 
         Mirrors C# LedgerContract.GetTrimmedBlock (LedgerContract.cs:240-248).
         """
         key = self._create_storage_key(PREFIX_BLOCK, hash.data)
-        item = snapshot.get(key)
-        if item is None:
-            return None
-        return TrimmedBlock.from_bytes(item.value)
+        return self._read_record(snapshot, key, TrimmedBlock.from_bytes)
 
     def get_block(self, engine: Any, index_or_hash: bytes) -> TrimmedBlock | None:
         """Get a block by index or hash.
@@ -459,6 +543,20 @@ class LedgerContract(NativeContract):
         if state is None or not self._is_traceable_block(engine, state.block_index):
             return 0  # NONE
         return state.state
+
+    def set_transaction_vm_state(self, snapshot: Any, hash: UInt256, vm_state: int) -> None:
+        """Record a transaction's execution result on its stored state.
+
+        Mirrors ``transactionState.State = engine.Execute()`` in C#
+        Blockchain.Persist: OnPersist stores the state as NONE and the
+        persist loop fills it in. Only the state byte of the record changes.
+        """
+        key = self._create_storage_key(PREFIX_TRANSACTION, hash.data)
+        item = snapshot.get_and_change(key)
+        if item is None:
+            return
+        data = item.value
+        item.value = data[:4] + bytes([vm_state]) + data[5:]
     
     def get_transaction_from_block(
         self, engine: Any, block_index_or_hash: bytes, tx_index: int
@@ -570,3 +668,4 @@ class LedgerContract(NativeContract):
         state = HashIndexState(hash=block.hash, index=block.index)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.value = state.to_bytes()
+        self.invalidate_trace_window(engine)
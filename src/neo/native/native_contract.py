@@ -7,15 +7,19 @@ import dataclasses
 import inspect
 import json
 import types
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import IntFlag
-from typing import Any, Union, get_args, get_origin
+from typing import Any, TypeVar, Union, get_args, get_origin
 
 from neo.crypto import hash160
+from neo.smartcontract.storage.storage_key import StorageKey
 from neo.types import UInt160
 
+_T = TypeVar("_T")
+_I = TypeVar("_I")
 
 class CallFlags(IntFlag):
     """Call flags for contract methods."""
@@ -82,66 +86,77 @@ class ContractEventMetadata:
     active_in: Any = None
     deprecated_in: Any = None
 
-class StorageKey:
-    """Storage key for native contracts."""
-    
-    def __init__(self, contract_id: int, key: bytes) -> None:
-        self.id = contract_id
-        self.key = key
-    
-    @classmethod
-    def create(cls, contract_id: int, prefix: int, *args) -> StorageKey:
-        """Create a storage key with prefix and optional data."""
-        key_data = bytes([prefix])
-        for arg in args:
-            if isinstance(arg, int):
-                key_data += arg.to_bytes(4, 'little')
-            elif isinstance(arg, bytes):
-                key_data += arg
-            elif isinstance(arg, UInt160):
-                key_data += arg.data
-        return cls(contract_id, key_data)
-    
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, StorageKey):
-            return self.id == other.id and self.key == other.key
-        return False
-    
-    def __hash__(self) -> int:
-        return hash((self.id, self.key))
-
 class StorageItem:
-    """Storage item for native contracts."""
-    
+    """Storage item for native contracts.
+
+    Like C# StorageItem, an item can carry a decoded value alongside its
+    bytes: :meth:`get_interoperable` decodes a record once and keeps it on
+    the item, and integer helpers keep the decoded integer. Callers mutate
+    the cached value in place; the bytes are re-encoded only when
+    :attr:`value` is next read (typically when the snapshot is committed),
+    so repeated updates within a snapshot pay for a single encoding.
+    """
+
     def __init__(self, value: bytes = b"") -> None:
-        self._value = value
-    
+        self._value: bytes | None = value
+        self._cache: Any = None
+
     @property
     def value(self) -> bytes:
+        if self._value is None:
+            cache = self._cache
+            if isinstance(cache, int):
+                self._value = self._encode_int(cache)
+            else:
+                self._value = cache.to_bytes()
         return self._value
-    
+
     @value.setter
     def value(self, val: bytes) -> None:
         self._value = val
-    
+        self._cache = None
+
+    def get_interoperable(self, state_type: type[_T]) -> _T:
+        """Return the decoded ``state_type`` record held by this item.
+
+        Mirrors C# StorageItem.GetInteroperable<T>: the record is decoded
+        from the stored bytes on first use and the same instance is returned
+        afterwards. Since the caller may mutate it, the bytes are treated as
+        stale and re-encoded from the record on the next :attr:`value` read.
+        """
+        cache = self._cache
+        if type(cache) is not state_type:
+            cache = state_type.from_bytes(self.value)  # type: ignore[attr-defined]
+            self._cache = cache
+        self._value = None
+        return cache
+
+    @staticmethod
+    def _encode_int(value: int) -> bytes:
+        return value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True) if value else b'\x00'
+
     def set(self, value: Any) -> None:
         """Set the value."""
         if isinstance(value, int):
-            self._value = value.to_bytes((value.bit_length() + 8) // 8, 'little', signed=True) if value else b'\x00'
+            self._cache = value
+            self._value = None
         elif isinstance(value, bytes):
-            self._value = value
+            self.value = value
         else:
-            self._value = bytes(value)
-    
+            self.value = bytes(value)
+
     def add(self, value: int) -> None:
         """Add to the current integer value."""
-        current = int.from_bytes(self._value, 'little', signed=True) if self._value else 0
-        self.set(current + value)
-    
+        self.set(int(self) + value)
+
     def __int__(self) -> int:
-        if not self._value:
-            return 0
-        return int.from_bytes(self._value, 'little', signed=True)
+        cache = self._cache
+        if isinstance(cache, int) and not isinstance(cache, bool):
+            return cache
+        data = self.value
+        result = int.from_bytes(data, 'little', signed=True) if data else 0
+        self._cache = result
+        return result
 
 class NativeContract(ABC):
     """Base class for native contracts."""
@@ -444,6 +459,73 @@ class NativeContract(ABC):
             method.descriptor.offset = offset
             self._methods_by_offset[offset] = method
     
+    @staticmethod
+    def _per_snapshot(
+        cache: weakref.WeakKeyDictionary[Any, _I], snapshot: Any, build: Callable[[], _I]
+    ) -> _I:
+        """Return ``cache[snapshot]``, building it on first use.
+
+        Snapshots that cannot be weakly referenced get a fresh value on
+        every call.
+        """
+        try:
+            value = cache.get(snapshot)
+        except TypeError:
+            return build()
+        if value is None:
+            value = build()
+            cache[snapshot] = value
+        return value
+
+    @staticmethod
+    def _peek_snapshot(cache: weakref.WeakKeyDictionary[Any, _I], snapshot: Any) -> _I | None:
+        try:
+            return cache.get(snapshot)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _snapshot_index(
+        cache: weakref.WeakKeyDictionary[Any, tuple[Any, _I]],
+        snapshot: Any,
+        build: Callable[[], _I],
+    ) -> _I:
+        """Like :meth:`_per_snapshot`, for values derived from stored records.
+
+        The value is also rebuilt once a clone commits into ``snapshot`` or
+        one of its parents, since the contract's own writers only keep the
+        copy of the snapshot they ran on up to date.
+        """
+        version = getattr(snapshot, "commit_version", None)
+        try:
+            entry = cache.get(snapshot)
+        except TypeError:
+            return build()
+        if entry is None or entry[0] != version:
+            entry = (version, build())
+            cache[snapshot] = entry
+        return entry[1]
+
+    @staticmethod
+    def _peek_snapshot_index(
+        cache: weakref.WeakKeyDictionary[Any, tuple[Any, _I]], snapshot: Any
+    ) -> _I | None:
+        """The value :meth:`_snapshot_index` would reuse, or None."""
+        try:
+            entry = cache.get(snapshot)
+        except TypeError:
+            return None
+        if entry is None or entry[0] != getattr(snapshot, "commit_version", None):
+            return None
+        return entry[1]
+
+    @staticmethod
+    def _drop_snapshot(cache: weakref.WeakKeyDictionary[Any, Any], snapshot: Any) -> None:
+        try:
+            cache.pop(snapshot, None)
+        except TypeError:
+            pass
+
     def _create_storage_key(self, prefix: int, *args) -> StorageKey:
         """Create a storage key for this contract."""
         return StorageKey.create(self._id, prefix, *args)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from dataclasses import dataclass
+import weakref
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from dataclasses import dataclass, field
 from typing import Any
 
 from neo.crypto import hash160
@@ -95,6 +98,196 @@ class CandidateState:
                 state.votes = int.from_bytes(data[1:33], "little", signed=True)
         return state
 
+@dataclass
+class CachedCommittee:
+    """Committee members and their votes, in votes-descending order.
+
+    Mirrors C# NeoToken.CachedCommittee; stored as a concatenation of
+    33-byte public keys and 32-byte vote counts.
+    """
+
+    members: list[tuple[bytes, int]] = field(default_factory=list)
+
+    def to_bytes(self) -> bytes:
+        data = bytearray()
+        for pubkey, votes in self.members:
+            data += pubkey
+            data += votes.to_bytes(32, "little", signed=True)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> CachedCommittee:
+        members: list[tuple[bytes, int]] = []
+        offset = 0
+        while offset + 33 + 32 <= len(data):
+            pubkey = bytes(data[offset : offset + 33])
+            votes = int.from_bytes(data[offset + 33 : offset + 65], "little", signed=True)
+            members.append((pubkey, votes))
+            offset += 33 + 32
+        return cls(members)
+
+class GasRecordIndex:
+    """Sorted GasPerBlock change points with cumulative GAS prefix sums.
+
+    ``cumulative[i]`` is the sum of gasPerBlock over the blocks before
+    ``indices[i]``, so the sum over any block window is a difference of two
+    :meth:`generated` lookups. This is the
+    closed form of C# CalculateReward (NeoToken.cs:155-180), which walks
+    the records backward from ``end - 1``.
+    """
+
+    __slots__ = ("indices", "values", "cumulative")
+
+    def __init__(self, records: Iterable[tuple[int, int]] = ()) -> None:
+        self.indices: list[int] = []
+        self.values: list[int] = []
+        self.cumulative: list[int] = []
+        for index, value in sorted(records):
+            if self.indices and self.indices[-1] == index:
+                self.values[-1] = value
+            else:
+                self.indices.append(index)
+                self.values.append(value)
+        self._rebuild_from(0)
+
+    def _rebuild_from(self, position: int) -> None:
+        del self.cumulative[position:]
+        for i in range(position, len(self.indices)):
+            if i == 0:
+                self.cumulative.append(0)
+            else:
+                span = self.indices[i] - self.indices[i - 1]
+                self.cumulative.append(self.cumulative[i - 1] + self.values[i - 1] * span)
+
+    def set(self, index: int, value: int) -> None:
+        """Record ``value`` as effective from block ``index``."""
+        position = bisect_right(self.indices, index)
+        if position and self.indices[position - 1] == index:
+            self.values[position - 1] = value
+            self._rebuild_from(position)
+            return
+        self.indices.insert(position, index)
+        self.values.insert(position, value)
+        self._rebuild_from(position)
+
+    def value_at(self, index: int) -> int | None:
+        """Return the gasPerBlock effective at ``index`` (highest record <= index)."""
+        position = bisect_right(self.indices, index)
+        return self.values[position - 1] if position else None
+
+    def generated(self, index: int) -> int:
+        """Sum of gasPerBlock over every block before ``index``."""
+        position = bisect_right(self.indices, index - 1)
+        if not position:
+            return 0
+        i = position - 1
+        return self.cumulative[i] + self.values[i] * (index - self.indices[i])
+
+    def sum_between(self, start: int, end: int) -> int:
+        """Sum of gasPerBlock over blocks ``[start, end)``."""
+        if start >= end:
+            return 0
+        return self.generated(end) - self.generated(start)
+
+@dataclass
+class IndexedCandidate:
+    """A registered candidate's votes with its derived account data."""
+
+    votes: int
+    account: UInt160
+    blocked: bool
+
+
+class CandidateIndex:
+    """Registered candidates ordered by votes and by public key.
+
+    Each entry caches the candidate's signature-contract account hash and
+    whether Policy blocks it, so committee computation walks only the top
+    of the vote order instead of decoding and policy-checking every
+    candidate record.
+    """
+
+    __slots__ = ("_entries", "_by_votes", "_by_key", "_by_account", "_blocked")
+
+    def __init__(self) -> None:
+        self._entries: dict[bytes, IndexedCandidate] = {}
+        self._by_votes: list[tuple[int, bytes]] = []  # (-votes, pubkey)
+        self._by_key: list[bytes] = []
+        self._by_account: dict[UInt160, bytes] = {}
+        self._blocked = 0
+
+    def __len__(self) -> int:
+        """Number of registered candidates that are not blocked."""
+        return len(self._entries) - self._blocked
+
+    def __contains__(self, pubkey: object) -> bool:
+        return pubkey in self._entries
+
+    def add(self, pubkey: bytes, votes: int, account: UInt160, blocked: bool) -> None:
+        """Insert a newly registered candidate."""
+        self._entries[pubkey] = IndexedCandidate(votes, account, blocked)
+        insort(self._by_votes, (-votes, pubkey))
+        insort(self._by_key, pubkey)
+        self._by_account[account] = pubkey
+        if blocked:
+            self._blocked += 1
+
+    def remove(self, pubkey: bytes) -> None:
+        """Drop a candidate that is no longer registered."""
+        entry = self._entries.pop(pubkey, None)
+        if entry is None:
+            return
+        del self._by_votes[bisect_left(self._by_votes, (-entry.votes, pubkey))]
+        del self._by_key[bisect_left(self._by_key, pubkey)]
+        self._by_account.pop(entry.account, None)
+        if entry.blocked:
+            self._blocked -= 1
+
+    def set_votes(self, pubkey: bytes, votes: int) -> None:
+        """Move a candidate to its new position in the vote order."""
+        entry = self._entries[pubkey]
+        if entry.votes == votes:
+            return
+        del self._by_votes[bisect_left(self._by_votes, (-entry.votes, pubkey))]
+        entry.votes = votes
+        insort(self._by_votes, (-votes, pubkey))
+
+    def set_blocked(self, account: UInt160, blocked: bool) -> None:
+        """Update the cached Policy status of the candidate owning ``account``."""
+        pubkey = self._by_account.get(account)
+        if pubkey is None:
+            return
+        entry = self._entries[pubkey]
+        if entry.blocked != blocked:
+            entry.blocked = blocked
+            self._blocked += 1 if blocked else -1
+
+    def votes(self, pubkey: bytes) -> int | None:
+        """Votes of an unblocked registered candidate, else None."""
+        entry = self._entries.get(pubkey)
+        if entry is None or entry.blocked:
+            return None
+        return entry.votes
+
+    def by_key(self) -> Iterator[tuple[bytes, int]]:
+        """Unblocked candidates in public-key (storage) order."""
+        entries = self._entries
+        for pubkey in self._by_key:
+            entry = entries[pubkey]
+            if not entry.blocked:
+                yield pubkey, entry.votes
+
+    def top(self, count: int) -> list[tuple[bytes, int]]:
+        """The ``count`` unblocked candidates with most votes, ties by key."""
+        result: list[tuple[bytes, int]] = []
+        entries = self._entries
+        for neg_votes, pubkey in self._by_votes:
+            if len(result) == count:
+                break
+            if not entries[pubkey].blocked:
+                result.append((pubkey, -neg_votes))
+        return result
+
 class NeoToken(FungibleToken):
     """NEO token - governance token for the Neo blockchain."""
 
@@ -102,6 +295,12 @@ class NeoToken(FungibleToken):
 
     def __init__(self) -> None:
         self._total_amount = self.TOTAL_AMOUNT
+        self._gas_record_indexes: weakref.WeakKeyDictionary[
+            Any, tuple[Any, GasRecordIndex]
+        ] = weakref.WeakKeyDictionary()
+        self._candidate_indexes: weakref.WeakKeyDictionary[
+            Any, tuple[Any, CandidateIndex]
+        ] = weakref.WeakKeyDictionary()
         super().__init__()
 
     @property
@@ -262,7 +461,7 @@ class NeoToken(FungibleToken):
 
     def _get_account_state(self, item: StorageItem) -> NeoAccountState:
         """Get NEO account state from storage item."""
-        return NeoAccountState.from_bytes(item.value)
+        return item.get_interoperable(NeoAccountState)
 
     def _on_balance_changing(
         self, engine: Any, account: UInt160, state: NeoAccountState, amount: int
@@ -286,9 +485,9 @@ class NeoToken(FungibleToken):
         cand_key = self._create_storage_key(PREFIX_CANDIDATE, state.vote_to)
         cand_item = engine.snapshot.get_and_change(cand_key)
         if cand_item is not None:
-            candidate = CandidateState.from_bytes(cand_item.value)
+            candidate = cand_item.get_interoperable(CandidateState)
             candidate.votes += amount
-            cand_item.value = candidate.to_bytes()
+            self._sync_candidate(engine.snapshot, state.vote_to, candidate)
             self._check_candidate(engine.snapshot, state.vote_to, candidate)
 
     @staticmethod
@@ -333,27 +532,37 @@ class NeoToken(FungibleToken):
         """Create a new NEO account state."""
         return NeoAccountState()
 
-    def _sorted_gas_records(self, snapshot: Any, end: int) -> list[tuple[int, int]]:
-        """Return (index, gasPerBlock) records with index <= end, descending.
+    def _scan_gas_records(self, snapshot: Any) -> Iterator[tuple[int, int]]:
+        """Yield every stored (index, gasPerBlock) record.
 
-        Mirrors C# GetSortedGasRecords (NeoToken.cs:325-331): seeks the
-        Prefix_GasPerBlock records backward from `end`. The block index is the
-        4-byte suffix of the storage key; we decode it (the spec stores it as a
-        little-endian uint32 via StorageKey.create) and sort descending so the
-        first element is the record effective at `end`.
+        The block index is the 4-byte suffix of the Prefix_GasPerBlock
+        storage key, a little-endian uint32 as written by StorageKey.create.
         """
+        if not hasattr(snapshot, "find"):
+            return
         prefix = self._create_storage_key(PREFIX_GAS_PER_BLOCK)
-        records: list[tuple[int, int]] = []
-        if hasattr(snapshot, "find"):
-            for key, item in snapshot.find(prefix):
-                suffix = key.key[1:]  # strip the prefix byte
-                if len(suffix) < 4:
-                    continue
-                index = int.from_bytes(suffix[:4], "little")
-                if index <= end:
-                    records.append((index, int(item)))
-        records.sort(key=lambda r: r[0], reverse=True)
-        return records
+        for key, item in snapshot.find(prefix):
+            suffix = key.key[1:]  # strip the prefix byte
+            if len(suffix) >= 4:
+                yield int.from_bytes(suffix[:4], "little"), int(item)
+
+    def _gas_record_index(self, snapshot: Any) -> GasRecordIndex:
+        """Return the GasPerBlock index for ``snapshot``, scanning it once.
+
+        The index is kept per snapshot object and maintained by the
+        contract's own writers (``initialize`` and ``set_gas_per_block``),
+        so later lookups never rescan storage. It is rescanned once a
+        clone commits into the snapshot.
+        """
+        return self._snapshot_index(
+            self._gas_record_indexes,
+            snapshot,
+            lambda: GasRecordIndex(self._scan_gas_records(snapshot)),
+        )
+
+    def _drop_gas_record_index(self, snapshot: Any) -> None:
+        """Forget the cached GasPerBlock index of ``snapshot``."""
+        self._drop_snapshot(self._gas_record_indexes, snapshot)
 
     def get_gas_per_block(self, snapshot: Any) -> int:
         """Get the current GAS generated per block.
@@ -363,9 +572,9 @@ class NeoToken(FungibleToken):
         index <= CurrentIndex+1).
         """
         end = self._current_index(snapshot) + 1
-        records = self._sorted_gas_records(snapshot, end)
-        if records:
-            return records[0][1]
+        value = self._gas_record_index(snapshot).value_at(end)
+        if value is not None:
+            return value
         return 5 * 10**8  # Default 5 GAS
 
     def set_gas_per_block(self, engine: Any, gas_per_block: int) -> None:
@@ -379,6 +588,7 @@ class NeoToken(FungibleToken):
         key = self._create_storage_key(PREFIX_GAS_PER_BLOCK, index)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(gas_per_block)
+        self._gas_record_index(engine.snapshot).set(index, gas_per_block)
 
     def get_register_price(self, snapshot: Any) -> int:
         """Get the price to register as a candidate."""
@@ -440,18 +650,10 @@ class NeoToken(FungibleToken):
 
         # Calculate NEO holder reward.
         # Mirror C# CalculateReward (NeoToken.cs:155-180): sum gasPerBlock over
-        # each window between historical GasPerBlock records, scanning backward
-        # from end-1, so multiple rate changes are accounted for.
-        start = state.balance_height
-        cur_end = end
-        sum_gas_per_block = 0
-        for index, gas_per_block_i in self._sorted_gas_records(snapshot, end - 1):
-            if index > start:
-                sum_gas_per_block += gas_per_block_i * (cur_end - index)
-                cur_end = index
-            else:
-                sum_gas_per_block += gas_per_block_i * (cur_end - start)
-                break
+        # [balance_height, end) across every historical GasPerBlock record.
+        sum_gas_per_block = self._gas_record_index(snapshot).sum_between(
+            state.balance_height, end
+        )
         neo_holder_reward = (
             state.balance
             * sum_gas_per_block
@@ -528,13 +730,13 @@ class NeoToken(FungibleToken):
 
         key = self._create_storage_key(PREFIX_CANDIDATE, pubkey_bytes)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem(CandidateState().to_bytes()))
-        state = CandidateState.from_bytes(item.value)
+        state = item.get_interoperable(CandidateState)
 
         if state.registered:
             return True
 
         state.registered = True
-        item.value = state.to_bytes()
+        self._sync_candidate(engine.snapshot, pubkey_bytes, state)
 
         engine.send_notification(self.hash, "CandidateStateChanged", [pubkey_bytes, True, state.votes])
         return True
@@ -553,12 +755,12 @@ class NeoToken(FungibleToken):
             return True
 
         item = engine.snapshot.get_and_change(key)
-        state = CandidateState.from_bytes(item.value)
+        state = item.get_interoperable(CandidateState)
         if not state.registered:
             return True
 
         state.registered = False
-        item.value = state.to_bytes()
+        self._sync_candidate(engine.snapshot, pubkey_bytes, state)
         self._check_candidate(engine.snapshot, pubkey_bytes, state)
 
         engine.send_notification(self.hash, "CandidateStateChanged", [pubkey_bytes, False, state.votes])
@@ -631,7 +833,7 @@ class NeoToken(FungibleToken):
             cand_item = engine.snapshot.get_and_change(cand_key)
             if cand_item is None:
                 return False
-            new_cand = CandidateState.from_bytes(cand_item.value)
+            new_cand = cand_item.get_interoperable(CandidateState)
             if not new_cand.registered:
                 return False
         else:
@@ -656,9 +858,9 @@ class NeoToken(FungibleToken):
             old_key = self._create_storage_key(PREFIX_CANDIDATE, state.vote_to)
             old_item = engine.snapshot.get_and_change(old_key)
             if old_item:
-                old_cand = CandidateState.from_bytes(old_item.value)
+                old_cand = old_item.get_interoperable(CandidateState)
                 old_cand.votes -= state.balance
-                old_item.value = old_cand.to_bytes()
+                self._sync_candidate(engine.snapshot, state.vote_to, old_cand)
                 self._check_candidate(engine.snapshot, state.vote_to, old_cand)
 
         # last_gas_per_vote: latest reward of new target when switching to a
@@ -670,13 +872,12 @@ class NeoToken(FungibleToken):
 
         # Add votes to new candidate; else clear last_gas_per_vote
         state.vote_to = vote_to_bytes
-        if new_cand is not None and cand_item is not None:
+        if new_cand is not None and cand_item is not None and vote_to_bytes is not None:
             new_cand.votes += state.balance
-            cand_item.value = new_cand.to_bytes()
+            self._sync_candidate(engine.snapshot, vote_to_bytes, new_cand)
         else:
             state.last_gas_per_vote = 0
 
-        item.value = state.to_bytes()
         engine.send_notification(self.hash, "Vote", [account, old_vote, vote_to_bytes, state.balance])
 
         # Mint the distributed GAS to the account (NeoToken.cs:513-514).
@@ -695,40 +896,77 @@ class NeoToken(FungibleToken):
         gas.mint(engine, account, amount, call_on_payment)
 
     def get_candidates(self, snapshot: Any) -> list[tuple[bytes, int]]:
-        """Get all registered candidates with their votes."""
-        candidates = []
-        prefix = self._create_storage_key(PREFIX_CANDIDATE)
-        for key, item in snapshot.find(prefix):
-            state = CandidateState.from_bytes(item.value)
-            if not state.registered:
-                continue
-            pubkey = key.key[1:]  # Remove prefix
-            # Mirror C# GetCandidatesInternal (NeoToken.cs:553): exclude any
-            # candidate whose signature-redeem-script account is blocked by the
-            # Policy contract.
-            if self._is_candidate_blocked(snapshot, pubkey):
-                continue
-            candidates.append((pubkey, state.votes))
-        return candidates[:256]  # Max 256 candidates
+        """Get all registered candidates with their votes.
+
+        Mirrors C# GetCandidates (NeoToken.cs:553): candidates whose
+        signature-redeem-script account is blocked by Policy are excluded,
+        and at most 256 are returned in storage-key order.
+        """
+        return list(islice(self._candidate_index(snapshot).by_key(), 256))
 
     @staticmethod
-    def _is_candidate_blocked(snapshot: Any, pubkey: bytes) -> bool:
-        """Return True if the candidate's account hash is blocked by Policy.
+    def _candidate_account(pubkey: bytes) -> UInt160:
+        """Return the candidate's account hash.
 
         The account is the ToScriptHash of the single-key signature redeem
         script of the public key (NOT the raw pubkey bytes), matching C#
         Contract.CreateSignatureRedeemScript(pubkey).ToScriptHash().
         """
+        from neo.smartcontract.syscalls.contract import (
+            _create_signature_redeem_script,
+        )
+
+        return UInt160(hash160(_create_signature_redeem_script(pubkey)))
+
+    @staticmethod
+    def _is_account_blocked(snapshot: Any, account: UInt160) -> bool:
+        """Return True if Policy blocks ``account``."""
         policy = NativeContract.get_contract_by_name("PolicyContract")
         if policy is None:
             return False
-        from neo.smartcontract.syscalls.contract import (
-            _create_signature_redeem_script,
+        return policy.is_blocked(snapshot, account)
+
+    def _build_candidate_index(self, snapshot: Any) -> CandidateIndex:
+        index = CandidateIndex()
+        prefix = self._create_storage_key(PREFIX_CANDIDATE)
+        for key, item in snapshot.find(prefix):
+            state = item.get_interoperable(CandidateState)
+            if state.registered:
+                pubkey = bytes(key.key[1:])  # Remove prefix
+                account = self._candidate_account(pubkey)
+                index.add(pubkey, state.votes, account, self._is_account_blocked(snapshot, account))
+        return index
+
+    def _candidate_index(self, snapshot: Any) -> CandidateIndex:
+        """Return the candidate index for ``snapshot``, scanning it once.
+
+        Like the GasPerBlock index it is kept per snapshot object and
+        rescanned after a clone commits into the snapshot; the register,
+        unregister and vote paths update it through :meth:`_sync_candidate`
+        and Policy reports block changes through :meth:`on_account_blocked`.
+        """
+        return self._snapshot_index(
+            self._candidate_indexes, snapshot, lambda: self._build_candidate_index(snapshot)
         )
 
-        script = _create_signature_redeem_script(pubkey)
-        account_hash = UInt160(hash160(script))
-        return policy.is_blocked(snapshot, account_hash)
+    def _sync_candidate(self, snapshot: Any, pubkey: bytes, state: CandidateState) -> None:
+        """Reflect a changed CandidateState in the snapshot's index, if built."""
+        index = self._peek_snapshot_index(self._candidate_indexes, snapshot)
+        if index is None:
+            return
+        if not state.registered:
+            index.remove(pubkey)
+        elif pubkey in index:
+            index.set_votes(pubkey, state.votes)
+        else:
+            account = self._candidate_account(pubkey)
+            index.add(pubkey, state.votes, account, self._is_account_blocked(snapshot, account))
+
+    def on_account_blocked(self, snapshot: Any, account: UInt160, blocked: bool) -> None:
+        """Record a Policy block/unblock of ``account`` in the candidate index."""
+        index = self._peek_snapshot_index(self._candidate_indexes, snapshot)
+        if index is not None:
+            index.set_blocked(account, blocked)
 
     def get_all_candidates(self, snapshot: Any) -> Iterator[tuple[bytes, int]]:
         """Get an iterator over registered candidates and votes."""
@@ -743,7 +981,7 @@ class NeoToken(FungibleToken):
         item = snapshot.get(key)
         if item is None:
             return -1
-        state = CandidateState.from_bytes(item.value)
+        state = item.get_interoperable(CandidateState)
         return state.votes if state.registered else -1
 
     def get_committee(self, snapshot: Any) -> list[bytes]:
@@ -756,7 +994,7 @@ class NeoToken(FungibleToken):
         # returned sorted ascending (OrderBy(p => p)). The stored cache stays
         # in votes-descending order so get_next_block_validators can take the
         # top-N before its own sort.
-        return sorted(self._parse_committee(item.value))
+        return sorted(pubkey for pubkey, _votes in item.get_interoperable(CachedCommittee).members)
 
     def get_committee_address(self, snapshot: Any) -> UInt160:
         """Get committee multisig address from current committee membership."""
@@ -770,20 +1008,6 @@ class NeoToken(FungibleToken):
         script = ProtocolSettings._create_multisig_redeem_script(threshold, committee)
         return UInt160(hash160(script))
 
-    def _parse_committee(self, data: bytes) -> list[bytes]:
-        """Parse committee from serialized data."""
-        if not data:
-            return []
-        committee = []
-        offset = 0
-        while offset < len(data):
-            if offset + 33 <= len(data):
-                committee.append(data[offset : offset + 33])
-                offset += 33 + 32  # pubkey + votes
-            else:
-                break
-        return committee
-
     def get_next_block_validators(self, engine: Any) -> list[bytes]:
         """Get validators for the next block.
 
@@ -890,6 +1114,7 @@ class NeoToken(FungibleToken):
         gas_item = StorageItem()
         gas_item.set(5 * 10**8)
         engine.snapshot.add(gas_key, gas_item)
+        self._drop_gas_record_index(engine.snapshot)
 
         # Initialize register price (1000 GAS)
         price_key = self._create_storage_key(PREFIX_REGISTER_PRICE)
@@ -921,9 +1146,7 @@ class NeoToken(FungibleToken):
         index = block_index % m
         gas_per_block = self.get_gas_per_block(engine.snapshot)
 
-        committee = self._parse_committee_pairs(
-            self._committee_storage_value(engine.snapshot)
-        )
+        committee = self._cached_committee(engine.snapshot)
         if not committee:
             return
 
@@ -957,11 +1180,13 @@ class NeoToken(FungibleToken):
                 )
                 reward_item.add(voter_sum_reward_per_neo)
 
-    def _committee_storage_value(self, snapshot: Any) -> bytes:
-        """Return the raw stored committee bytes (votes-descending cache order)."""
+    def _cached_committee(self, snapshot: Any) -> list[tuple[bytes, int]]:
+        """Return the stored (pubkey, votes) committee in votes-descending order."""
         key = self._create_storage_key(PREFIX_COMMITTEE)
         item = snapshot.get(key)
-        return item.value if item is not None else b""
+        if item is None:
+            return []
+        return list(item.get_interoperable(CachedCommittee).members)
 
     def _refresh_committee(self, engine: Any) -> None:
         """Refresh the committee based on current votes.
@@ -974,16 +1199,11 @@ class NeoToken(FungibleToken):
         key = self._create_storage_key(PREFIX_COMMITTEE)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
 
-        prev_committee = [pubkey for pubkey, _votes in self._parse_committee_pairs(item.value)]
+        cached = item.get_interoperable(CachedCommittee)
+        prev_committee = [pubkey for pubkey, _votes in cached.members]
 
         new_committee = self._compute_committee_members(engine)
-
-        # Serialize committee data: pubkey (33 bytes) + votes (32 bytes) for each
-        committee_data = bytearray()
-        for pubkey, votes in new_committee:
-            committee_data.extend(pubkey)
-            committee_data.extend(votes.to_bytes(32, "little", signed=True))
-        item.value = bytes(committee_data)
+        cached.members = list(new_committee)
 
         # HF_Cockatrice CommitteeChanged notification (NeoToken.cs:233-247).
         if self.is_hardfork_enabled(engine, Hardfork.HF_COCKATRICE):
@@ -1007,27 +1227,12 @@ class NeoToken(FungibleToken):
         # without floating point loss: votersCount / TotalAmount < 0.2.
         below_turnout = voters_count * 5 < self._total_amount
 
-        candidates = self.get_candidates(snapshot)
+        candidates = self._candidate_index(snapshot)
 
         if below_turnout or len(candidates) < committee_count:
-            votes_by_key = {pubkey: votes for pubkey, votes in candidates}
             return [
-                (pubkey, votes_by_key.get(pubkey, 0))
+                (pubkey, candidates.votes(pubkey) or 0)
                 for pubkey in engine.protocol_settings.standby_committee
             ]
 
-        ordered = sorted(candidates, key=lambda x: (-x[1], x[0]))
-        return ordered[:committee_count]
-
-    def _parse_committee_pairs(self, data: bytes) -> list[tuple[bytes, int]]:
-        """Parse stored committee into (pubkey, votes) pairs."""
-        if not data:
-            return []
-        pairs: list[tuple[bytes, int]] = []
-        offset = 0
-        while offset + 33 + 32 <= len(data):
-            pubkey = data[offset : offset + 33]
-            votes = int.from_bytes(data[offset + 33 : offset + 65], "little", signed=True)
-            pairs.append((pubkey, votes))
-            offset += 33 + 32
-        return pairs
+        return candidates.top(committee_count)
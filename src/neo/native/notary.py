@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from typing import Any, cast
 
 from neo.hardfork import Hardfork
+from neo.io.binary_writer import append_var_bytes, append_var_int
 from neo.native.native_contract import CallFlags, NativeContract, StorageItem
 from neo.types import UInt160
 
@@ -28,20 +29,6 @@ _STACKITEM_STRUCT = 0x41
 _UINT32_MASK = 0xFFFFFFFF
 
 
-def _write_var_int(buf: bytearray, value: int) -> None:
-    """Write a Neo VarInt to buffer."""
-    if value < 0xFD:
-        buf.append(value)
-    elif value <= 0xFFFF:
-        buf.append(0xFD)
-        buf.extend(value.to_bytes(2, "little"))
-    elif value <= 0xFFFFFFFF:
-        buf.append(0xFE)
-        buf.extend(value.to_bytes(4, "little"))
-    else:
-        buf.append(0xFF)
-        buf.extend(value.to_bytes(8, "little"))
-
 def _read_var_int(data: bytes, offset: int) -> tuple[int, int]:
     """Read a Neo VarInt from data at offset. Returns (value, new_offset)."""
     fb = data[offset]
@@ -64,12 +51,6 @@ def _int_to_signed_le(value: int) -> bytes:
     return value.to_bytes(length, "little", signed=True)
 
 
-def _write_var_bytes(buf: bytearray, payload: bytes) -> None:
-    """Write VarInt(length) followed by the raw bytes (Neo WriteVarBytes)."""
-    _write_var_int(buf, len(payload))
-    buf.extend(payload)
-
-
 def _read_var_bytes(data: bytes, offset: int) -> tuple[bytes, int]:
     """Read VarInt(length)-prefixed bytes from *data* at *offset*."""
     length, offset = _read_var_int(data, offset)
@@ -95,10 +76,10 @@ class Deposit:
         """Serialize deposit to the C# StackItem ``Struct`` binary format."""
         result = bytearray()
         result.append(_STACKITEM_STRUCT)
-        _write_var_int(result, 2)  # element count
+        append_var_int(result, 2)  # element count
         for value in (self.amount, int(self.till) & _UINT32_MASK):
             result.append(_STACKITEM_INTEGER)
-            _write_var_bytes(result, _int_to_signed_le(value))
+            append_var_bytes(result, _int_to_signed_le(value))
         return bytes(result)
 
     @classmethod
@@ -624,6 +605,9 @@ class Notary(NativeContract):
         import struct
         from hashlib import sha256
 
+        get_sign_digest = getattr(tx, "get_sign_digest", None)
+        if callable(get_sign_digest):
+            return get_sign_digest(self._get_network(engine) & _UINT32_MASK)
         tx_hash = getattr(tx, "hash", None)
         if callable(tx_hash):
             tx_hash = tx_hash()
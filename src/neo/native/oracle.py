@@ -5,9 +5,11 @@ Reference: Neo.SmartContract.Native.OracleContract (v3.10.0)
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import weakref
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import IntEnum
+from itertools import islice
 from typing import Any
 
 from neo.crypto import hash160
@@ -162,6 +164,70 @@ class OracleRequest:
         )
 
 
+class IdList:
+    """Pending request ids for one URL (C# OracleContract.IdList).
+
+    Stored as a BinarySerializer Array of Integers. Ids are kept in
+    insertion order in a dict, so append and remove are O(1), and each
+    id's serialized element is cached so the stored blob is rebuilt by
+    concatenation rather than re-serializing a stack item tree.
+    """
+
+    __slots__ = ("_items", "_encoded")
+
+    def __init__(self, ids: Iterable[int] = ()) -> None:
+        self._items: dict[int, bytes] = {i: self._encode_id(i) for i in ids}
+        self._encoded: bytes | None = None
+
+    @staticmethod
+    def _encode_id(request_id: int) -> bytes:
+        from neo.smartcontract.binary_serializer import BinarySerializer
+        from neo.vm.types import Integer
+
+        return BinarySerializer.serialize(Integer(request_id))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._items
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._items)
+
+    def append(self, request_id: int) -> None:
+        self._items[request_id] = self._encode_id(request_id)
+        self._encoded = None
+
+    def remove(self, request_id: int) -> bool:
+        """Remove ``request_id``; return False when it was not listed."""
+        if self._items.pop(request_id, None) is None:
+            return False
+        self._encoded = None
+        return True
+
+    def to_bytes(self) -> bytes:
+        if self._encoded is None:
+            from neo.io.binary_writer import append_var_int
+            from neo.vm.types import StackItemType
+
+            out = bytearray((StackItemType.ARRAY,))
+            append_var_int(out, len(self._items))
+            out += b"".join(self._items.values())
+            self._encoded = bytes(out)
+        return self._encoded
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> IdList:
+        if not data:
+            return cls()
+        from neo.smartcontract.binary_serializer import BinarySerializer
+
+        id_list = cls(int(elem.value) for elem in BinarySerializer.deserialize(data))
+        id_list._encoded = bytes(data)
+        return id_list
+
+
 class OracleContract(NativeContract):
     """Oracle native contract for external data requests.
 
@@ -172,6 +238,9 @@ class OracleContract(NativeContract):
     """
 
     def __init__(self) -> None:
+        self._id_lists: weakref.WeakKeyDictionary[Any, dict[bytes, IdList]] = (
+            weakref.WeakKeyDictionary()
+        )
         super().__init__()
 
     @property
@@ -508,24 +577,46 @@ class OracleContract(NativeContract):
         """Get hash of URL for indexing (C# GetUrlHash -> Crypto.Hash160)."""
         return hash160(url.encode('utf-8'))
 
-    def _add_to_id_list(self, snapshot: Any, url: str, request_id: int) -> None:
-        """Add request ID to URL's ID list (C# IdList handling, lines 271-278)."""
-        url_hash = self._get_url_hash(url)
-        key = self._create_storage_key(PREFIX_ID_LIST, url_hash)
+    def _load_id_list(self, snapshot: Any, url_hash: bytes) -> IdList | None:
+        """Return the decoded id list stored for ``url_hash``, or None.
 
-        # Get existing list
+        Decoded lists are kept per snapshot and reused while the stored
+        bytes are still the ones they produced, so a busy URL is decoded
+        once rather than on every request and response.
+        """
+        key = self._create_storage_key(PREFIX_ID_LIST, url_hash)
         value = snapshot.get(key)
         if value is None:
-            id_list = []
+            return None
+        lists = self._per_snapshot(self._id_lists, snapshot, dict)
+        cached = lists.get(url_hash)
+        if cached is not None and (cached._encoded is value or cached._encoded == value):
+            return cached
+        id_list = IdList.from_bytes(value)
+        lists[url_hash] = id_list
+        return id_list
+
+    def _store_id_list(self, snapshot: Any, url_hash: bytes, id_list: IdList) -> None:
+        key = self._create_storage_key(PREFIX_ID_LIST, url_hash)
+        lists = self._per_snapshot(self._id_lists, snapshot, dict)
+        if id_list:
+            snapshot.put(key, id_list.to_bytes())
+            lists[url_hash] = id_list
         else:
-            id_list = self._deserialize_id_list(value)
+            snapshot.delete(key)
+            lists.pop(url_hash, None)
+
+    def _add_to_id_list(self, snapshot: Any, url: str, request_id: int) -> None:
+        """Add request ID to URL's ID list (C# IdList handling, lines 271-278)."""
+        url_hash = self._get_url_hash(url)
+        id_list = self._load_id_list(snapshot, url_hash) or IdList()
 
         if len(id_list) >= MAX_PENDING_PER_URL:
             from neo.exceptions import InvalidOperationException
             raise InvalidOperationException("There are too many pending responses for this url")
 
         id_list.append(request_id)
-        snapshot.put(key, self._serialize_id_list(id_list))
+        self._store_id_list(snapshot, url_hash, id_list)
 
     def _serialize_id_list(self, id_list: list[int]) -> bytes:
         """Serialize ID list to bytes.
@@ -533,20 +624,11 @@ class OracleContract(NativeContract):
         Matches C# InteroperableList<ulong>: an Array of Integer elements
         persisted via BinarySerializer (OracleContract.cs:295-306).
         """
-        from neo.smartcontract.binary_serializer import BinarySerializer
-        from neo.vm.types import Array, Integer
-
-        item = Array(items=[Integer(i) for i in id_list])
-        return BinarySerializer.serialize(item)
+        return IdList(id_list).to_bytes()
 
     def _deserialize_id_list(self, data: bytes) -> list[int]:
         """Deserialize ID list from BinarySerializer bytes."""
-        if not data:
-            return []
-        from neo.smartcontract.binary_serializer import BinarySerializer
-
-        array = BinarySerializer.deserialize(data)
-        return [int(elem.value) for elem in array]
+        return list(IdList.from_bytes(data))
 
     # ------------------------------------------------------------------
     # Lookups
@@ -576,17 +658,22 @@ class OracleContract(NativeContract):
                 request_id = int.from_bytes(suffix, 'big')
                 yield (request_id, OracleRequest.deserialize(value))
 
-    def get_requests_by_url(self, snapshot: Any, url: str) -> Iterator[tuple[int, OracleRequest]]:
-        """Get requests for a specific URL."""
-        url_hash = self._get_url_hash(url)
-        key = self._create_storage_key(PREFIX_ID_LIST, url_hash)
-        value = snapshot.get(key) if snapshot else None
+    def get_requests_by_url(
+        self, snapshot: Any, url: str, offset: int = 0, limit: int | None = None
+    ) -> Iterator[tuple[int, OracleRequest]]:
+        """Get requests for a specific URL, in request order.
 
-        if value is None:
+        ``offset`` and ``limit`` select a page of the URL's id list; each
+        request is loaded only when the iterator reaches it.
+        """
+        if not snapshot:
+            return
+        id_list = self._load_id_list(snapshot, self._get_url_hash(url))
+        if id_list is None:
             return
 
-        id_list = self._deserialize_id_list(value)
-        for request_id in id_list:
+        stop = None if limit is None else offset + limit
+        for request_id in list(islice(id_list, offset, stop)):
             request = self.get_request(snapshot, request_id)
             if request:
                 yield (request_id, request)
@@ -908,14 +995,6 @@ class OracleContract(NativeContract):
 
         # Remove from URL index
         url_hash = self._get_url_hash(url)
-        key = self._create_storage_key(PREFIX_ID_LIST, url_hash)
-        value = snapshot.get(key)
-
-        if value:
-            id_list = self._deserialize_id_list(value)
-            if request_id in id_list:
-                id_list.remove(request_id)
-                if id_list:
-                    snapshot.put(key, self._serialize_id_list(id_list))
-                else:
-                    snapshot.delete(key)
+        id_list = self._load_id_list(snapshot, url_hash)
+        if id_list is not None and id_list.remove(request_id):
+            self._store_id_list(snapshot, url_hash, id_list)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import json
+import weakref
 from collections.abc import Iterator
 from typing import Any
 
 from neo.hardfork import Hardfork
-from neo.native.native_contract import CallFlags, NativeContract, StorageItem
+from neo.native.native_contract import CallFlags, NativeContract, StorageItem, StorageKey
 from neo.types import UInt160
 
 # Storage prefixes
@@ -61,13 +62,35 @@ class _NativeCallEngineProxy:
         return getattr(self._inner, item)
 
 
+class _PolicyValues:
+    """Policy storage reads memoized for one snapshot at one block height."""
+
+    __slots__ = ("height", "values")
+
+    def __init__(self, height: int | None) -> None:
+        self.height = height
+        self.values: dict[StorageKey, Any] = {}
+
+
 class PolicyContract(NativeContract):
     """Manages network policy settings.
     
     Controls fees, blocked accounts, and other network parameters.
     Only committee members can modify these settings.
+
+    Parameter reads and blocked-account checks go through a read-through
+    cache kept per snapshot and per persisting block height. The setters,
+    block/unblock and hardfork initialization drop exactly the keys they
+    write, and a new block height or a clone committing into the snapshot
+    starts a fresh cache.
     """
-    
+
+    def __init__(self) -> None:
+        self._value_caches: weakref.WeakKeyDictionary[
+            Any, tuple[Any, _PolicyValues]
+        ] = weakref.WeakKeyDictionary()
+        super().__init__()
+
     @property
     def name(self) -> str:
         return "PolicyContract"
@@ -217,6 +240,51 @@ class PolicyContract(NativeContract):
             active_in=Hardfork.HF_FAUN,
         )
     
+    @staticmethod
+    def _block_height(snapshot: Any) -> int | None:
+        block = getattr(snapshot, "persisting_block", None)
+        return getattr(block, "index", None)
+
+    def _cached_values(self, snapshot: Any) -> _PolicyValues:
+        height = self._block_height(snapshot)
+        cache = self._snapshot_index(
+            self._value_caches, snapshot, lambda: _PolicyValues(height)
+        )
+        if cache.height != height:
+            cache.height = height
+            cache.values.clear()
+        return cache
+
+    def _read_int(self, snapshot: Any, key: StorageKey) -> int | None:
+        """Read a stored integer through the value cache (None when absent)."""
+        values = self._cached_values(snapshot).values
+        try:
+            return values[key]
+        except KeyError:
+            item = snapshot.get(key)
+            value = int(item) if item else None
+            values[key] = value
+            return value
+
+    def _read_contains(self, snapshot: Any, key: StorageKey) -> bool:
+        """Check key presence through the value cache."""
+        values = self._cached_values(snapshot).values
+        try:
+            return values[key]
+        except KeyError:
+            value = values[key] = bool(snapshot.contains(key))
+            return value
+
+    def _invalidate(self, snapshot: Any, key: StorageKey | None = None) -> None:
+        """Drop ``key`` (or every cached value) for ``snapshot``."""
+        cache = self._peek_snapshot_index(self._value_caches, snapshot)
+        if cache is None:
+            return
+        if key is None:
+            cache.values.clear()
+        else:
+            cache.values.pop(key, None)
+
     def get_fee_per_byte(self, snapshot: Any) -> int:
         """Get network fee per transaction byte.
         
@@ -224,8 +292,8 @@ class PolicyContract(NativeContract):
             Fee in datoshi (1 datoshi = 1e-8 GAS)
         """
         key = self._create_storage_key(PREFIX_FEE_PER_BYTE)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_FEE_PER_BYTE
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_FEE_PER_BYTE
     
     def set_fee_per_byte(self, engine: Any, value: int) -> None:
         """Set fee per byte. Committee only.
@@ -242,6 +310,7 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_FEE_PER_BYTE)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
     
     def get_exec_fee_factor(self, snapshot: Any) -> int:
         """Get execution fee factor.
@@ -258,12 +327,12 @@ class PolicyContract(NativeContract):
             Execution fee factor (datoshi unit)
         """
         key = self._create_storage_key(PREFIX_EXEC_FEE_FACTOR)
-        item = snapshot.get(key)
-        if item is None:
+        value = self._read_int(snapshot, key)
+        if value is None:
             return DEFAULT_EXEC_FEE_FACTOR
         if NativeContract.is_hardfork_enabled(snapshot, Hardfork.HF_FAUN):
-            return int(item) // DEFAULT_EXEC_PICO_FEE_FACTOR
-        return int(item)
+            return value // DEFAULT_EXEC_PICO_FEE_FACTOR
+        return value
 
     def get_exec_pico_fee_factor(self, snapshot: Any) -> int:
         """Get execution pico-fee factor.
@@ -275,10 +344,10 @@ class PolicyContract(NativeContract):
         """
         NativeContract.require_hardfork(snapshot, Hardfork.HF_FAUN, "getExecPicoFeeFactor")
         key = self._create_storage_key(PREFIX_EXEC_FEE_FACTOR)
-        item = snapshot.get(key)
-        if item is None:
+        value = self._read_int(snapshot, key)
+        if value is None:
             return DEFAULT_EXEC_FEE_FACTOR * DEFAULT_EXEC_PICO_FEE_FACTOR
-        return int(item)
+        return value
 
     def set_exec_fee_factor(self, engine: Any, value: int) -> None:
         """Set execution fee factor. Committee only.
@@ -303,6 +372,7 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_EXEC_FEE_FACTOR)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
     
     def get_storage_price(self, snapshot: Any) -> int:
         """Get storage price per byte.
@@ -311,8 +381,8 @@ class PolicyContract(NativeContract):
             Storage price in datoshi
         """
         key = self._create_storage_key(PREFIX_STORAGE_PRICE)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_STORAGE_PRICE
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_STORAGE_PRICE
     
     def set_storage_price(self, engine: Any, value: int) -> None:
         """Set storage price. Committee only.
@@ -329,13 +399,14 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_STORAGE_PRICE)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
 
     def get_milliseconds_per_block(self, snapshot: Any) -> int:
         """Get target block interval in milliseconds."""
         NativeContract.require_hardfork(snapshot, Hardfork.HF_ECHIDNA, "getMillisecondsPerBlock")
         key = self._create_storage_key(PREFIX_MILLISECONDS_PER_BLOCK)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_MILLISECONDS_PER_BLOCK
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_MILLISECONDS_PER_BLOCK
 
     def set_milliseconds_per_block(self, engine: Any, value: int) -> None:
         """Set target block interval in milliseconds. Committee only."""
@@ -352,6 +423,7 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_MILLISECONDS_PER_BLOCK)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
 
         if hasattr(engine, "send_notification"):
             engine.send_notification(
@@ -364,8 +436,8 @@ class PolicyContract(NativeContract):
             snapshot, Hardfork.HF_ECHIDNA, "getMaxValidUntilBlockIncrement"
         )
         key = self._create_storage_key(PREFIX_MAX_VALID_UNTIL_BLOCK_INCREMENT)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_MAX_VALID_UNTIL_BLOCK_INCREMENT
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_MAX_VALID_UNTIL_BLOCK_INCREMENT
 
     def set_max_valid_until_block_increment(self, engine: Any, value: int) -> None:
         """Set max valid-until-block increment. Committee only."""
@@ -389,13 +461,14 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_MAX_VALID_UNTIL_BLOCK_INCREMENT)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
 
     def get_max_traceable_blocks(self, snapshot: Any) -> int:
         """Get max traceable blocks."""
         NativeContract.require_hardfork(snapshot, Hardfork.HF_ECHIDNA, "getMaxTraceableBlocks")
         key = self._create_storage_key(PREFIX_MAX_TRACEABLE_BLOCKS)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_MAX_TRACEABLE_BLOCKS
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_MAX_TRACEABLE_BLOCKS
 
     def set_max_traceable_blocks(self, engine: Any, value: int) -> None:
         """Set max traceable blocks. Committee only."""
@@ -421,6 +494,10 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_MAX_TRACEABLE_BLOCKS)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
+        ledger = NativeContract.get_contract_by_name("LedgerContract")
+        if ledger is not None and hasattr(ledger, "invalidate_trace_window"):
+            ledger.invalidate_trace_window(engine)
 
     def get_blocked_accounts(self, snapshot: Any) -> Iterator[UInt160]:
         """Get an iterator of blocked accounts."""
@@ -445,7 +522,7 @@ class PolicyContract(NativeContract):
             True if blocked, False otherwise
         """
         key = self._create_storage_key(PREFIX_BLOCKED_ACCOUNT, account.data)
-        return snapshot.contains(key)
+        return self._read_contains(snapshot, key)
     
     def block_account(self, engine: Any, account: UInt160) -> bool:
         """Block an account. Committee only.
@@ -492,6 +569,9 @@ class PolicyContract(NativeContract):
         else:
             entry.set(b"")
         engine.snapshot.add(key, entry)
+        self._invalidate(engine.snapshot, key)
+        if neo_token is not None and hasattr(neo_token, "on_account_blocked"):
+            neo_token.on_account_blocked(engine.snapshot, account, True)
         return True
 
     def clean_whitelist(self, engine: Any, contract_state: Any) -> int:
@@ -554,6 +634,10 @@ class PolicyContract(NativeContract):
             return False
         
         engine.snapshot.delete(key)
+        self._invalidate(engine.snapshot, key)
+        neo_token = NativeContract.get_contract_by_name("NeoToken")
+        if neo_token is not None and hasattr(neo_token, "on_account_blocked"):
+            neo_token.on_account_blocked(engine.snapshot, account, False)
         return True
     
     @staticmethod
@@ -593,8 +677,8 @@ class PolicyContract(NativeContract):
             )
         self._assert_attribute_type(attribute_type, allow_notary_assisted)
         key = self._create_storage_key(PREFIX_ATTRIBUTE_FEE, attribute_type)
-        item = snapshot.get(key)
-        return int(item) if item else DEFAULT_ATTRIBUTE_FEE
+        value = self._read_int(snapshot, key)
+        return value if value is not None else DEFAULT_ATTRIBUTE_FEE
 
     def set_attribute_fee(
         self,
@@ -629,6 +713,7 @@ class PolicyContract(NativeContract):
         key = self._create_storage_key(PREFIX_ATTRIBUTE_FEE, attribute_type)
         item = engine.snapshot.get_and_change(key, lambda: StorageItem())
         item.set(value)
+        self._invalidate(engine.snapshot, key)
 
     def _resolve_whitelist_method_offset(
         self,
@@ -933,6 +1018,8 @@ class PolicyContract(NativeContract):
         if hardfork == Hardfork.HF_FAUN:
             self._initialize_faun(engine)
 
+        self._invalidate(snapshot)
+
     def _initialize_echidna(self, engine: Any) -> None:
         """Seed HF_Echidna policy keys from ProtocolSettings."""
         snapshot = engine.snapshot
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import base64
-import json
 from typing import Any
 
 import regex  # type: ignore[import-untyped]
 
 from neo.hardfork import Hardfork
 from neo.native.native_contract import CallFlags, NativeContract
+from neo.smartcontract.binary_serializer import BinarySerializer
+from neo.smartcontract.json_serializer import JsonSerializer
+from neo.vm.types import NULL, Array, Boolean, ByteString, Integer, Map, StackItem
 
 MAX_INPUT_LENGTH = 1024
 
@@ -18,6 +20,20 @@ MAX_INPUT_LENGTH = 1024
 # JsonSerializer.SerializeToByteArray(item, engine.Limits.MaxItemSize).
 MAX_ITEM_SIZE = 65535 * 2
 
+def _slot_setter(items: list[StackItem], index: int) -> Any:
+    def attach(item: StackItem) -> None:
+        items[index] = item
+
+    return attach
+
+
+def _map_setter(target: Map, key: StackItem) -> Any:
+    def attach(item: StackItem) -> None:
+        target[key] = item
+
+    return attach
+
+
 class StdLib(NativeContract):
     """Standard library functions for Neo smart contracts."""
 
@@ -138,271 +154,88 @@ class StdLib(NativeContract):
             manifest_parameter_names=["str"],
         )
 
-    def serialize(self, item: Any) -> bytes:
-        """Serialize a stack item to bytes using Neo binary format."""
-        return self._binary_serialize(item)
-
-    def deserialize(self, data: bytes) -> Any:
-        """Deserialize bytes to a stack item using Neo binary format."""
-        return self._binary_deserialize(data)
-
-    def _binary_serialize(self, item: Any, depth: int = 0) -> bytes:
-        """Serialize item to Neo binary format."""
-        if depth > 16:
-            raise ValueError("Serialization depth exceeded")
-
-        if item is None:
-            return bytes([0x00])  # Null
-        elif isinstance(item, bool):
-            # StackItemType.Boolean = 0x20, followed by value byte
-            return bytes([0x20, 0x01 if item else 0x00])
-        elif isinstance(item, int):
-            # Integer
-            if item == 0:
-                return bytes([0x21, 0x00])
-            data = item.to_bytes((item.bit_length() + 8) // 8, "little", signed=True)
-            return bytes([0x21, len(data)]) + data
-        elif isinstance(item, bytes):
-            # ByteString
-            length = len(item)
-            if length < 0x100:
-                return bytes([0x28, length]) + item
-            elif length < 0x10000:
-                return bytes([0x29]) + length.to_bytes(2, "little") + item
-            else:
-                return bytes([0x2A]) + length.to_bytes(4, "little") + item
-        elif isinstance(item, str):
-            # String as ByteString
-            encoded = item.encode("utf-8")
-            return self._binary_serialize(encoded, depth)
-        elif isinstance(item, list):
-            # Array
-            result = bytes([0x40, len(item)])
-            for elem in item:
-                result += self._binary_serialize(elem, depth + 1)
-            return result
-        elif isinstance(item, dict):
-            # Map
-            result = bytes([0x48, len(item)])
-            for k, v in item.items():
-                result += self._binary_serialize(k, depth + 1)
-                result += self._binary_serialize(v, depth + 1)
-            return result
-        else:
-            raise ValueError(f"Cannot serialize type: {type(item)}")
-
-    def _binary_deserialize(self, data: bytes, offset: int = 0) -> tuple:
-        """Deserialize from Neo binary format. Returns (value, new_offset)."""
-        if offset >= len(data):
-            raise ValueError("Invalid data")
-
-        type_byte = data[offset]
-        offset += 1
-
-        if type_byte == 0x00:  # Null
-            return None, offset
-        elif type_byte == 0x20:  # Boolean
-            if offset >= len(data):
-                raise ValueError("Truncated boolean value")
-            value_byte = data[offset]
-            offset += 1
-            return value_byte != 0, offset
-        elif type_byte == 0x21:  # Integer
-            if offset >= len(data):
-                raise ValueError("Truncated integer length")
-            length = data[offset]
-            offset += 1
-            if length == 0:
-                return 0, offset
-            int_data = data[offset : offset + length]
-            offset += length
-            return int.from_bytes(int_data, "little", signed=True), offset
-        elif type_byte == 0x28:  # ByteString (1-byte length)
-            length = data[offset]
-            offset += 1
-            return data[offset : offset + length], offset + length
-        elif type_byte == 0x29:  # ByteString (2-byte length)
-            length = int.from_bytes(data[offset : offset + 2], "little")
-            offset += 2
-            return data[offset : offset + length], offset + length
-        elif type_byte == 0x2A:  # ByteString (4-byte length)
-            length = int.from_bytes(data[offset : offset + 4], "little")
-            offset += 4
-            return data[offset : offset + length], offset + length
-        elif type_byte == 0x40:  # Array
-            count = data[offset]
-            offset += 1
-            result = []
-            for _ in range(count):
-                item, offset = self._binary_deserialize(data, offset)
-                result.append(item)
-            return result, offset
-        elif type_byte == 0x48:  # Map
-            count = data[offset]
-            offset += 1
-            map_result: dict[Any, Any] = {}
-            for _ in range(count):
-                key, offset = self._binary_deserialize(data, offset)
-                value, offset = self._binary_deserialize(data, offset)
-                map_result[key] = value
-            return map_result, offset
-        else:
-            raise ValueError(f"Unknown type byte: {type_byte}")
-
-    def json_serialize(self, item: Any) -> bytes:
-        """Serialize a stack item to JSON bytes.
+    def serialize(self, item: StackItem) -> bytes:
+        """Serialize a stack item to bytes using Neo binary format.
 
-        Mirrors C# JsonSerializer.SerializeToByteArray (Utf8JsonWriter with
-        JavaScriptEncoder.Default): compact separators, non-ASCII escaped as
-        uppercase ``\\uXXXX``, HTML-sensitive characters escaped, and strict
-        JNumber safe-integer bounds on integers.
-
-        The serialized output is bounded by MAX_ITEM_SIZE (C#
-        ExecutionEngineLimits.MaxItemSize = 131070); larger output faults,
-        matching JsonSerializer.SerializeToByteArray's maxSize check.
+        Encoded by :class:`BinarySerializer`, bounded by MAX_ITEM_SIZE as C#
+        StdLib.Serialize is by ``engine.Limits.MaxItemSize``. The VM hands
+        the item over unconverted; Python values from direct callers are
+        mapped by :meth:`_to_stack_item`.
         """
-        result = self._encode_json(self._to_json_value(item)).encode("utf-8")
-        if len(result) > MAX_ITEM_SIZE:
-            raise ValueError("JSON output exceeds MaxItemSize")
-        return result
+        return BinarySerializer.serialize(self._to_stack_item(item), MAX_ITEM_SIZE)
 
-    def json_deserialize(self, data: bytes) -> Any:
-        """Deserialize JSON bytes to a stack item."""
-        return self._from_json_value(json.loads(data.decode("utf-8")))
+    def deserialize(self, data: bytes) -> StackItem:
+        """Deserialize bytes to a stack item using Neo binary format.
 
-    # JNumber safe-integer bounds, matching C# JNumber.MAX_SAFE_INTEGER / MIN.
-    _JNUMBER_MAX_SAFE_INTEGER = (1 << 53) - 1
-    _JNUMBER_MIN_SAFE_INTEGER = -((1 << 53) - 1)
+        The item is returned as decoded, so Struct, Boolean and Buffer keep
+        their types as in C# StdLib.Deserialize.
+        """
+        return BinarySerializer.deserialize(data, MAX_ITEM_SIZE)
 
-    def _to_json_value(self, item: Any) -> Any:
-        """Convert stack item to a JSON-compatible intermediate value.
+    def json_serialize(self, item: StackItem) -> bytes:
+        """Serialize a stack item to JSON bytes.
 
-        Mirrors C# JsonSerializer.Serialize: ByteString/Buffer decode as
-        strict UTF-8 (faulting on invalid UTF-8), integers are bounds-checked
-        against JNumber safe-integer range, and Map keys decode as UTF-8.
+        Encoded by :class:`JsonSerializer`, which mirrors C#
+        JsonSerializer.SerializeToByteArray (Utf8JsonWriter with
+        JavaScriptEncoder.Default). The serialized output is bounded by
+        MAX_ITEM_SIZE (C# ExecutionEngineLimits.MaxItemSize = 131070); larger
+        output faults, matching JsonSerializer.SerializeToByteArray's maxSize
+        check.
         """
-        if item is None:
-            return None
-        elif isinstance(item, bool):
-            return item
-        elif isinstance(item, int):
-            if item > self._JNUMBER_MAX_SAFE_INTEGER or item < self._JNUMBER_MIN_SAFE_INTEGER:
-                raise ValueError("Integer out of JNumber safe range")
-            return item
-        elif isinstance(item, bytes):
-            return self._strict_utf8_decode(item)
-        elif isinstance(item, str):
-            return item
-        elif isinstance(item, list):
-            return [self._to_json_value(x) for x in item]
-        elif isinstance(item, dict):
-            result: dict[str, Any] = {}
-            for k, v in item.items():
-                if isinstance(k, bytes):
-                    key = self._strict_utf8_decode(k)
-                elif isinstance(k, str):
-                    key = k
-                else:
-                    raise ValueError("Key is not a ByteString")
-                result[key] = self._to_json_value(v)
-            return result
-        else:
-            raise ValueError(f"Cannot serialize type: {type(item)}")
+        return JsonSerializer.serialize(self._to_stack_item(item), MAX_ITEM_SIZE)
+
+    def json_deserialize(self, data: bytes) -> StackItem:
+        """Deserialize JSON bytes to a stack item."""
+        return JsonSerializer.deserialize(data, MAX_ITEM_SIZE)
 
     @staticmethod
-    def _strict_utf8_decode(data: bytes) -> str:
-        """Decode bytes as strict UTF-8, faulting on invalid sequences.
+    def _to_stack_item(value: Any) -> StackItem:
+        """Convert a native-call argument to the stack item it stands for.
 
-        Mirrors C# StackItem.GetString() (StrictUTF8.GetString), which uses
-        an ExceptionFallback and throws on invalid UTF-8.
-        """
-        try:
-            return data.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            raise ValueError("Invalid UTF-8 in ByteString") from exc
-
-    # Short escapes emitted by System.Text.Json (Utf8JsonWriter).
-    _JSON_SHORT_ESCAPES = {
-        ord('"'): '\\"',
-        ord("\\"): "\\\\",
-        ord("\b"): "\\b",
-        ord("\f"): "\\f",
-        ord("\n"): "\\n",
-        ord("\r"): "\\r",
-        ord("\t"): "\\t",
-    }
-
-    @classmethod
-    def _escape_json_string(cls, s: str) -> str:
-        """Escape a string to match C# Utf8JsonWriter + JavaScriptEncoder.Default.
-
-        - control chars and the JSON structural escapes use short forms;
-        - the HTML-sensitive set (<, >, &, +, ') and any non-ASCII code point
-          is escaped as ``\\uXXXX`` with UPPERCASE hex digits (surrogate pairs
-          for astral code points).
+        Python containers map to Array/Map; a container reached twice maps to
+        the same stack item, so the serializers see (and reject) cycles
+        exactly as they would on VM items. Stack items pass through.
         """
-        out: list[str] = ['"']
-        # Characters JavaScriptEncoder.Default escapes beyond the JSON minimum.
-        html_sensitive = {ord("<"), ord(">"), ord("&"), ord("+"), ord("'")}
-        for ch in s:
-            cp = ord(ch)
-            if cp in cls._JSON_SHORT_ESCAPES:
-                out.append(cls._JSON_SHORT_ESCAPES[cp])
-            elif cp < 0x20 or cp > 0x7E or cp in html_sensitive:
-                if cp > 0xFFFF:
-                    cp -= 0x10000
-                    high = 0xD800 + (cp >> 10)
-                    low = 0xDC00 + (cp & 0x3FF)
-                    out.append(f"\\u{high:04X}\\u{low:04X}")
+        converted: dict[int, StackItem] = {}
+        root: list[StackItem] = []
+        pending: list[tuple[Any, Any]] = [(value, root.append)]
+
+        while pending:
+            current, attach = pending.pop()
+            if isinstance(current, StackItem):
+                attach(current)
+            elif current is None:
+                attach(NULL)
+            elif isinstance(current, bool):
+                attach(Boolean(current))
+            elif isinstance(current, int):
+                attach(Integer(current))
+            elif isinstance(current, (bytes, bytearray)):
+                attach(ByteString(bytes(current)))
+            elif isinstance(current, str):
+                attach(ByteString(current.encode("utf-8")))
+            elif isinstance(current, (list, dict)):
+                existing = converted.get(id(current))
+                if existing is not None:
+                    attach(existing)
+                    continue
+                if isinstance(current, list):
+                    array = Array(items=[None] * len(current))  # type: ignore[list-item]
+                    converted[id(current)] = array
+                    attach(array)
+                    for index in range(len(current) - 1, -1, -1):
+                        pending.append((current[index], _slot_setter(array._items, index)))
                 else:
-                    out.append(f"\\u{cp:04X}")
+                    result = Map()
+                    converted[id(current)] = result
+                    attach(result)
+                    for key, map_value in reversed(list(current.items())):
+                        key_item = StdLib._to_stack_item(key)
+                        pending.append((map_value, _map_setter(result, key_item)))
             else:
-                out.append(ch)
-        out.append('"')
-        return "".join(out)
-
-    @classmethod
-    def _encode_json(cls, value: Any) -> str:
-        """Serialize an intermediate value to a C#-byte-compatible JSON string."""
-        if value is None:
-            return "null"
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        if isinstance(value, int):
-            # C# writes (double)integer; whole-number doubles render without a
-            # decimal point via Utf8JsonWriter, so a plain integer literal
-            # matches for the JNumber-bounded range.
-            return str(value)
-        if isinstance(value, str):
-            return cls._escape_json_string(value)
-        if isinstance(value, list):
-            return "[" + ",".join(cls._encode_json(x) for x in value) + "]"
-        if isinstance(value, dict):
-            parts = [cls._escape_json_string(k) + ":" + cls._encode_json(v) for k, v in value.items()]
-            return "{" + ",".join(parts) + "}"
-        raise ValueError(f"Cannot serialize type: {type(value)}")
-
-    def _from_json_value(self, value: Any) -> Any:
-        """Convert JSON value to stack item."""
-        if value is None:
-            return None
-        elif isinstance(value, bool):
-            return value
-        elif isinstance(value, int):
-            return value
-        elif isinstance(value, float):
-            # C# JsonSerializer faults on fractional numbers (JsonSerializer.cs:196).
-            if value % 1 != 0:
-                raise ValueError("Decimal value is not allowed")
-            return int(value)
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, list):
-            return [self._from_json_value(x) for x in value]
-        elif isinstance(value, dict):
-            return {k: self._from_json_value(v) for k, v in value.items()}
-        else:
-            return value
+                raise ValueError(f"Cannot serialize type: {type(current)}")
+
+        return root[0]
 
     def itoa(self, value: int, base: int = 10) -> str:
         """Convert an integer to a string.
@@ -24,7 +24,10 @@ class Block(Header):
     """Represents a Neo N3 block."""
     
     transactions: list[Transaction] = field(default_factory=list)
-    _hash: UInt256 | None = field(default=None, repr=False)
+    _hash: UInt256 | None = field(default=None, repr=False, compare=False)
+
+    _CACHES = ("_unsigned", "_raw", "_hash")
+    _UNHASHED = ("witness", "transactions")
     
     @property
     def hash(self) -> UInt256:
@@ -34,15 +37,23 @@ class Block(Header):
             self._hash = UInt256(hash256(self._get_hash_data()))
         return self._hash
     
-    def _get_hash_data(self) -> bytes:
-        """Get data for hash calculation."""
-        from neo.io.binary_writer import BinaryWriter
-        writer = BinaryWriter()
-        self._serialize_unsigned(writer)
-        return writer.to_bytes()
+    @property
+    def size(self) -> int:
+        """Get the serialized size."""
+        if self._raw is not None:
+            return len(self._raw)
+        from neo.io.binary_writer import get_var_size
+        return (
+            self._header_size()
+            + get_var_size(len(self.transactions))
+            + sum(tx.size for tx in self.transactions)
+        )
     
     def serialize(self, writer: BinaryWriter) -> None:
         """Serialize the block."""
+        if self._raw is not None:
+            writer.write_bytes(self._raw)
+            return
         super().serialize(writer)
         writer.write_var_int(len(self.transactions))
         for tx in self.transactions:
@@ -51,11 +62,12 @@ class Block(Header):
     @classmethod
     def deserialize(cls, reader: BinaryReader) -> Block:
         """Deserialize a block."""
+        start = reader.position
         header = Header.deserialize(reader)
         tx_count = reader.read_var_int(MAX_TRANSACTIONS_PER_BLOCK)
         transactions = [Transaction.deserialize(reader) for _ in range(tx_count)]
         
-        return cls(
+        block = cls(
             version=header.version,
             prev_hash=header.prev_hash,
             merkle_root=header.merkle_root,
@@ -67,3 +79,6 @@ class Block(Header):
             witness=header.witness,
             transactions=transactions
         )
+        block._unsigned = header._unsigned
+        block._raw = reader.get_span(start)
+        return block
@@ -6,8 +6,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from neo.crypto.bloom_filter import BloomFilter
     from neo.io.binary_reader import BinaryReader
     from neo.io.binary_writer import BinaryWriter
+    from neo.network.payloads.block import Block
 
 @dataclass
 class FilterLoadPayload:
@@ -30,6 +32,21 @@ class FilterLoadPayload:
         if self.tweak < 0 or self.tweak > 0xFFFFFFFF:
             raise ValueError(f"Invalid tweak: {self.tweak}")
 
+    def create_filter(self) -> "BloomFilter":
+        """Build the Bloom filter this payload describes (C# ``new BloomFilter``).
+
+        Raises ValueError for an empty filter or ``k == 0``, as C# rejects them.
+        """
+        from neo.crypto.bloom_filter import BloomFilter
+
+        bloom = BloomFilter(m=len(self.filter) * 8, k=self.k, seed=self.tweak)
+        bloom.load_bits(self.filter)
+        return bloom
+
+    def match_block(self, block: "Block") -> list[bool]:
+        """Flags for ``block``'s transactions, ready for ``MerkleBlockPayload.create``."""
+        return self.create_filter().match_transactions(block.transactions)
+
     def serialize(self, writer: "BinaryWriter") -> None:
         """Serialize payload to wire format."""
         writer.write_var_bytes(self.filter)
@@ -1,11 +1,14 @@
 """Neo N3 Header.
 
 Reference: Neo.Network.P2P.Payloads.Header
+
+The unsigned serialization and the wire bytes are cached like
+``Transaction``'s; assigning a field drops them.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from neo.io.binary_reader import BinaryReader
@@ -15,6 +18,8 @@ if TYPE_CHECKING:
 
 # Header size without witness
 HEADER_SIZE = 4 + 32 + 32 + 8 + 8 + 4 + 1 + 20 + 1
+# Two zero-length var-bytes scripts
+_EMPTY_WITNESS_SIZE = 2
 
 @dataclass
 class Header:
@@ -28,22 +33,65 @@ class Header:
     primary_index: int = 0
     next_consensus: bytes = field(default_factory=lambda: bytes(20))
     witness: "Witness" | None = None
+    _unsigned: bytes | None = field(default=None, repr=False, compare=False)
+    _raw: bytes | None = field(default=None, repr=False, compare=False)
+
+    _CACHES: ClassVar[tuple[str, ...]] = ("_unsigned", "_raw")
+    # Fields outside the hashed data; assigning them keeps the hash.
+    _UNHASHED: ClassVar[tuple[str, ...]] = ("witness",)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != "_":
+            if name in self._UNHASHED:
+                object.__setattr__(self, "_raw", None)
+            else:
+                self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop every cached derived value after an in-place mutation."""
+        for cache in self._CACHES:
+            object.__setattr__(self, cache, None)
     
     @property
     def hash(self) -> bytes | "UInt256":
         """Get the header hash."""
         from neo.crypto.hash import hash256
         return hash256(self._get_hash_data())
+
+    @property
+    def size(self) -> int:
+        """Get the serialized size."""
+        if self._raw is not None:
+            return len(self._raw)
+        return self._header_size()
+
+    def _header_size(self) -> int:
+        return HEADER_SIZE + (self.witness.size if self.witness else _EMPTY_WITNESS_SIZE)
     
     def _get_hash_data(self) -> bytes:
         """Get data for hash calculation."""
-        from neo.io.binary_writer import BinaryWriter
-        writer = BinaryWriter()
-        self._serialize_unsigned(writer)
-        return writer.to_bytes()
+        if self._unsigned is None:
+            from neo.io.binary_writer import BinaryWriter
+            writer = BinaryWriter()
+            self._serialize_unsigned(writer)
+            self._unsigned = writer.to_bytes()
+        return self._unsigned
+
+    def to_bytes(self) -> bytes:
+        """Get the full wire serialization."""
+        if self._raw is None:
+            from neo.io.binary_writer import BinaryWriter
+            writer = BinaryWriter.sized(self.size)
+            self.serialize(writer)
+            self._raw = writer.to_bytes()
+        return self._raw
     
     def _serialize_unsigned(self, writer: "BinaryWriter") -> None:
         """Serialize unsigned header data."""
+        if self._unsigned is not None:
+            writer.write_bytes(self._unsigned)
+            return
         writer.write_uint32(self.version)
         # Handle both bytes and UInt256/UInt160
         prev = self.prev_hash.data if hasattr(self.prev_hash, 'data') else self.prev_hash
@@ -72,6 +120,7 @@ class Header:
         """Deserialize a header."""
         from neo.network.payloads.witness import Witness
         
+        start = reader.position
         version = reader.read_uint32()
         prev_hash = reader.read_bytes(32)
         merkle_root = reader.read_bytes(32)
@@ -80,6 +129,7 @@ class Header:
         index = reader.read_uint32()
         primary_index = reader.read_byte()
         next_consensus = reader.read_bytes(20)
+        unsigned = reader.get_span(start)
         
         witness_count = reader.read_var_int(1)
         if witness_count != 1:
@@ -88,7 +138,7 @@ class Header:
             )
         witness = Witness.deserialize(reader)
         
-        return cls(
+        header = cls(
             version=version,
             prev_hash=prev_hash,
             merkle_root=merkle_root,
@@ -99,3 +149,6 @@ class Header:
             next_consensus=next_consensus,
             witness=witness
         )
+        header._unsigned = unsigned
+        header._raw = reader.get_span(start)
+        return header
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,7 @@ from neo.network.payloads.header import Header
 if TYPE_CHECKING:
     from neo.io.binary_reader import BinaryReader
     from neo.io.binary_writer import BinaryWriter
+    from neo.network.payloads.block import Block
 
 
 @dataclass
@@ -34,6 +36,40 @@ class MerkleBlockPayload:
                 f"Flags length exceeds limit: {len(self.flags)}/{max_flags_size}"
             )
 
+    @classmethod
+    def create(cls, block: "Block", flags: Sequence[bool]) -> "MerkleBlockPayload":
+        """Build the payload for ``block`` keeping the flagged transactions.
+
+        Mirrors C# ``MerkleBlockPayload.Create``: the transaction merkle
+        tree is trimmed to the flagged leaves and the flags are packed
+        least-significant bit first.
+        """
+        from neo.crypto.merkle_tree import MerkleTree
+        from neo.network.payloads.header import Header
+
+        tree = MerkleTree(tx.hash.data for tx in block.transactions)
+        packed = bytearray((len(flags) + 7) // 8)
+        for position, flag in enumerate(flags):
+            if flag:
+                packed[position // 8] |= 1 << (position % 8)
+        header = Header(
+            version=block.version,
+            prev_hash=block.prev_hash,
+            merkle_root=block.merkle_root,
+            timestamp=block.timestamp,
+            nonce=block.nonce,
+            index=block.index,
+            primary_index=block.primary_index,
+            next_consensus=block.next_consensus,
+            witness=block.witness,
+        )
+        return cls(
+            header=header,
+            tx_count=len(block.transactions),
+            hashes=tree.get_partial_hashes(flags),
+            flags=bytes(packed),
+        )
+
     def serialize(self, writer: "BinaryWriter") -> None:
         """Serialize payload to wire format."""
         self.header.serialize(writer)
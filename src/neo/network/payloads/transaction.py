@@ -2,6 +2,12 @@
 Transaction - Represents a Neo N3 transaction.
 
 Reference: Neo.Network.P2P.Payloads.Transaction
+
+The unsigned serialization, the full wire bytes, the size and the hash
+are computed once and cached. A deserialized transaction keeps the exact
+bytes it was read from. Assigning a field drops the caches it affects;
+in-place changes to ``signers``, ``attributes`` or ``witnesses`` must be
+followed by :meth:`Transaction.invalidate`.
 """
 
 from __future__ import annotations
@@ -23,6 +29,10 @@ MAX_TRANSACTION_SIZE = 102400
 MAX_TRANSACTION_ATTRIBUTES = 16
 HEADER_SIZE = 1 + 4 + 8 + 8 + 4  # Version + Nonce + SystemFee + NetworkFee + ValidUntilBlock
 
+_CACHES = ("_hash", "_unsigned", "_raw", "_size", "_sign_digests")
+# Witnesses are not part of the hashed data, so replacing them keeps the hash.
+_WITNESS_CACHES = ("_raw", "_size")
+
 
 @dataclass
 class Transaction:
@@ -37,19 +47,67 @@ class Transaction:
     attributes: list["TransactionAttribute"] = field(default_factory=list)
     script: bytes = b""
     witnesses: list["Witness"] = field(default_factory=list)
-    _hash: UInt256 | None = field(default=None, repr=False)
+    _hash: UInt256 | None = field(default=None, repr=False, compare=False)
+    _unsigned: bytes | None = field(default=None, repr=False, compare=False)
+    _raw: bytes | None = field(default=None, repr=False, compare=False)
+    _size: int | None = field(default=None, repr=False, compare=False)
+    _sign_digests: dict[int, bytes] | None = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name[0] != "_":
+            for cache in _WITNESS_CACHES if name == "witnesses" else _CACHES:
+                object.__setattr__(self, cache, None)
+
+    def invalidate(self) -> None:
+        """Drop every cached derived value after an in-place mutation."""
+        for cache in _CACHES:
+            object.__setattr__(self, cache, None)
 
     @property
     def hash(self) -> UInt256:
         """Get the transaction hash."""
         if self._hash is None:
             from neo.crypto.hash import hash256
+
+            self._hash = UInt256(hash256(self.get_hash_data()))
+        return self._hash
+
+    def get_hash_data(self) -> bytes:
+        """Get the unsigned serialization the hash is computed over."""
+        if self._unsigned is None:
             from neo.io.binary_writer import BinaryWriter
 
             writer = BinaryWriter()
             self.serialize_unsigned(writer)
-            self._hash = UInt256(hash256(writer.to_bytes()))
-        return self._hash
+            self._unsigned = writer.to_bytes()
+        return self._unsigned
+
+    def get_sign_digest(self, network: int) -> bytes:
+        """Get SHA256(network || hash), the digest witnesses sign on ``network``."""
+        digests = self._sign_digests
+        if digests is None:
+            digests = self._sign_digests = {}
+        digest = digests.get(network)
+        if digest is None:
+            from hashlib import sha256
+
+            digest = sha256(
+                (network & 0xFFFFFFFF).to_bytes(4, "little") + self.hash.data
+            ).digest()
+            digests[network] = digest
+        return digest
+
+    def to_bytes(self) -> bytes:
+        """Get the full wire serialization."""
+        if self._raw is None:
+            from neo.io.binary_writer import BinaryWriter
+
+            # Reserve the exact buffer when the size is already known.
+            writer = BinaryWriter.sized(self._size or 0)
+            self.serialize(writer)
+            self._raw = writer.to_bytes()
+        return self._raw
 
     @property
     def sender(self) -> bytes:
@@ -61,20 +119,28 @@ class Transaction:
     @property
     def size(self) -> int:
         """Get the serialized size."""
-        from neo.network.payloads.witness import _get_var_size
+        if self._size is None:
+            self._size = len(self._raw) if self._raw is not None else self._compute_size()
+        return self._size
+
+    def _compute_size(self) -> int:
+        from neo.io.binary_writer import get_var_size
 
         size = HEADER_SIZE
-        size += _get_var_size(len(self.signers))
+        size += get_var_size(len(self.signers))
         size += sum(s.size for s in self.signers)
-        size += _get_var_size(len(self.attributes))
+        size += get_var_size(len(self.attributes))
         size += sum(a.size for a in self.attributes)
-        size += _get_var_size(len(self.script)) + len(self.script)
-        size += _get_var_size(len(self.witnesses))
+        size += get_var_size(len(self.script)) + len(self.script)
+        size += get_var_size(len(self.witnesses))
         size += sum(w.size for w in self.witnesses)
         return size
 
     def serialize_unsigned(self, writer: "BinaryWriter") -> None:
         """Serialize the unsigned transaction."""
+        if self._unsigned is not None:
+            writer.write_bytes(self._unsigned)
+            return
         writer.write_byte(self.version)
         writer.write_uint32(self.nonce)
         writer.write_int64(self.system_fee)
@@ -90,6 +156,9 @@ class Transaction:
 
     def serialize(self, writer: "BinaryWriter") -> None:
         """Serialize the full transaction."""
+        if self._raw is not None:
+            writer.write_bytes(self._raw)
+            return
         self.serialize_unsigned(writer)
         writer.write_var_int(len(self.witnesses))
         for witness in self.witnesses:
@@ -98,13 +167,16 @@ class Transaction:
     @classmethod
     def deserialize(cls, reader: "BinaryReader") -> "Transaction":
         """Deserialize a transaction."""
+        start = reader.position
         tx = cls._deserialize_unsigned(reader)
+        tx._unsigned = reader.get_span(start)
         witness_count = reader.read_var_int(len(tx.signers))
         from neo.network.payloads.witness import Witness
 
         tx.witnesses = [Witness.deserialize(reader) for _ in range(witness_count)]
         if len(tx.witnesses) != len(tx.signers):
             raise ValueError("Witness count must match signer count")
+        tx._raw = reader.get_span(start)
         return tx
 
     @classmethod
@@ -157,8 +157,8 @@ class OracleResponseAttribute(TransactionAttribute):
     
     @property
     def size(self) -> int:
-        from neo.network.payloads.witness import _get_var_size
-        return 1 + 8 + 1 + _get_var_size(len(self.result)) + len(self.result)
+        from neo.io.binary_writer import get_var_size
+        return 1 + 8 + 1 + get_var_size(len(self.result)) + len(self.result)
     
     def _serialize_without_type(self, writer: "BinaryWriter") -> None:
         writer.write_uint64(self.id)
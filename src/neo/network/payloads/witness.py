@@ -7,22 +7,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from neo.io.binary_writer import get_var_size
+
 if TYPE_CHECKING:
     from neo.io.binary_reader import BinaryReader
     from neo.io.binary_writer import BinaryWriter
 
 
-def _get_var_size(value: int) -> int:
-    """Get variable int size."""
-    if value < 0xFD:
-        return 1
-    elif value <= 0xFFFF:
-        return 3
-    elif value <= 0xFFFFFFFF:
-        return 5
-    return 9
-
-
 @dataclass
 class Witness:
     """Transaction witness containing invocation and verification scripts."""
@@ -37,9 +28,9 @@ class Witness:
     @property
     def size(self) -> int:
         """Get serialized size."""
-        return (_get_var_size(len(self.invocation_script)) + 
+        return (get_var_size(len(self.invocation_script)) + 
                 len(self.invocation_script) +
-                _get_var_size(len(self.verification_script)) + 
+                get_var_size(len(self.verification_script)) + 
                 len(self.verification_script))
     
     @property
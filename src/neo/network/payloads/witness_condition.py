@@ -239,8 +239,8 @@ class AndCondition(WitnessCondition):
     
     @property
     def size(self) -> int:
-        from neo.network.payloads.witness import _get_var_size
-        base = 1 + _get_var_size(len(self.expressions) if self.expressions else 0)
+        from neo.io.binary_writer import get_var_size
+        base = 1 + get_var_size(len(self.expressions) if self.expressions else 0)
         return base + sum(e.size for e in (self.expressions or []))
     
     def serialize(self, writer: BinaryWriter) -> None:
@@ -269,8 +269,8 @@ class OrCondition(WitnessCondition):
     
     @property
     def size(self) -> int:
-        from neo.network.payloads.witness import _get_var_size
-        base = 1 + _get_var_size(len(self.expressions) if self.expressions else 0)
+        from neo.io.binary_writer import get_var_size
+        base = 1 + get_var_size(len(self.expressions) if self.expressions else 0)
         return base + sum(e.size for e in (self.expressions or []))
     
     def serialize(self, writer: BinaryWriter) -> None:
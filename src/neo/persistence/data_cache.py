@@ -7,10 +7,44 @@ Reference: Neo.Persistence.DataCache
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, cast
 
 from neo.persistence.store import IReadOnlyStore, IStore
 from neo.persistence.track_state import TrackState
 
+if TYPE_CHECKING:
+    from neo.native.fungible_token import FungibleToken
+
+
+def _merge_seek(
+    overlay: list[tuple[bytes, bytes | None]],
+    base: Iterator[tuple[bytes, bytes]],
+    direction: int = 1,
+) -> Iterator[tuple[bytes, bytes]]:
+    """Lazily merge a frozen overlay over an ordered base cursor.
+
+    Both inputs must already be ordered in ``direction``. Overlay entries
+    win on equal keys; a ``None`` overlay value hides the base entry.
+    """
+    backward = direction < 0
+    pending = iter(overlay)
+    head = next(pending, None)
+    for key, value in base:
+        while head is not None and (head[0] > key if backward else head[0] < key):
+            if head[1] is not None:
+                yield head  # type: ignore[misc]
+            head = next(pending, None)
+        if head is not None and head[0] == key:
+            if head[1] is not None:
+                yield head  # type: ignore[misc]
+            head = next(pending, None)
+            continue
+        yield key, value
+    while head is not None:
+        if head[1] is not None:
+            yield head  # type: ignore[misc]
+        head = next(pending, None)
+
 
 class Trackable:
     """Trackable cache entry."""
@@ -31,6 +65,16 @@ class DataCache:
     def __init__(self, store: IReadOnlyStore):
         self._store = store
         self._cache: dict[bytes, Trackable] = {}
+        self._commits = 0
+
+    @property
+    def commit_version(self) -> tuple[int, ...]:
+        """Changes whenever a clone commits into this cache or an ancestor.
+
+        Values derived from the cache's contents can be tagged with it and
+        rebuilt once it moves on.
+        """
+        return (self._commits,)
 
     def get(self, key: bytes) -> bytes | None:
         """Get value from cache or store."""
@@ -152,11 +196,22 @@ class DataCache:
             yield key, results[key]
 
     def seek(self, prefix: bytes, direction: int = 1) -> Iterator[tuple[bytes, bytes]]:
-        """Seek with direction (1=forward, -1=backward)."""
-        items = list(self.find(prefix))
-        if direction < 0:
-            items.reverse()
-        yield from items
+        """Seek with direction (1=forward, -1=backward).
+
+        The cached entries under ``prefix`` are frozen when this is called,
+        so later writes to the cache are not observed; store entries are
+        streamed lazily and merged in key order.
+        """
+        overlay = sorted(
+            (
+                (key, None if t.state == TrackState.DELETED else t.value)
+                for key, t in self._cache.items()
+                if key.startswith(prefix)
+            ),
+            key=lambda entry: entry[0],
+            reverse=direction < 0,
+        )
+        return _merge_seek(overlay, self._store.seek(prefix, direction), direction)
     
     def get_change_set(self) -> Iterator[Trackable]:
         """Get all changed entries."""
@@ -177,6 +232,15 @@ class DataCache:
         
         self._cache.clear()
 
+    def get_gas_balance(self, account: Any) -> int:
+        """GAS balance of ``account``, as the mempool and verifier read it."""
+        from neo.native.native_contract import NativeContract
+
+        gas = cast("FungibleToken | None", NativeContract.get_contract_by_name("GasToken"))
+        if gas is None:
+            return 0
+        return gas.balance_of(self, account)
+
 
 class ClonedCache(DataCache):
     """A cloned cache that can be committed to parent cache."""
@@ -184,6 +248,12 @@ class ClonedCache(DataCache):
     def __init__(self, parent: DataCache):
         self._parent = parent
         self._cache: dict[bytes, Trackable] = {}
+        self._commits = 0
+
+    @property
+    def commit_version(self) -> tuple[int, ...]:
+        """Changes whenever a clone commits into this cache or an ancestor."""
+        return self._parent.commit_version + (self._commits,)
 
     def get(self, key: bytes) -> bytes | None:
         """Get from local cache or parent."""
@@ -289,11 +359,17 @@ class ClonedCache(DataCache):
             yield key, results[key]
 
     def seek(self, prefix: bytes, direction: int = 1) -> Iterator[tuple[bytes, bytes]]:
-        """Seek with direction, merging parent and local."""
-        items = list(self.find(prefix))
-        if direction < 0:
-            items.reverse()
-        yield from items
+        """Seek with direction, lazily merging local changes over the parent."""
+        overlay = sorted(
+            (
+                (key, None if t.state == TrackState.DELETED else t.value)
+                for key, t in self._cache.items()
+                if key.startswith(prefix) and t.state != TrackState.NONE
+            ),
+            key=lambda entry: entry[0],
+            reverse=direction < 0,
+        )
+        return _merge_seek(overlay, self._parent.seek(prefix, direction), direction)
 
     def commit(self) -> None:
         """Commit changes to parent cache."""
@@ -305,3 +381,4 @@ class ClonedCache(DataCache):
             elif t.state == TrackState.DELETED:
                 self._parent.delete(t.key)
         self._cache.clear()
+        self._parent._commits += 1
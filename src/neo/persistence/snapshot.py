@@ -10,6 +10,7 @@ from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
+from neo.persistence.data_cache import _merge_seek
 from neo.persistence.store import IStore
 
 
@@ -50,6 +51,17 @@ class Snapshot(ABC):
         """Commit changes."""
         pass
 
+    def seek(self, prefix: bytes, direction: int = 1) -> Iterator[tuple[bytes, bytes]]:
+        """Ordered cursor over ``prefix`` (1=forward, -1=backward).
+
+        Results reflect the snapshot at call time; writes made afterwards
+        are not observed.
+        """
+        items = list(self.find(prefix))
+        if direction < 0:
+            items.reverse()
+        return iter(items)
+
     def try_get(self, key: bytes) -> bytes | None:
         """Try to get a value by key. Returns None if not found."""
         return self.get(key)
@@ -95,9 +107,13 @@ class Snapshot(ABC):
         """Delete storage value."""
         self.delete(key)
 
-@dataclass
+@dataclass(eq=False)
 class MemorySnapshot(Snapshot):
-    """In-memory snapshot implementation."""
+    """In-memory snapshot implementation.
+
+    Snapshots compare by identity, so native contracts can key their
+    per-snapshot caches on them.
+    """
     
     _store: dict[bytes, bytes] = field(default_factory=dict)
     _changes: dict[bytes, bytes | None] = field(default_factory=dict)
@@ -136,6 +152,24 @@ class MemorySnapshot(Snapshot):
         for key in sorted(results):
             yield key, results[key]
 
+    def seek(self, prefix: bytes, direction: int = 1) -> Iterator[tuple[bytes, bytes]]:
+        """Lazy ordered cursor; pending changes are frozen at call time."""
+        backward = direction < 0
+        overlay = sorted(
+            ((k, v) for k, v in self._changes.items() if k.startswith(prefix)),
+            key=lambda entry: entry[0],
+            reverse=backward,
+        )
+        keys = sorted((k for k in self._store if k.startswith(prefix)), reverse=backward)
+        return _merge_seek(overlay, self._store_cursor(keys), direction)
+
+    def _store_cursor(self, keys: list[bytes]) -> Iterator[tuple[bytes, bytes]]:
+        store = self._store
+        for key in keys:
+            value = store.get(key)
+            if value is not None:
+                yield key, value
+
     def commit(self) -> None:
         for key, value in self._changes.items():
             if value is None:
@@ -223,6 +257,15 @@ class StoreSnapshot(Snapshot):
         # Yield sorted for deterministic ordering
         for key in sorted(results):
             yield key, results[key]
+
+    def seek(self, prefix: bytes, direction: int = 1) -> Iterator[tuple[bytes, bytes]]:
+        """Lazy ordered cursor; pending changes are frozen at call time."""
+        overlay = sorted(
+            ((k, v) for k, v in self._changes.items() if k.startswith(prefix)),
+            key=lambda entry: entry[0],
+            reverse=direction < 0,
+        )
+        return _merge_seek(overlay, self._store.seek(prefix, direction), direction)
     
     def commit(self) -> None:
         for key, value in self._changes.items():
@@ -12,23 +12,30 @@ The ApplicationEngine extends the base VM ExecutionEngine with:
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from neo.exceptions import InvalidOperationException, OutOfGasException
 from neo.smartcontract.call_flags import CallFlags
+from neo.smartcontract.capture_policy import FULL_CAPTURE, CaptureMode, CapturePolicy
+from neo.smartcontract.storage.storage_key import StorageKey
 from neo.smartcontract.trigger import TriggerType
 from neo.vm.execution_context import ExecutionContext
-from neo.vm.execution_engine import ExecutionEngine, VMState  # noqa: F401 (re-exported)
+from neo.vm.execution_engine import ExecutionEngine, VMState
 from neo.vm.types import NULL, Array, ByteString, Integer, StackItem
 
 if TYPE_CHECKING:
+    from neo.native.native_contract import ContractMethodMetadata
+    from neo.native.neo_token import NeoToken
     from neo.persistence import Snapshot
     from neo.types import UInt160
 
 # Sentinel key for storing CallFlags in ExecutionContext._shared_states.states
 _CALL_FLAGS_KEY = "call_flags"
+# Sentinel key for caching the script hash in ExecutionContext._shared_states.states
+_SCRIPT_HASH_KEY = "script_hash"
 
 
 # Gas costs
@@ -62,6 +69,21 @@ class LogEntry:
     message: str
 
 
+@dataclass
+class CallTarget:
+    """Resolved contract-call target for one (contract, method, arg count).
+
+    Native targets carry the resolved method overload; deployed targets
+    carry the ABI parameter count and the script extracted from the NEF.
+    """
+
+    contract: Any
+    native_method: ContractMethodMetadata | None = None
+    expected_params: int | None = None
+    script: bytes | None = None
+    script_hash: bytes | None = None
+
+
 class ApplicationEngine(ExecutionEngine):
     """Neo N3 Application Engine.
 
@@ -84,6 +106,7 @@ class ApplicationEngine(ExecutionEngine):
         script_container: Any | None = None,
         network: int = 860833102,
         protocol_settings: Any | None = None,
+        capture_policy: CapturePolicy | None = None,
         **kwargs,
     ):
         """Initialize the application engine."""
@@ -105,14 +128,33 @@ class ApplicationEngine(ExecutionEngine):
                     pass
 
         # Execution state
+        self.capture_policy = capture_policy if capture_policy is not None else FULL_CAPTURE
         self._notifications: list[Notification] = []
         self._logs: list[LogEntry] = []
+        self._notification_count = 0
+        self._log_count = 0
+        self._notification_counts: Counter[tuple[UInt160, str]] = Counter()
+        # Entries before these positions have already been through the policy.
+        self._captured_notifications = 0
+        self._captured_logs = 0
         self._invocation_counters: dict[bytes, int] = {}
         self._random_counter: int = 0
         self._storage_contexts: dict[int, Any] = {}
         self._loaded_tokens: dict[int, Any] = {}
         self._default_call_flags: CallFlags = CallFlags.ALL
 
+        # CheckWitness caches: signers compiled once per script container,
+        # results memoized per (account, current hash, calling hash).
+        self._witness_signers: dict[bytes, Any] | None = None
+        self._witness_container: Any | None = None
+        self._witness_memo: dict[tuple[bytes, bytes | None, bytes | None], bool] = {}
+        self._contract_groups_cache: dict[bytes, frozenset[bytes]] = {}
+
+        # Contract-call caches, dropped by invalidate_contract_cache.
+        self._call_contracts: dict[bytes, Any] = {}
+        self._call_targets: dict[tuple[bytes, str, int], CallTarget] = {}
+        self._call_permissions: dict[tuple[bytes | None, bytes, str, int, int], bool] = {}
+
         # Native contract cache
         self._native_contracts: dict[bytes, Any] = {}
 
@@ -144,46 +186,63 @@ class ApplicationEngine(ExecutionEngine):
 
     @property
     def notifications(self) -> list[Notification]:
-        """Get all notifications."""
+        """Get the notifications, as retained by the capture policy once executed."""
         return self._notifications
 
     @property
     def logs(self) -> list[LogEntry]:
-        """Get all log entries."""
+        """Get the log entries, as retained by the capture policy once executed."""
         return self._logs
 
+    @property
+    def notification_count(self) -> int:
+        """Number of notifications emitted, independent of the capture policy."""
+        return self._notification_count
+
+    @property
+    def log_count(self) -> int:
+        """Number of log entries written, independent of the capture policy."""
+        return self._log_count
+
+    @property
+    def notification_counts(self) -> Counter[tuple[UInt160, str]]:
+        """Per (contract, event) tallies recorded under ``CaptureMode.COUNT``."""
+        return self._notification_counts
+
+    @staticmethod
+    def _context_script_hash(ctx: ExecutionContext) -> UInt160:
+        """Script hash of ``ctx``, computed once per loaded script."""
+        states = ctx._shared_states.states
+        script_hash = states.get(_SCRIPT_HASH_KEY)
+        if script_hash is None:
+            from neo.crypto import hash160
+            from neo.types import UInt160
+
+            script_hash = UInt160(hash160(ctx.script))
+            states[_SCRIPT_HASH_KEY] = script_hash
+        return script_hash
+
     @property
     def current_script_hash(self) -> UInt160 | None:
         """Get script hash of current context."""
-        from neo.crypto import hash160
-        from neo.types import UInt160
-
         ctx = self.current_context
         if ctx is None:
             return None
-        return UInt160(hash160(ctx.script))
+        return self._context_script_hash(ctx)
 
     @property
     def calling_script_hash(self) -> UInt160 | None:
         """Get script hash of calling context."""
-        from neo.crypto import hash160
-        from neo.types import UInt160
-
         if len(self.invocation_stack) < 2:
             return None
-        ctx = self.invocation_stack[-2]
-        return UInt160(hash160(ctx.script))
+        return self._context_script_hash(self.invocation_stack[-2])
 
     @property
     def entry_script_hash(self) -> UInt160 | None:
         """Get script hash of entry context."""
-        from neo.crypto import hash160
-        from neo.types import UInt160
-
         if not self.invocation_stack:
             return None
-        ctx = self.invocation_stack[0]
-        return UInt160(hash160(ctx.script))
+        return self._context_script_hash(self.invocation_stack[0])
 
     def add_gas(self, amount: int) -> None:
         """Add gas consumption and check limit."""
@@ -223,17 +282,66 @@ class ApplicationEngine(ExecutionEngine):
         if (
             _is_hardfork_enabled(self, Hardfork.HF_ECHIDNA)
             and self.trigger == TriggerType.APPLICATION
-            and len(self._notifications) >= self.MAX_NOTIFICATION_COUNT
+            and self._notification_count >= self.MAX_NOTIFICATION_COUNT
         ):
             raise InvalidOperationException(
                 f"Maximum number of notifications `{self.MAX_NOTIFICATION_COUNT}` is reached."
             )
+        self._notification_count += 1
         self._notifications.append(Notification(script_hash, event_name, state))
 
     def write_log(self, script_hash: UInt160, message: str) -> None:
         """Write a log entry."""
+        self._log_count += 1
         self._logs.append(LogEntry(script_hash, message))
 
+    def execute(self) -> VMState:
+        """Run the loaded scripts, then apply the capture policy."""
+        try:
+            return super().execute()
+        finally:
+            self._apply_capture_policy()
+
+    def _apply_capture_policy(self) -> None:
+        """Trim this execution's events to the policy and stream them out.
+
+        Every event is kept while the scripts run so GetNotifications sees
+        the exact list; only what is retained and exported afterwards
+        depends on the policy. COUNT tallies and the sink only reflect
+        executions that ended in HALT.
+        """
+        policy = self.capture_policy
+        halted = self.state == VMState.HALT
+        notifications = self._notifications[self._captured_notifications :]
+        logs = self._logs[self._captured_logs :]
+        if policy.mode != CaptureMode.FULL:
+            del self._notifications[self._captured_notifications :]
+            del self._logs[self._captured_logs :]
+            counts = self._notification_counts
+            for notification in notifications:
+                script_hash, event_name = notification.script_hash, notification.event_name
+                if policy.retains(script_hash, event_name):
+                    self._notifications.append(notification)
+                elif (
+                    halted
+                    and policy.mode == CaptureMode.COUNT
+                    and policy.selects(script_hash, event_name)
+                ):
+                    counts[(script_hash, event_name)] += 1
+            self._logs.extend(log for log in logs if policy.retains(log.script_hash))
+        self._captured_notifications = len(self._notifications)
+        self._captured_logs = len(self._logs)
+
+        sink = policy.sink
+        if sink is None or not halted:
+            return
+        for notification in notifications:
+            if policy.selects(notification.script_hash, notification.event_name):
+                sink(notification)
+        for log in logs:
+            if policy.selects(log.script_hash):
+                sink(log)
+
     def _handle_syscall(self, engine: ExecutionEngine, hash_val: int) -> None:
         """Handle syscall invocation."""
         from neo.smartcontract.interop_service import invoke_syscall
@@ -281,7 +389,7 @@ class ApplicationEngine(ExecutionEngine):
         args.reverse()  # Arguments were pushed in order, popped in reverse
 
         # Look up the contract
-        contract = self._get_contract(contract_hash)
+        contract = self._get_call_contract(contract_hash)
         if contract is None:
             raise InvalidOperationException(f"Contract not found: {contract_hash}")
 
@@ -291,7 +399,7 @@ class ApplicationEngine(ExecutionEngine):
 
         # Enforce method availability + caller permissions just like
         # System.Contract.Call dynamic dispatch.
-        if not self._check_method_permission(contract, method, call_flags):
+        if not self._check_call_permission(contract, method, params_count, call_flags):
             raise InvalidOperationException(f"Method not allowed: {method}")
 
         # Create arguments array
@@ -478,7 +586,6 @@ class ApplicationEngine(ExecutionEngine):
     def _check_witness_internal(self, account_hash: UInt160) -> bool:
         """Internal witness check against transaction signers."""
         from neo.smartcontract.call_flags import CallFlags
-        from neo.types import UInt160
 
         calling_hash = self.calling_script_hash
         if calling_hash is not None and calling_hash == account_hash:
@@ -490,22 +597,18 @@ class ApplicationEngine(ExecutionEngine):
 
         # Check if account hash matches any transaction signer first.
         tx = self.script_container
-        if hasattr(tx, "signers") and tx.signers:
-            for signer in tx.signers:
-                signer_account = getattr(signer, "account", None)
-                if signer_account is None:
-                    continue
-
-                if isinstance(signer_account, UInt160):
-                    account_matches = signer_account == account_hash
-                elif isinstance(signer_account, (bytes, bytearray)):
-                    account_matches = bytes(signer_account) == bytes(account_hash)
-                else:
-                    account_matches = False
-
-                if account_matches:
-                    # Found matching signer - check witness scope
-                    return self._check_witness_scope(signer)
+        account_bytes = bytes(account_hash)
+        signer = self._compiled_witness_signers().get(account_bytes)
+        if signer is not None:
+            frame = self._witness_frame()
+            if not self.invocation_stack:
+                return signer.check(frame)
+            key = (account_bytes, frame.current, frame.calling)
+            result = self._witness_memo.get(key)
+            if result is None:
+                result = signer.check(frame)
+                self._witness_memo[key] = result
+            return result
 
         # Non-transaction script containers (e.g., blocks) may provide
         # script hashes for verifying. Neo requires READ_STATES for this path.
@@ -529,52 +632,88 @@ class ApplicationEngine(ExecutionEngine):
 
         return False
 
-    def _check_witness_scope(self, signer) -> bool:
-        """Check if the signer's scope allows the current call."""
-        from neo.ledger.witness_scope import WitnessScope
+    def _compiled_witness_signers(self) -> dict[bytes, Any]:
+        """Signers of the script container compiled by account, first match wins."""
+        from neo.smartcontract.witness_evaluator import CompiledSigner
+        from neo.types import UInt160
 
-        scope = signer.scopes
+        tx = self.script_container
+        if self._witness_signers is None or self._witness_container is not tx:
+            compiled: dict[bytes, Any] = {}
+            for signer in getattr(tx, "signers", None) or []:
+                signer_account = getattr(signer, "account", None)
+                if not isinstance(signer_account, (UInt160, bytes, bytearray)):
+                    continue
+                account = bytes(signer_account)
+                if account not in compiled:
+                    compiled[account] = CompiledSigner(signer)
+            self._witness_signers = compiled
+            self._witness_container = tx
+            self._witness_memo.clear()
+        return self._witness_signers
+
+    def _witness_frame(self) -> Any:
+        """Describe the current call site for witness evaluation."""
+        from neo.smartcontract.witness_evaluator import WitnessFrame
+
+        return WitnessFrame(self)
+
+    def _contract_groups(self, contract_hash: bytes) -> frozenset[bytes]:
+        """Group public keys declared in a contract's manifest (cached)."""
+        from neo.types import UInt160
 
-        # Global scope allows everything
-        if scope & WitnessScope.GLOBAL:
-            return True
+        groups = self._contract_groups_cache.get(contract_hash)
+        if groups is not None:
+            return groups
+        groups = frozenset()
+        contract = self._get_contract(UInt160(contract_hash))
+        manifest = self._parse_contract_manifest(contract) if contract is not None else None
+        declared = manifest.get("groups", []) if manifest is not None else []
+        if isinstance(declared, list):
+            groups = frozenset(
+                group_bytes
+                for group in declared
+                if (group_bytes := self._coerce_group_to_bytes(
+                    group.get("pubkey", "") if isinstance(group, dict) else group
+                )) is not None
+            )
+        self._contract_groups_cache[contract_hash] = groups
+        return groups
+
+    def invalidate_contract_cache(self, contract_hash: UInt160) -> None:
+        """Drop cached state derived from a contract that was deployed, updated or destroyed."""
+        key = bytes(contract_hash)
+        self._contract_groups_cache.pop(key, None)
+        self._witness_memo.clear()
+        self._call_contracts.pop(key, None)
+        for target_key in [k for k in self._call_targets if k[0] == key]:
+            del self._call_targets[target_key]
+        # The contract may have been a caller, so its manifest permissions
+        # feed verdicts keyed on other callees too.
+        self._call_permissions.clear()
+
+    def get_next_block_validators(self) -> list[bytes]:
+        """Validators of the next block, as used by GasToken.OnPersist."""
+        from neo.native.native_contract import NativeContract
 
-        # CalledByEntry - valid if current IS entry or caller IS entry
-        if scope & WitnessScope.CALLED_BY_ENTRY:
-            if self.current_script_hash == self.entry_script_hash:
-                return True
-            if self.calling_script_hash == self.entry_script_hash:
-                return True
+        neo = cast("NeoToken | None", NativeContract.get_contract_by_name("NeoToken"))
+        return neo.get_next_block_validators(self) if neo is not None else []
 
-        # CustomContracts - check if current contract is in allowed list
-        if scope & WitnessScope.CUSTOM_CONTRACTS:
-            current_hash = self.current_script_hash
-            if current_hash is not None:
-                current_hash_bytes = bytes(current_hash)
-                for allowed_contract in getattr(signer, "allowed_contracts", []):
-                    allowed_bytes = self._coerce_hash160_to_bytes(allowed_contract)
-                    if allowed_bytes is not None and allowed_bytes == current_hash_bytes:
-                        return True
-
-        # CustomGroups - check if current contract belongs to an allowed group
-        if scope & WitnessScope.CUSTOM_GROUPS:
-            if self._check_witness_groups(signer):
-                return True
+    @staticmethod
+    def get_script_hash_from_pubkey(pubkey: bytes) -> UInt160:
+        """Script hash of the single-signature contract for ``pubkey``."""
+        from neo.smartcontract.syscalls.contract import _create_signature_redeem_script
 
-        # Check WitnessRules scope
-        if scope & WitnessScope.WITNESS_RULES:
-            rules = getattr(signer, "rules", [])
-            for rule in rules:
-                action = self._coerce_witness_rule_action(getattr(rule, "action", None))
-                condition = getattr(rule, "condition", None)
-                if condition is not None and action is not None:
-                    if self._evaluate_witness_condition(condition):
-                        if action == 1:  # Allow
-                            return True
-                        elif action == 0:  # Deny
-                            return False
+        from neo.crypto import hash160
+        from neo.types import UInt160
 
-        return False
+        return UInt160(hash160(_create_signature_redeem_script(bytes(pubkey))))
+
+    def _check_witness_scope(self, signer) -> bool:
+        """Check if the signer's scope allows the current call."""
+        from neo.smartcontract.witness_evaluator import CompiledSigner
+
+        return CompiledSigner(signer).check(self._witness_frame())
 
     def _check_witness_groups(self, signer) -> bool:
         """Check if the current contract belongs to one of the signer's allowed groups.
@@ -582,25 +721,6 @@ class ApplicationEngine(ExecutionEngine):
         Looks up the current contract's manifest, then checks whether any
         of its group public keys appear in ``signer.allowed_groups``.
         """
-        current_hash = self.current_script_hash
-        if current_hash is None:
-            return False
-
-        contract = self._get_contract(current_hash)
-        if contract is None:
-            return False
-
-        manifest = self._parse_contract_manifest(contract)
-        if manifest is None:
-            return False
-
-        groups = manifest.get("groups", [])
-        if not isinstance(groups, list):
-            return False
-
-        if not groups:
-            return False
-
         allowed = {
             group_bytes
             for group in (signer.allowed_groups or [])
@@ -608,14 +728,7 @@ class ApplicationEngine(ExecutionEngine):
         }
         if not allowed:
             return False
-
-        for group in groups:
-            group_value = group.get("pubkey", "") if isinstance(group, dict) else group
-            group_bytes = self._coerce_group_to_bytes(group_value)
-            if group_bytes is not None and group_bytes in allowed:
-                return True
-
-        return False
+        return not self._witness_frame().current_groups().isdisjoint(allowed)
 
     def _evaluate_witness_condition(self, condition) -> bool:
         """Evaluate a WitnessCondition for WitnessRules scope.
@@ -631,98 +744,9 @@ class ApplicationEngine(ExecutionEngine):
         - CalledByContract (0x28): calling script matches hash
         - CalledByGroup (0x29): calling contract matches group
         """
-        cond_type = getattr(condition, "type", None)
+        from neo.smartcontract.witness_evaluator import compile_condition
 
-        # Boolean
-        if cond_type == 0x00:
-            return bool(getattr(condition, "expression", False))
-
-        # Not
-        if cond_type == 0x01:
-            inner = getattr(condition, "expression", None)
-            if inner is None:
-                return False
-            return not self._evaluate_witness_condition(inner)
-
-        # And
-        if cond_type == 0x02:
-            expressions = getattr(condition, "expressions", [])
-            return all(self._evaluate_witness_condition(e) for e in expressions)
-
-        # Or
-        if cond_type == 0x03:
-            expressions = getattr(condition, "expressions", [])
-            return any(self._evaluate_witness_condition(e) for e in expressions)
-
-        # ScriptHash
-        if cond_type == 0x18:
-            target_hash = getattr(condition, "hash", None)
-            if target_hash is None:
-                return False
-            current = self.current_script_hash
-            if current is None:
-                return False
-            return bytes(current) == bytes(target_hash)
-
-        # Group
-        if cond_type == 0x19:
-            target_group = getattr(condition, "group", None)
-            target_group_bytes = self._coerce_group_to_bytes(target_group)
-            if target_group_bytes is None:
-                return False
-            current = self.current_script_hash
-            if current is None:
-                return False
-            contract = self._get_contract(current)
-            if contract is None:
-                return False
-            manifest = self._parse_contract_manifest(contract)
-            if manifest is None:
-                return False
-            for g in manifest.get("groups", []):
-                group_value = g.get("pubkey", "") if isinstance(g, dict) else g
-                group_bytes = self._coerce_group_to_bytes(group_value)
-                if group_bytes is not None and group_bytes == target_group_bytes:
-                    return True
-            return False
-
-        # CalledByEntry
-        if cond_type == 0x20:
-            return self.current_script_hash == self.entry_script_hash
-
-        # CalledByContract
-        if cond_type == 0x28:
-            target_hash = getattr(condition, "hash", None)
-            if target_hash is None:
-                return False
-            calling = self.calling_script_hash
-            if calling is None:
-                return False
-            return bytes(calling) == bytes(target_hash)
-
-        # CalledByGroup
-        if cond_type == 0x29:
-            target_group = getattr(condition, "group", None)
-            target_group_bytes = self._coerce_group_to_bytes(target_group)
-            if target_group_bytes is None:
-                return False
-            calling = self.calling_script_hash
-            if calling is None:
-                return False
-            contract = self._get_contract(calling)
-            if contract is None:
-                return False
-            manifest = self._parse_contract_manifest(contract)
-            if manifest is None:
-                return False
-            for g in manifest.get("groups", []):
-                group_value = g.get("pubkey", "") if isinstance(g, dict) else g
-                group_bytes = self._coerce_group_to_bytes(group_value)
-                if group_bytes is not None and group_bytes == target_group_bytes:
-                    return True
-            return False
-
-        return False
+        return compile_condition(condition)(self._witness_frame())
 
     def _runtime_get_invocation_counter(self, engine: ApplicationEngine) -> None:
         """Get invocation counter for current script."""
@@ -846,10 +870,11 @@ class ApplicationEngine(ExecutionEngine):
 
         if isinstance(contract, NativeContract):
             manifest = getattr(contract, "manifest", None)
+            native_abi = getattr(manifest, "abi", None)
             # Native manifests may be objects or JSON; normalise to events list.
-            if hasattr(manifest, "abi") and hasattr(manifest.abi, "events"):
+            if native_abi is not None and hasattr(native_abi, "events"):
                 result = []
-                for ev in manifest.abi.events:
+                for ev in native_abi.events:
                     result.append(
                         {
                             "name": getattr(ev, "name", None),
@@ -1373,8 +1398,7 @@ class ApplicationEngine(ExecutionEngine):
         This matches the C# reference ``StorageKey`` implementation where
         the first 4 bytes are the contract's integer ID in little-endian.
         """
-        contract_id_bytes = ctx.id.to_bytes(4, byteorder="little", signed=True)
-        return contract_id_bytes + key
+        return StorageKey.encode(ctx.id, key)
 
     # Contract syscall implementations
     def _contract_call(self, engine: ApplicationEngine) -> None:
@@ -1402,12 +1426,14 @@ class ApplicationEngine(ExecutionEngine):
             raise InvalidOperationException("Invalid call flags")
 
         # Look up contract from storage
-        contract = self._get_contract(contract_hash)
+        contract = self._get_call_contract(contract_hash)
         if contract is None:
             raise InvalidOperationException(f"Contract not found: {contract_hash}")
 
         # Check if method exists and is callable
-        if not self._check_method_permission(contract, method, call_flags):
+        if not self._check_call_permission(
+            contract, method, self._count_call_args(args), call_flags
+        ):
             raise InvalidOperationException(f"Method not allowed: {method}")
 
         # Create new execution context for the called contract
@@ -1442,6 +1468,42 @@ class ApplicationEngine(ExecutionEngine):
         args_array = _Array(items=list(args)) if args else _Array()
         self._call_contract_internal(contract, method, args_array, CallFlags.ALL)
 
+    def _get_call_contract(self, contract_hash: UInt160) -> Any | None:
+        """Contract state for a call target, cached until the contract changes."""
+        key = bytes(contract_hash)
+        contract = self._call_contracts.get(key)
+        if contract is None:
+            contract = self._get_contract(contract_hash)
+            if contract is not None:
+                self._call_contracts[key] = contract
+        return contract
+
+    def _check_call_permission(
+        self, contract: Any, method: str, pcount: int, flags: CallFlags
+    ) -> bool:
+        """Memoized :meth:`_check_method_permission` keyed by call site.
+
+        The verdict depends on the caller's manifest, the callee's ABI and
+        the requested flags, all of which are fixed until a contract is
+        deployed, updated or destroyed.
+        """
+        target_hash = getattr(contract, "hash", None)
+        if target_hash is None:
+            return self._check_method_permission(contract, method, flags)
+        caller = self.calling_script_hash if len(self.invocation_stack) >= 2 else None
+        key = (
+            bytes(caller) if caller is not None else None,
+            bytes(target_hash),
+            method,
+            pcount,
+            int(flags),
+        )
+        verdict = self._call_permissions.get(key)
+        if verdict is None:
+            verdict = self._check_method_permission(contract, method, flags)
+            self._call_permissions[key] = verdict
+        return verdict
+
     def _check_call_flags(self, flags: int | CallFlags) -> bool:
         """Check if the requested call flags are allowed by current context."""
         requested = CallFlags(int(flags))
@@ -1789,19 +1851,11 @@ class ApplicationEngine(ExecutionEngine):
         self._assert_not_blocked(contract)
 
         arg_count = self._count_call_args(args)
+        target = self._resolve_call_target(contract, method, arg_count)
 
         if isinstance(contract, NativeContract):
-            # C# resolves the overload by arg count: GetMethod(method, args.Count)
-            # (ApplicationEngine.cs:572). Mirror that so a call with N args selects
-            # the active variant declaring N parameters, then re-assert the count
-            # (ApplicationEngine.cs:608).
-            metadata = self._resolve_native_method(contract, method, arg_count)
-            if metadata is None:
-                raise InvalidOperationException(
-                    f'Method "{method}" with {arg_count} parameter(s) doesn\'t exist '
-                    f"in native contract {contract.name}."
-                )
-
+            metadata = target.native_method
+            assert metadata is not None, "native targets carry their method"
             required = int(metadata.required_call_flags)
             requested = int(flags)
             if (requested & required) != required:
@@ -1831,31 +1885,16 @@ class ApplicationEngine(ExecutionEngine):
                 self._current_call_flags = previous_flags
             return
 
-        # Deployed contracts: C# resolves the ABI overload by arg count
-        # (GetMethod(method, args.Count)) and re-asserts the count in
-        # CallContractInternal (ApplicationEngine.cs:608). Mirror that here so a
-        # call whose declared ABI method takes N parameters faults unless N args
-        # were supplied. When the ABI parameter count cannot be determined (e.g.
-        # ad-hoc/test contracts with no parsable manifest), skip the check.
-        expected_params = self._abi_method_parameter_count(contract, method, arg_count)
-        if expected_params is not None and arg_count != expected_params:
+        if target.expected_params is not None and arg_count != target.expected_params:
             raise InvalidOperationException(
                 f'Method "{method}" with {arg_count} parameter(s) doesn\'t exist '
                 f"in the contract {getattr(contract, 'hash', '')}."
             )
 
-        # Get the contract script (NEF)
-        if hasattr(contract, "nef"):
-            script = self._extract_script_from_nef(contract.nef)
-        elif hasattr(contract, "script"):
-            script = contract.script
-        else:
-            raise InvalidOperationException("Contract has no executable script")
+        script: bytes = target.script  # type: ignore[assignment]
+        script_hash: bytes = target.script_hash  # type: ignore[assignment]
 
         # Track invocation count
-        from neo.crypto import hash160
-
-        script_hash = hash160(script)
         self._invocation_counters[script_hash] = self._invocation_counters.get(script_hash, 0) + 1
 
         # Push arguments onto stack for the called method
@@ -1872,6 +1911,61 @@ class ApplicationEngine(ExecutionEngine):
         # The caller's context retains its own flags untouched.
         self._current_call_flags = flags
 
+    def _resolve_call_target(self, contract: Any, method: str, arg_count: int) -> CallTarget:
+        """Resolve (and memoize) what a call to ``contract.method`` executes.
+
+        Targets are cached per (contract hash, method, arg count) and reused
+        only for the same contract object, so callers passing ad-hoc
+        contract states never see another contract's script.
+        """
+        from neo.crypto import hash160
+        from neo.native.native_contract import NativeContract
+
+        contract_hash = getattr(contract, "hash", None)
+        key = (bytes(contract_hash), method, arg_count) if contract_hash is not None else None
+        if key is not None:
+            cached = self._call_targets.get(key)
+            if cached is not None and cached.contract is contract:
+                return cached
+
+        if isinstance(contract, NativeContract):
+            # C# resolves the overload by arg count: GetMethod(method, args.Count)
+            # (ApplicationEngine.cs:572). Mirror that so a call with N args selects
+            # the active variant declaring N parameters, then re-assert the count
+            # (ApplicationEngine.cs:608).
+            metadata = self._resolve_native_method(contract, method, arg_count)
+            if metadata is None:
+                raise InvalidOperationException(
+                    f'Method "{method}" with {arg_count} parameter(s) doesn\'t exist '
+                    f"in native contract {contract.name}."
+                )
+            target = CallTarget(contract, native_method=metadata)
+        else:
+            # Deployed contracts: C# resolves the ABI overload by arg count
+            # (GetMethod(method, args.Count)) and re-asserts the count in
+            # CallContractInternal (ApplicationEngine.cs:608). When the ABI
+            # parameter count cannot be determined (e.g. ad-hoc/test contracts
+            # with no parsable manifest), the check is skipped.
+            expected_params = self._abi_method_parameter_count(contract, method, arg_count)
+
+            # Get the contract script (NEF)
+            if hasattr(contract, "nef"):
+                script = self._extract_script_from_nef(contract.nef)
+            elif hasattr(contract, "script"):
+                script = contract.script
+            else:
+                raise InvalidOperationException("Contract has no executable script")
+            target = CallTarget(
+                contract,
+                expected_params=expected_params,
+                script=script,
+                script_hash=hash160(script),
+            )
+
+        if key is not None:
+            self._call_targets[key] = target
+        return target
+
     @staticmethod
     def _count_call_args(args: StackItem | None) -> int:
         """Number of arguments supplied to a contract call.
@@ -2443,7 +2537,7 @@ class ApplicationEngine(ExecutionEngine):
         # Get the message to verify - this is the transaction hash
         # In Neo, CheckSig verifies against the script container's hash
         if self.script_container is not None and hasattr(self.script_container, "hash"):
-            message_hash = self.script_container.hash
+            message_hash = bytes(self.script_container.hash)
         else:
             # No script container - cannot verify
             self.push(Integer(0))
@@ -2485,16 +2579,18 @@ class ApplicationEngine(ExecutionEngine):
         from neo.hardfork import Hardfork
         from neo.smartcontract.interop_service import _is_hardfork_enabled
 
-        # C# pop order: pubkeys (top), signatures
-        pubkeys_item = self.pop()
-        signatures_item = self.pop()
+        # C# pop order: pubkeys (top), signatures. Each is either an Array or,
+        # as in standard multisig redeem scripts, a count followed by that
+        # many items (ApplicationEngine.Convert for array parameters).
+        pubkeys_item = self._pop_counted_items(self.pop())
+        signatures_item = self._pop_counted_items(self.pop())
 
         # Get the message hash from script container
         if self.script_container is None or not hasattr(self.script_container, "hash"):
             self.push(Integer(0))
             return
 
-        message_hash = self.script_container.hash
+        message_hash = bytes(self.script_container.hash)
 
         # Extract signatures and public keys from stack items
         try:
@@ -2568,6 +2664,18 @@ class ApplicationEngine(ExecutionEngine):
 
         self.push(Integer(1))
 
+    def _pop_counted_items(self, item: StackItem) -> StackItem | list[StackItem]:
+        """Expand an Integer count into that many popped items.
+
+        Arrays and other items are returned unchanged.
+        """
+        if not isinstance(item, Integer):
+            return item
+        count = int(item.get_integer())
+        if count < 0 or count > self.limits.max_stack_size:
+            raise InvalidOperationException(f"Invalid array parameter count: {count}")
+        return [self.pop() for _ in range(count)]
+
     # Iterator syscall implementations
     def _iterator_next(self, engine: ApplicationEngine) -> None:
         """Move iterator to next item.
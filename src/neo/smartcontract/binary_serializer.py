@@ -5,9 +5,7 @@ Reference: Neo.SmartContract.BinarySerializer
 
 from __future__ import annotations
 
-from io import BytesIO
-from typing import BinaryIO
-
+from neo.io.binary_writer import append_var_int
 from neo.vm.types import (
     Array,
     Boolean,
@@ -21,6 +19,9 @@ from neo.vm.types import (
     Struct,
 )
 
+# Marker pushed after a container's children; popping it leaves the container.
+_EXIT = object()
+
 
 class BinarySerializer:
     """Serialize and deserialize stack items to/from bytes.
@@ -33,104 +34,107 @@ class BinarySerializer:
 
     @classmethod
     def serialize(cls, item: StackItem, max_size: int = MAX_SIZE) -> bytes:
-        """Serialize a stack item to bytes."""
-        writer = BytesIO()
-        cls._serialize_item(item, writer, set())
-        result = writer.getvalue()
+        """Serialize a stack item to bytes.
 
-        if len(result) > max_size:
-            raise ValueError(f"Serialized size {len(result)} exceeds max {max_size}")
+        Items are written iteratively into a single ``bytearray``. Containers
+        on the current path are tracked in an enter/exit set, so cycles are
+        rejected in linear time while shared (acyclic) references are still
+        allowed. Serialization aborts as soon as the output exceeds
+        ``max_size`` or a container exceeds ``MAX_ITEMS``.
+        """
+        out = bytearray()
+        on_path: set[int] = set()
+        pending: list[object] = [item]
+        max_items = cls.MAX_ITEMS
+        write_var_int = append_var_int
 
-        return result
+        while pending:
+            current = pending.pop()
+            if current is _EXIT:
+                on_path.discard(pending.pop())  # type: ignore[arg-type]
+                continue
+
+            assert isinstance(current, StackItem)
+            item_type = current.type
+            out.append(item_type)
+
+            if item_type == StackItemType.ANY:
+                pass
+
+            elif item_type == StackItemType.BOOLEAN:
+                out.append(1 if current.get_boolean() else 0)
+
+            elif item_type == StackItemType.INTEGER:
+                if not isinstance(current, Integer):
+                    raise ValueError("Invalid Integer item")
+                int_value = int(current.value)
+                if int_value == 0:
+                    out.append(0)  # Zero length
+                else:
+                    if int_value > 0:
+                        byte_len = (int_value.bit_length() + 8) // 8
+                    else:
+                        byte_len = ((-int_value - 1).bit_length() + 8) // 8
+                    write_var_int(out, byte_len)
+                    out += int_value.to_bytes(byte_len, 'little', signed=True)
+
+            elif item_type == StackItemType.BYTESTRING:
+                if not isinstance(current, ByteString):
+                    raise ValueError("Invalid ByteString item")
+                data = current.value
+                write_var_int(out, len(data))
+                out += data
+
+            elif item_type == StackItemType.BUFFER:
+                if not isinstance(current, Buffer):
+                    raise ValueError("Invalid Buffer item")
+                buffer = current.value
+                write_var_int(out, len(buffer))
+                out += buffer
+
+            elif item_type in (StackItemType.ARRAY, StackItemType.STRUCT, StackItemType.MAP):
+                item_id = id(current)
+                if item_id in on_path:
+                    raise ValueError("Circular reference detected")
+
+                if item_type == StackItemType.MAP:
+                    if not isinstance(current, Map):
+                        raise ValueError("Invalid Map item")
+                    entries = list(current.items())
+                    if len(entries) > max_items:
+                        raise ValueError(f"Map too large: {len(entries)}")
+                    write_var_int(out, len(entries))
+                    children: list[StackItem] = []
+                    for key, map_value in reversed(entries):
+                        children.append(map_value)
+                        children.append(key)
+                else:
+                    if item_type == StackItemType.ARRAY:
+                        if not isinstance(current, Array):
+                            raise ValueError("Invalid Array item")
+                        kind = "Array"
+                    else:
+                        if not isinstance(current, Struct):
+                            raise ValueError("Invalid Struct item")
+                        kind = "Struct"
+                    children = list(current)
+                    if len(children) > max_items:
+                        raise ValueError(f"{kind} too large: {len(children)}")
+                    write_var_int(out, len(children))
+                    children.reverse()
+
+                on_path.add(item_id)
+                pending.append(item_id)
+                pending.append(_EXIT)
+                pending.extend(children)
 
-    @classmethod
-    def _serialize_item(cls, item: StackItem, writer: BinaryIO, seen: set[int]) -> None:
-        """Serialize a single stack item."""
-        item_type = item.type
-
-        if item_type in (StackItemType.ARRAY, StackItemType.STRUCT, StackItemType.MAP):
-            item_id = id(item)
-            if item_id in seen:
-                raise ValueError("Circular reference detected")
-            seen = seen | {item_id}
-
-        writer.write(bytes([item_type]))
-
-        if item_type == StackItemType.ANY:
-            return
-
-        if item_type == StackItemType.BOOLEAN:
-            writer.write(bytes([1 if item.get_boolean() else 0]))
-            return
-
-        if item_type == StackItemType.INTEGER:
-            if not isinstance(item, Integer):
-                raise ValueError("Invalid Integer item")
-            int_value = int(item.value)
-            if int_value == 0:
-                writer.write(bytes([0]))  # Zero length
-                return
-
-            if int_value > 0:
-                byte_len = (int_value.bit_length() + 8) // 8
             else:
-                byte_len = ((-int_value - 1).bit_length() + 8) // 8
-            data = int_value.to_bytes(byte_len, 'little', signed=True)
-            cls._write_var_int(writer, len(data))
-            writer.write(data)
-            return
-
-        if item_type == StackItemType.BYTESTRING:
-            if not isinstance(item, ByteString):
-                raise ValueError("Invalid ByteString item")
-            data = item.value
-            cls._write_var_int(writer, len(data))
-            writer.write(data)
-            return
-
-        if item_type == StackItemType.BUFFER:
-            if not isinstance(item, Buffer):
-                raise ValueError("Invalid Buffer item")
-            data = bytes(item.value)
-            cls._write_var_int(writer, len(data))
-            writer.write(data)
-            return
-
-        if item_type == StackItemType.ARRAY:
-            if not isinstance(item, Array):
-                raise ValueError("Invalid Array item")
-            items = list(item)
-            if len(items) > cls.MAX_ITEMS:
-                raise ValueError(f"Array too large: {len(items)}")
-            cls._write_var_int(writer, len(items))
-            for sub_item in items:
-                cls._serialize_item(sub_item, writer, seen)
-            return
-
-        if item_type == StackItemType.STRUCT:
-            if not isinstance(item, Struct):
-                raise ValueError("Invalid Struct item")
-            items = list(item)
-            if len(items) > cls.MAX_ITEMS:
-                raise ValueError(f"Struct too large: {len(items)}")
-            cls._write_var_int(writer, len(items))
-            for sub_item in items:
-                cls._serialize_item(sub_item, writer, seen)
-            return
-
-        if item_type == StackItemType.MAP:
-            if not isinstance(item, Map):
-                raise ValueError("Invalid Map item")
-            entries = list(item.items())
-            if len(entries) > cls.MAX_ITEMS:
-                raise ValueError(f"Map too large: {len(entries)}")
-            cls._write_var_int(writer, len(entries))
-            for key, map_value in entries:
-                cls._serialize_item(key, writer, seen)
-                cls._serialize_item(map_value, writer, seen)
-            return
-
-        raise ValueError(f"Cannot serialize type: {item_type}")
+                raise ValueError(f"Cannot serialize type: {item_type}")
+
+            if len(out) > max_size:
+                raise ValueError(f"Serialized size exceeds max {max_size}")
+
+        return bytes(out)
 
     # StackItem types allowed as Map keys (C# PrimitiveType: Boolean, Integer,
     # ByteString). Buffer derives from StackItem, not PrimitiveType, so a Buffer
@@ -142,67 +146,75 @@ class BinarySerializer:
     )
 
     @classmethod
-    def deserialize(cls, data: bytes, max_size: int = MAX_SIZE) -> StackItem:
+    def deserialize(
+        cls, data: bytes | bytearray | memoryview, max_size: int = MAX_SIZE
+    ) -> StackItem:
         """Deserialize bytes to a stack item.
 
+        Parses in place over a ``memoryview``; only ByteString/Buffer
+        payloads are copied out.
+
         Mirrors C# BinarySerializer.Deserialize: a flat work-stack bounded by a
         single cumulative item count (MaxStackSize), not per-container length.
         """
         if len(data) > max_size:
             raise ValueError(f"Data size {len(data)} exceeds max {max_size}")
 
-        reader = BytesIO(data)
+        view = memoryview(data)
+        end = len(view)
+        pos = 0
         max_items = cls.MAX_ITEMS
+        read_var_int = cls._read_var_int
 
         # Phase 1: flat parse. Each produced node (leaf or container
         # placeholder) increments the running count, faulting when it exceeds
         # maxItems (strict >), matching C# `deserialized.Count > maxItems`.
-        deserialized: list[StackItem] = []
+        deserialized: list[StackItem | tuple[int, int]] = []
         # ContainerPlaceholder is encoded as a (type, element_count) tuple.
         undeserialized = 1
         while undeserialized > 0:
             undeserialized -= 1
-            type_byte = reader.read(1)
-            if not type_byte:
+            if pos >= end:
                 raise ValueError("Unexpected end of data")
-            item_type = type_byte[0]
+            item_type = view[pos]
+            pos += 1
 
             if item_type == StackItemType.ANY:
                 deserialized.append(NULL)
             elif item_type == StackItemType.BOOLEAN:
-                value_byte = reader.read(1)
-                if not value_byte:
+                if pos >= end:
                     raise ValueError("Unexpected end of data")
-                deserialized.append(Boolean(value_byte[0] != 0))
+                deserialized.append(Boolean(view[pos] != 0))
+                pos += 1
             elif item_type == StackItemType.INTEGER:
-                length = cls._read_var_int(reader, 32)  # Integer.MaxSize
-                data_bytes = reader.read(length)
-                if len(data_bytes) != length:
+                length, pos = read_var_int(view, pos, 32)  # Integer.MaxSize
+                if pos + length > end:
                     raise ValueError("Unexpected end of data")
                 if length == 0:
                     deserialized.append(Integer(0))
                 else:
                     deserialized.append(
-                        Integer(int.from_bytes(data_bytes, 'little', signed=True))
+                        Integer(int.from_bytes(view[pos : pos + length], 'little', signed=True))
                     )
+                pos += length
             elif item_type == StackItemType.BYTESTRING:
-                length = cls._read_var_int(reader, max_size)
-                data_bytes = reader.read(length)
-                if len(data_bytes) != length:
+                length, pos = read_var_int(view, pos, max_size)
+                if pos + length > end:
                     raise ValueError("Unexpected end of data")
-                deserialized.append(ByteString(data_bytes))
+                deserialized.append(ByteString(view[pos : pos + length].tobytes()))
+                pos += length
             elif item_type == StackItemType.BUFFER:
-                length = cls._read_var_int(reader, max_size)
-                data_bytes = reader.read(length)
-                if len(data_bytes) != length:
+                length, pos = read_var_int(view, pos, max_size)
+                if pos + length > end:
                     raise ValueError("Unexpected end of data")
-                deserialized.append(Buffer(bytearray(data_bytes)))
+                deserialized.append(Buffer(view[pos : pos + length].tobytes()))
+                pos += length
             elif item_type in (StackItemType.ARRAY, StackItemType.STRUCT):
-                count = cls._read_var_int(reader, max_items)
+                count, pos = read_var_int(view, pos, max_items)
                 deserialized.append((item_type, count))
                 undeserialized += count
             elif item_type == StackItemType.MAP:
-                count = cls._read_var_int(reader, max_items)
+                count, pos = read_var_int(view, pos, max_items)
                 deserialized.append((item_type, count))
                 undeserialized += count * 2
             else:
@@ -246,52 +258,30 @@ class BinarySerializer:
         return stack_temp[-1]
 
     @staticmethod
-    def _write_var_int(writer: BinaryIO, value: int) -> None:
-        """Write a variable-length integer."""
-        if value < 0:
-            raise ValueError("Negative var int")
-        if value < 0xFD:
-            writer.write(bytes([value]))
-        elif value <= 0xFFFF:
-            writer.write(bytes([0xFD]))
-            writer.write(value.to_bytes(2, 'little'))
-        elif value <= 0xFFFFFFFF:
-            writer.write(bytes([0xFE]))
-            writer.write(value.to_bytes(4, 'little'))
-        else:
-            writer.write(bytes([0xFF]))
-            writer.write(value.to_bytes(8, 'little'))
-
-    @staticmethod
-    def _read_var_int(reader: BinaryIO, max_value: int = 0xFFFFFFFFFFFFFFFF) -> int:
-        """Read a variable-length integer, faulting if it exceeds max_value.
-
-        Mirrors C# MemoryReader.ReadVarInt(max) which throws FormatException
-        when the decoded value exceeds the supplied maximum.
+    def _read_var_int(
+        view: memoryview, pos: int, max_value: int = 0xFFFFFFFFFFFFFFFF
+    ) -> tuple[int, int]:
+        """Read a variable-length integer at ``pos``, faulting if it exceeds max_value.
+
+        Returns the value and the position after it. Mirrors C#
+        MemoryReader.ReadVarInt(max) which throws FormatException when the
+        decoded value exceeds the supplied maximum.
         """
-        first = reader.read(1)
-        if not first:
+        end = len(view)
+        if pos >= end:
             raise ValueError("Unexpected end of data")
 
-        fb = first[0]
+        fb = view[pos]
+        pos += 1
         if fb < 0xFD:
             value = fb
-        elif fb == 0xFD:
-            data = reader.read(2)
-            if len(data) != 2:
-                raise ValueError("Unexpected end of data")
-            value = int.from_bytes(data, 'little')
-        elif fb == 0xFE:
-            data = reader.read(4)
-            if len(data) != 4:
-                raise ValueError("Unexpected end of data")
-            value = int.from_bytes(data, 'little')
         else:
-            data = reader.read(8)
-            if len(data) != 8:
+            size = 2 if fb == 0xFD else 4 if fb == 0xFE else 8
+            if pos + size > end:
                 raise ValueError("Unexpected end of data")
-            value = int.from_bytes(data, 'little')
+            value = int.from_bytes(view[pos : pos + size], 'little')
+            pos += size
 
         if value > max_value:
             raise ValueError(f"VarInt value {value} exceeds max {max_value}")
-        return value
+        return value, pos
@@ -0,0 +1,69 @@
+"""Notification and log capture policies for ApplicationEngine.
+
+By default the engine retains every notification and log entry it emits.
+Bulk replays rarely need that: a capture policy lets the caller keep only
+counts, a filtered subset, or nothing at all, and optionally stream every
+selected event to a sink callback instead of holding it in memory.
+
+Consensus-visible behaviour is unaffected: while scripts run the engine
+keeps every event, so ``System.Runtime.GetNotifications`` and the
+notification limit see exactly what a full capture would. The policy is
+applied once :meth:`ApplicationEngine.execute` returns; COUNT tallies and
+the sink only cover executions that ended in HALT. Because of that, peak
+memory during a single execution is the same as under full capture; the
+savings come from not carrying events from one execution to the next.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neo.smartcontract.application_engine import LogEntry, Notification
+    from neo.types import UInt160
+
+
+class CaptureMode(IntEnum):
+    """What the engine retains for each notification / log entry."""
+
+    NONE = 0
+    COUNT = 1
+    FILTER = 2
+    FULL = 3
+
+
+@dataclass(frozen=True)
+class CapturePolicy:
+    """Notification and log retention policy.
+
+    ``contracts`` and ``event_names`` select events for both FILTER
+    retention and the sink; ``None`` means "any". Logs carry no event
+    name, so only ``contracts`` applies to them.
+    """
+
+    mode: CaptureMode = CaptureMode.FULL
+    contracts: frozenset[UInt160] | None = None
+    event_names: frozenset[str] | None = None
+    sink: Callable[[Notification | LogEntry], None] | None = None
+
+    def selects(self, script_hash: UInt160, event_name: str | None = None) -> bool:
+        """Return True when an event from ``script_hash`` passes the filter."""
+        if self.contracts is not None and script_hash not in self.contracts:
+            return False
+        if event_name is not None and self.event_names is not None:
+            return event_name in self.event_names
+        return True
+
+    def retains(self, script_hash: UInt160, event_name: str | None = None) -> bool:
+        """Return True when the event object itself should be kept."""
+        if self.mode == CaptureMode.FULL:
+            return True
+        if self.mode == CaptureMode.FILTER:
+            return self.selects(script_hash, event_name)
+        return False
+
+
+FULL_CAPTURE = CapturePolicy()
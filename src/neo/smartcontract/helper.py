@@ -1,8 +1,76 @@
 """Neo N3 Contract Helper."""
 
+from neo.smartcontract.interop_service import get_interop_hash
+from neo.vm.opcode import OpCode
+
+_CHECK_SIG = get_interop_hash("System.Crypto.CheckSig")
+_CHECK_MULTISIG = get_interop_hash("System.Crypto.CheckMultisig")
+
 
 def get_contract_hash(sender: bytes, nef_checksum: int, name: str) -> bytes:
     """Calculate contract hash."""
     from neo.crypto.hash import hash160
     data = sender + nef_checksum.to_bytes(4, 'little') + name.encode()
     return hash160(data)
+
+
+def is_signature_contract(script: bytes) -> bool:
+    """Return True for a single-key ``CheckSig`` redeem script.
+
+    Mirrors C# ``Helper.IsSignatureContract``.
+    """
+    return (
+        len(script) == 40
+        and script[0] == OpCode.PUSHDATA1
+        and script[1] == 33
+        and script[35] == OpCode.SYSCALL
+        and int.from_bytes(script[36:40], 'little') == _CHECK_SIG
+    )
+
+
+def _read_count(script: bytes, i: int) -> tuple[int, int] | None:
+    """Decode the small integer pushed at ``i``; return it and the next offset."""
+    op = script[i]
+    if op == OpCode.PUSHINT8:
+        if len(script) <= i + 1:
+            return None
+        return script[i + 1], i + 2
+    if op == OpCode.PUSHINT16:
+        if len(script) < i + 3:
+            return None
+        return int.from_bytes(script[i + 1:i + 3], 'little'), i + 3
+    if OpCode.PUSH1 <= op <= OpCode.PUSH16:
+        return op - OpCode.PUSH0, i + 1
+    return None
+
+
+def is_multi_sig_contract(script: bytes) -> bool:
+    """Return True for an m-of-n ``CheckMultisig`` redeem script.
+
+    Mirrors C# ``Helper.IsMultiSigContract``.
+    """
+    if len(script) < 42:
+        return False
+    decoded = _read_count(script, 0)
+    if decoded is None:
+        return False
+    m, i = decoded
+    if m < 1 or m > 1024:
+        return False
+    n = 0
+    while script[i] == OpCode.PUSHDATA1:
+        if len(script) <= i + 35 or script[i + 1] != 33:
+            return False
+        i += 35
+        n += 1
+    if n < m or n > 1024:
+        return False
+    decoded = _read_count(script, i)
+    if decoded is None or decoded[0] != n:
+        return False
+    i = decoded[1]
+    return (
+        len(script) == i + 5
+        and script[i] == OpCode.SYSCALL
+        and int.from_bytes(script[i + 1:i + 5], 'little') == _CHECK_MULTISIG
+    )
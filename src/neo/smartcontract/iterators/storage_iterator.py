@@ -3,21 +3,22 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
 
 from .iterator import IIterator
 from neo.smartcontract.storage.find_options import FindOptions
 from neo.vm.types import Array, ByteString, StackItem, Struct
 
-if TYPE_CHECKING:
-    pass
 
 class StorageIterator(IIterator):
     """Iterator for storage search results.
 
     Can be created in two ways:
-    1. From an ApplicationEngine (queries snapshot.find)
-    2. From a list of (key, value) pairs (for testing)
+    1. From an ApplicationEngine (streams from snapshot.seek)
+    2. From an iterator of (key, value) pairs (for testing)
+
+    Pairs are pulled from the underlying cursor one at a time and
+    FindOptions are applied per element, so a contract that reads only
+    the first entry never touches the rest of the prefix.
     """
 
     def __init__(
@@ -33,57 +34,71 @@ class StorageIterator(IIterator):
             prefix: Storage key prefix (used with REMOVE_PREFIX option).
             options: FindOptions flags.
         """
+        self._prefix = prefix
+        self._options = FindOptions(options)
+        backwards = bool(self._options & FindOptions.BACKWARDS)
+
         # Handle two calling conventions
         if isinstance(engine_or_pairs, Iterator):
             # Called from test with list of pairs: StorageIterator(iter(pairs), prefix_len, options)
-            raw_pairs = list(engine_or_pairs)
-            # Extract raw bytes from StorageKey/StorageItem if needed
-            self._pairs: list[tuple[bytes, bytes]] = []
-            for item in raw_pairs:
-                if len(item) == 2:
-                    key, value = item
-                    # Extract key bytes
-                    if hasattr(key, "key"):
-                        key_bytes = key.key
-                    else:
-                        key_bytes = key
-                    # Extract value bytes
-                    if hasattr(value, "value"):
-                        value_bytes = value.value
-                    else:
-                        value_bytes = value
-                    self._pairs.append((key_bytes, value_bytes))
             self._engine = None
-            self._prefix = prefix
-            self._options = FindOptions(options)
+            cursor = self._unwrap_pairs(engine_or_pairs)
+            if backwards:
+                cursor = reversed(list(cursor))
         else:
             # Called from production: StorageIterator(engine, prefix, options)
-            engine = engine_or_pairs
-            self._engine = engine
-            self._prefix = prefix
-            self._options = FindOptions(options)
-            self._pairs = []
+            self._engine = engine_or_pairs
+            cursor = self._open_cursor(self._engine, prefix, backwards)
+
+        self._cursor: Iterator[tuple[bytes, bytes]] | None = iter(cursor)
+        self._current: tuple[bytes, bytes] | None = None
 
-            snapshot = getattr(engine, "snapshot", None)
-            if snapshot is not None and hasattr(snapshot, "find"):
-                self._pairs = list(snapshot.find(prefix))
+    @staticmethod
+    def _unwrap_pairs(pairs: Iterator) -> Iterator[tuple[bytes, bytes]]:
+        """Extract raw bytes from StorageKey/StorageItem pairs lazily."""
+        for item in pairs:
+            if len(item) == 2:
+                key, value = item
+                key_bytes = key.key if hasattr(key, "key") else key
+                value_bytes = value.value if hasattr(value, "value") else value
+                yield key_bytes, value_bytes
 
-        self._index = -1
+    @staticmethod
+    def _open_cursor(engine, prefix: bytes, backwards: bool) -> Iterator[tuple[bytes, bytes]]:
+        """Open an ordered cursor over the engine snapshot.
 
-        if self._options & FindOptions.BACKWARDS:
-            self._pairs.reverse()
+        The cursor is opened eagerly so that writes made after the iterator
+        is created are not observed.
+        """
+        snapshot = getattr(engine, "snapshot", None)
+        if snapshot is None:
+            return iter(())
+        seek = getattr(snapshot, "seek", None)
+        if seek is not None:
+            return seek(prefix, -1 if backwards else 1)
+        if not hasattr(snapshot, "find"):
+            return iter(())
+        pairs = list(snapshot.find(prefix))
+        if backwards:
+            pairs.reverse()
+        return iter(pairs)
 
     def next(self) -> bool:
         """Advance to next element."""
-        self._index += 1
-        return self._index < len(self._pairs)
+        if self._cursor is None:
+            return False
+        self._current = next(self._cursor, None)
+        if self._current is None:
+            self._cursor = None
+            return False
+        return True
 
     def value(self) -> StackItem:
         """Get current element."""
-        if self._index < 0 or self._index >= len(self._pairs):
+        if self._current is None:
             raise ValueError("No current element")
 
-        raw_key, raw_value = self._pairs[self._index]
+        raw_key, raw_value = self._current
         return self._apply_options(raw_key, raw_value)
 
     def _apply_options(self, raw_key: bytes, raw_value: bytes) -> StackItem:
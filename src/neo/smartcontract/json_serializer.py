@@ -6,6 +6,7 @@ Reference: Neo.SmartContract.JsonSerializer
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
 from neo.vm.types import (
@@ -21,6 +22,47 @@ from neo.vm.types import (
     Struct,
 )
 
+# Marker pushed after a container's children; popping it leaves the container.
+_EXIT = object()
+
+# Short escapes emitted by System.Text.Json (Utf8JsonWriter).
+_SHORT_ESCAPES = {
+    '"': '\\"',
+    "\\": "\\\\",
+    "\b": "\\b",
+    "\f": "\\f",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+}
+
+# Characters JavaScriptEncoder.Default escapes: JSON structural characters,
+# controls, the HTML-sensitive set (<, >, &, +, ') and anything non-ASCII.
+_NEEDS_ESCAPE = re.compile(r"[^\x20-\x7e]|[\"\\<>&+']")
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    ch = match.group()
+    short = _SHORT_ESCAPES.get(ch)
+    if short is not None:
+        return short
+    cp = ord(ch)
+    if cp > 0xFFFF:
+        cp -= 0x10000
+        return f"\\u{0xD800 + (cp >> 10):04X}\\u{0xDC00 + (cp & 0x3FF):04X}"
+    return f"\\u{cp:04X}"
+
+
+def escape_json_string(value: str) -> str:
+    """Quote ``value`` as C# Utf8JsonWriter + JavaScriptEncoder.Default would.
+
+    Control characters and JSON structural escapes use their short forms;
+    the HTML-sensitive set and every non-ASCII code point are written as
+    ``\\uXXXX`` with uppercase hex digits (surrogate pairs above U+FFFF).
+    The result is always ASCII.
+    """
+    return '"' + _NEEDS_ESCAPE.sub(_escape_char, value) + '"'
+
 
 class JsonSerializer:
     """Serialize and deserialize stack items to/from JSON.
@@ -38,31 +80,53 @@ class JsonSerializer:
 
     @classmethod
     def serialize(cls, item: StackItem, max_size: int = MAX_SIZE) -> bytes:
-        """Serialize a stack item to JSON bytes."""
-        json_value = cls._to_json(item, set())
-        result = json.dumps(json_value, separators=(',', ':')).encode('utf-8')
-
-        if len(result) > max_size:
-            raise ValueError(f"Serialized size {len(result)} exceeds max {max_size}")
+        """Serialize a stack item to JSON bytes.
 
-        return result
+        Mirrors C# JsonSerializer.SerializeToByteArray: compact separators,
+        C#-compatible string escaping and JNumber safe-integer bounds. Output
+        is produced iteratively as a list of chunks; containers on the
+        current path are tracked with an enter/exit set for cycle detection,
+        and serialization aborts as soon as the output exceeds ``max_size``.
+        """
+        chunks: list[str] = []
+        size = 0
+        on_path: set[int] = set()
+        pending: list[object] = [item]
+        max_items = cls.MAX_ITEMS
+
+        while pending:
+            current = pending.pop()
+            if current is _EXIT:
+                on_path.discard(pending.pop())  # type: ignore[arg-type]
+                continue
+
+            if isinstance(current, str):
+                chunk = current
+            else:
+                assert isinstance(current, StackItem)
+                scalar = cls._scalar_to_json(current)
+                if scalar is None:
+                    chunk = cls._enter_container(current, pending, on_path, max_items)
+                else:
+                    chunk = scalar
+
+            chunks.append(chunk)
+            size += len(chunk)  # escaped output is pure ASCII
+            if size > max_size:
+                raise ValueError(f"Serialized size exceeds max {max_size}")
+
+        return "".join(chunks).encode("ascii")
 
     @classmethod
-    def _to_json(cls, item: StackItem, seen: set[int]) -> Any:
-        """Convert stack item to JSON-compatible value."""
+    def _scalar_to_json(cls, item: StackItem) -> str | None:
+        """Return the JSON text of a primitive item, or None for containers."""
         item_type = item.type
 
-        if item_type in (StackItemType.ARRAY, StackItemType.STRUCT, StackItemType.MAP):
-            item_id = id(item)
-            if item_id in seen:
-                raise ValueError("Circular reference detected")
-            seen = seen | {item_id}
-
         if item_type == StackItemType.ANY:
-            return None
+            return "null"
 
         if item_type == StackItemType.BOOLEAN:
-            return item.get_boolean()
+            return "true" if item.get_boolean() else "false"
 
         if item_type == StackItemType.INTEGER:
             if not isinstance(item, Integer):
@@ -72,48 +136,72 @@ class JsonSerializer:
             # JavaScript safe-integer range (writes it as a double otherwise).
             if value > cls.MAX_SAFE_INTEGER or value < cls.MIN_SAFE_INTEGER:
                 raise ValueError("Integer is out of safe-integer range")
-            return value
+            return str(value)
 
         if item_type == StackItemType.BYTESTRING:
             if not isinstance(item, ByteString):
                 raise ValueError("Invalid ByteString item")
             # C# writes GetString() = strict UTF-8 decoding; invalid UTF-8 faults.
-            return cls._to_strict_utf8(item.value)
+            return escape_json_string(cls._to_strict_utf8(item.value))
 
         if item_type == StackItemType.BUFFER:
             if not isinstance(item, Buffer):
                 raise ValueError("Invalid Buffer item")
-            return cls._to_strict_utf8(bytes(item.value))
+            return escape_json_string(cls._to_strict_utf8(bytes(item.value)))
 
-        if item_type == StackItemType.ARRAY:
-            if not isinstance(item, Array):
-                raise ValueError("Invalid Array item")
-            items = list(item)
-            if len(items) > cls.MAX_ITEMS:
-                raise ValueError(f"Array too large: {len(items)}")
-            return [cls._to_json(sub, seen) for sub in items]
+        if item_type in (StackItemType.ARRAY, StackItemType.STRUCT, StackItemType.MAP):
+            return None
 
-        if item_type == StackItemType.STRUCT:
-            if not isinstance(item, Struct):
-                raise ValueError("Invalid Struct item")
-            items = list(item)
-            if len(items) > cls.MAX_ITEMS:
-                raise ValueError(f"Struct too large: {len(items)}")
-            return [cls._to_json(sub, seen) for sub in items]
+        raise ValueError(f"Cannot serialize type: {item_type}")
 
+    @classmethod
+    def _enter_container(
+        cls, item: StackItem, pending: list[object], on_path: set[int], max_items: int
+    ) -> str:
+        """Schedule a container's children and closing token; return its opener."""
+        item_id = id(item)
+        if item_id in on_path:
+            raise ValueError("Circular reference detected")
+
+        item_type = item.type
         if item_type == StackItemType.MAP:
             if not isinstance(item, Map):
                 raise ValueError("Invalid Map item")
             entries = list(item.items())
-            if len(entries) > cls.MAX_ITEMS:
+            if len(entries) > max_items:
                 raise ValueError(f"Map too large: {len(entries)}")
-            result: dict[str, Any] = {}
-            for key, value in entries:
-                key_json = cls._key_to_string(key)
-                result[key_json] = cls._to_json(value, seen)
-            return result
-
-        raise ValueError(f"Cannot serialize type: {item_type}")
+            opener, closer = "{", "}"
+            children: list[object] = []
+            for index, (key, value) in enumerate(entries):
+                prefix = "," if index else ""
+                children.append(prefix + escape_json_string(cls._key_to_string(key)) + ":")
+                children.append(value)
+        else:
+            if item_type == StackItemType.ARRAY:
+                if not isinstance(item, Array):
+                    raise ValueError("Invalid Array item")
+                kind = "Array"
+            else:
+                if not isinstance(item, Struct):
+                    raise ValueError("Invalid Struct item")
+                kind = "Struct"
+            items = list(item)
+            if len(items) > max_items:
+                raise ValueError(f"{kind} too large: {len(items)}")
+            opener, closer = "[", "]"
+            children = []
+            for index, sub in enumerate(items):
+                if index:
+                    children.append(",")
+                children.append(sub)
+
+        on_path.add(item_id)
+        pending.append(item_id)
+        pending.append(_EXIT)
+        pending.append(closer)
+        children.reverse()
+        pending.extend(children)
+        return opener
 
     @classmethod
     def _key_to_string(cls, key: StackItem) -> str:
@@ -175,6 +263,12 @@ class JsonSerializer:
         if isinstance(value, int):
             return Integer(value)
 
+        if isinstance(value, float):
+            # C# JsonSerializer faults on fractional numbers (JsonSerializer.cs:196).
+            if value % 1 != 0:
+                raise ValueError("Decimal value is not allowed")
+            return Integer(int(value))
+
         if isinstance(value, str):
             return ByteString(value.encode('utf-8'))
 
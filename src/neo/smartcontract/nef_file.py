@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from typing import Any
 import struct
 
+from neo.io.binary_writer import encode_var_int
+
 @dataclass
 class MethodToken:
     """Method token for static calls."""
@@ -82,17 +84,7 @@ class NefFile:
         data.extend(struct.pack('<I', self.checksum))
         return bytes(data)
     
-    @staticmethod
-    def _write_var_int(value: int) -> bytes:
-        """Write variable-length integer."""
-        if value < 0xFD:
-            return bytes([value])
-        elif value <= 0xFFFF:
-            return b'\xFD' + struct.pack('<H', value)
-        elif value <= 0xFFFFFFFF:
-            return b'\xFE' + struct.pack('<I', value)
-        else:
-            return b'\xFF' + struct.pack('<Q', value)
+    _write_var_int = staticmethod(encode_var_int)
 
     @staticmethod
     def _read_var_int(data: bytes, offset: int) -> tuple:
@@ -1,14 +1,131 @@
-"""Neo N3 Storage Key."""
+"""Neo N3 Storage Key.
 
-from dataclasses import dataclass
+Reference: Neo.SmartContract.StorageKey
+
+A single key type shared by native contracts and the storage syscalls.
+The serialized form (contract id as int32 little-endian followed by the
+key bytes) is computed once at construction, so hashing, equality,
+ordering and prefix checks all work on raw bytes. A key compares and
+hashes equal to its serialized ``bytes``, so it can be used directly
+against stores keyed by raw bytes.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import Any
+
+from neo.types import UInt160
+
+
+@cache
+def _id_header(contract_id: int) -> bytes:
+    return contract_id.to_bytes(4, "little", signed=True)
+
+
+@cache
+def _prefix_key(contract_id: int, prefix: int) -> StorageKey:
+    return StorageKey(contract_id, bytes((prefix,)))
 
 
-@dataclass(frozen=True)
 class StorageKey:
     """Storage key for contract data."""
+
+    __slots__ = ("_bytes", "_hash", "id", "key")
+
     id: int
     key: bytes
-    
+    _bytes: bytes
+    _hash: int
+
+    def __init__(self, id: int, key: bytes = b"") -> None:
+        key = bytes(key)
+        raw = _id_header(id) + key
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "key", key)
+        object.__setattr__(self, "_bytes", raw)
+        object.__setattr__(self, "_hash", hash(raw))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"StorageKey is immutable; cannot set {name!r}")
+
+    @staticmethod
+    def encode(contract_id: int, key: bytes) -> bytes:
+        """Serialize ``contract_id`` and ``key`` without building a key object."""
+        return _id_header(contract_id) + key
+
+    @classmethod
+    def create(cls, contract_id: int, prefix: int, *args: Any) -> StorageKey:
+        """Create a storage key with prefix and optional data.
+
+        ``int`` arguments are appended as 4-byte little-endian, ``bytes``
+        verbatim and ``UInt160`` as its raw data. Bare-prefix keys are
+        cached per ``(contract_id, prefix)``.
+        """
+        if not args:
+            return _prefix_key(contract_id, prefix)
+        parts = [bytes((prefix,))]
+        for arg in args:
+            if isinstance(arg, int):
+                parts.append(arg.to_bytes(4, "little"))
+            elif isinstance(arg, bytes):
+                parts.append(arg)
+            elif isinstance(arg, UInt160):
+                parts.append(arg.data)
+        return cls(contract_id, b"".join(parts))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> StorageKey:
+        """Deserialize a key from its ``id + key`` byte form."""
+        if len(data) < 4:
+            raise ValueError("StorageKey requires at least 4 bytes")
+        return cls(int.from_bytes(data[:4], "little", signed=True), bytes(data[4:]))
+
     def to_bytes(self) -> bytes:
         """Serialize to bytes."""
-        return self.id.to_bytes(4, 'little') + self.key
+        return self._bytes
+
+    def __bytes__(self) -> bytes:
+        return self._bytes
+
+    def startswith(self, prefix: StorageKey | bytes) -> bool:
+        """Return True when this key's serialized form starts with ``prefix``."""
+        if isinstance(prefix, StorageKey):
+            prefix = prefix._bytes
+        return self._bytes.startswith(prefix)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StorageKey):
+            return self._bytes == other._bytes
+        if isinstance(other, (bytes, bytearray)):
+            return self._bytes == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __lt__(self, other: StorageKey) -> bool:
+        if not isinstance(other, StorageKey):
+            return NotImplemented
+        return self._bytes < other._bytes
+
+    def __le__(self, other: StorageKey) -> bool:
+        if not isinstance(other, StorageKey):
+            return NotImplemented
+        return self._bytes <= other._bytes
+
+    def __gt__(self, other: StorageKey) -> bool:
+        if not isinstance(other, StorageKey):
+            return NotImplemented
+        return self._bytes > other._bytes
+
+    def __ge__(self, other: StorageKey) -> bool:
+        if not isinstance(other, StorageKey):
+            return NotImplemented
+        return self._bytes >= other._bytes
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (StorageKey, (self.id, self.key))
+
+    def __repr__(self) -> str:
+        return f"StorageKey(id={self.id}, key={self.key!r})"
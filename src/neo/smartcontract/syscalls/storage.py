@@ -6,6 +6,8 @@ Reference: Neo.SmartContract.ApplicationEngine.Storage.cs
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+from neo.smartcontract.storage.storage_key import StorageKey
+
 if TYPE_CHECKING:
     from neo.smartcontract.application_engine import ApplicationEngine
 
@@ -278,5 +280,4 @@ def _build_storage_key(ctx, key: bytes) -> bytes:
     Neo N3 storage key format: contract_id (int32 LE) + user_key.
     Matches the C# reference ``StorageKey`` implementation.
     """
-    contract_id_bytes = ctx.id.to_bytes(4, byteorder="little", signed=True)
-    return contract_id_bytes + key
+    return StorageKey.encode(ctx.id, key)
@@ -0,0 +1,173 @@
+"""Precompiled witness-scope evaluation for Runtime.CheckWitness.
+
+Reference: Neo.SmartContract.ApplicationEngine.CheckWitnessInternal,
+Neo.Network.P2P.Payloads.Signer.GetAllRules
+
+A transaction's signers never change during execution, so their scopes,
+allow-lists and witness rules are compiled once per engine into plain
+sets and predicate closures. Each check then runs against a
+:class:`WitnessFrame` describing the current call site.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+Predicate = Callable[["WitnessFrame"], bool]
+
+_EMPTY: frozenset[bytes] = frozenset()
+
+
+class WitnessFrame:
+    """Script hashes of the call site a witness check is evaluated for.
+
+    Hashes are resolved from the engine on first use, so scopes that never
+    look at the call site (e.g. Global) work without a loaded context.
+    """
+
+    __slots__ = ("_engine", "_hashes")
+
+    def __init__(self, engine: Any) -> None:
+        self._engine = engine
+        self._hashes: dict[str, bytes | None] = {}
+
+    def _hash(self, name: str) -> bytes | None:
+        if name not in self._hashes:
+            value = getattr(self._engine, name)
+            self._hashes[name] = bytes(value) if value is not None else None
+        return self._hashes[name]
+
+    @property
+    def current(self) -> bytes | None:
+        return self._hash("current_script_hash")
+
+    @property
+    def calling(self) -> bytes | None:
+        return self._hash("calling_script_hash")
+
+    @property
+    def entry(self) -> bytes | None:
+        return self._hash("entry_script_hash")
+
+    def current_groups(self) -> frozenset[bytes]:
+        """Group public keys of the current contract's manifest."""
+        current = self.current
+        return self._engine._contract_groups(current) if current is not None else _EMPTY
+
+    def calling_groups(self) -> frozenset[bytes]:
+        """Group public keys of the calling contract's manifest."""
+        calling = self.calling
+        return self._engine._contract_groups(calling) if calling is not None else _EMPTY
+
+
+def _always(value: bool) -> Predicate:
+    return lambda _frame: value
+
+
+def compile_condition(condition: Any) -> Predicate:
+    """Compile a WitnessCondition tree into a predicate over a frame."""
+    from neo.smartcontract.application_engine import ApplicationEngine
+
+    cond_type = getattr(condition, "type", None)
+
+    # Boolean
+    if cond_type == 0x00:
+        return _always(bool(getattr(condition, "expression", False)))
+
+    # Not
+    if cond_type == 0x01:
+        inner = getattr(condition, "expression", None)
+        if inner is None:
+            return _always(False)
+        inner_pred = compile_condition(inner)
+        return lambda frame: not inner_pred(frame)
+
+    # And / Or
+    if cond_type in (0x02, 0x03):
+        preds = tuple(compile_condition(e) for e in getattr(condition, "expressions", []))
+        if cond_type == 0x02:
+            return lambda frame: all(p(frame) for p in preds)
+        return lambda frame: any(p(frame) for p in preds)
+
+    # ScriptHash / CalledByContract
+    if cond_type in (0x18, 0x28):
+        target_hash = getattr(condition, "hash", None)
+        if target_hash is None:
+            return _always(False)
+        target = bytes(target_hash)
+        if cond_type == 0x18:
+            return lambda frame: frame.current == target
+        return lambda frame: frame.calling == target
+
+    # Group / CalledByGroup
+    if cond_type in (0x19, 0x29):
+        group = ApplicationEngine._coerce_group_to_bytes(getattr(condition, "group", None))
+        if group is None:
+            return _always(False)
+        if cond_type == 0x19:
+            return lambda frame: group in frame.current_groups()
+        return lambda frame: group in frame.calling_groups()
+
+    # CalledByEntry
+    if cond_type == 0x20:
+        return lambda frame: frame.current == frame.entry
+
+    return _always(False)
+
+
+class CompiledSigner:
+    """A signer's witness scope reduced to sets and rule predicates."""
+
+    __slots__ = ("is_global", "called_by_entry", "contracts", "groups", "rules")
+
+    def __init__(self, signer: Any) -> None:
+        from neo.ledger.witness_scope import WitnessScope
+        from neo.smartcontract.application_engine import ApplicationEngine
+
+        scope = signer.scopes
+        self.is_global = bool(scope & WitnessScope.GLOBAL)
+        self.called_by_entry = bool(scope & WitnessScope.CALLED_BY_ENTRY)
+
+        self.contracts: frozenset[bytes] = _EMPTY
+        if scope & WitnessScope.CUSTOM_CONTRACTS:
+            self.contracts = frozenset(
+                b
+                for c in getattr(signer, "allowed_contracts", [])
+                if (b := ApplicationEngine._coerce_hash160_to_bytes(c)) is not None
+            )
+
+        self.groups: frozenset[bytes] = _EMPTY
+        if scope & WitnessScope.CUSTOM_GROUPS:
+            self.groups = frozenset(
+                b
+                for g in (getattr(signer, "allowed_groups", None) or [])
+                if (b := ApplicationEngine._coerce_group_to_bytes(g)) is not None
+            )
+
+        self.rules: tuple[tuple[bool, Predicate], ...] = ()
+        if scope & WitnessScope.WITNESS_RULES:
+            compiled = []
+            for rule in getattr(signer, "rules", []):
+                action = ApplicationEngine._coerce_witness_rule_action(
+                    getattr(rule, "action", None)
+                )
+                condition = getattr(rule, "condition", None)
+                if condition is not None and action is not None:
+                    compiled.append((action == 1, compile_condition(condition)))
+            self.rules = tuple(compiled)
+
+    def check(self, frame: WitnessFrame) -> bool:
+        """Return whether this signer's scope covers ``frame``."""
+        if self.is_global:
+            return True
+        if self.called_by_entry and frame.entry in (frame.current, frame.calling):
+            return True
+        if self.contracts and frame.current in self.contracts:
+            return True
+        if self.groups and not self.groups.isdisjoint(frame.current_groups()):
+            return True
+        for allow, predicate in self.rules:
+            if predicate(frame):
+                return allow
+        return False
@@ -8,6 +8,9 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections.abc import Iterator
+from contextlib import ExitStack
+from pathlib import Path
 from typing import Any
 
 def load_json_file(path: str) -> Any:
@@ -26,6 +29,27 @@ def write_json_file(path: str, data: dict[str, Any]) -> None:
         with open(path, "w") as f:
             json.dump(data, f, indent=2)
 
+def iter_blocks(path: str) -> Iterator[Any]:
+    """Lazily yield blocks from a JSONL file, stdin, or a directory.
+
+    A directory is read as one JSON block per ``*.json`` file in name
+    order; anything else is read as JSON Lines with blank lines skipped.
+    """
+    if path != "-" and Path(path).is_dir():
+        for block_path in sorted(Path(path).glob("*.json")):
+            yield load_json_file(str(block_path))
+        return
+
+    with ExitStack() as stack:
+        stream = sys.stdin if path == "-" else stack.enter_context(open(path, "r"))
+        for line_no, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"invalid block JSON on line {line_no}: {exc}") from exc
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
     parser = argparse.ArgumentParser(
@@ -48,6 +72,14 @@ def create_parser() -> argparse.ArgumentParser:
         default="env.json",
         help="Input environment file (default: env.json)",
     )
+    parser.add_argument(
+        "--input-blocks",
+        default=None,
+        help=(
+            "Stream blocks from a JSONL file (or '-') or a directory of per-block "
+            "JSON files, each {\"env\": ..., \"txs\": [...]}; replaces --input-env/--input-txs"
+        ),
+    )
 
     return parser
 
@@ -60,8 +92,16 @@ def add_output_args(parser: argparse.ArgumentParser) -> None:
     )
     parser.add_argument(
         "--output-alloc",
-        default="alloc-out.json",
-        help="Output allocation file (default: alloc-out.json)",
+        default=None,
+        help=(
+            "Output allocation file (default: alloc-out.json; "
+            "with --input-blocks, written only when given)"
+        ),
+    )
+    parser.add_argument(
+        "--output-receipts",
+        default="receipts.jsonl",
+        help="Per-block results as JSON Lines with --input-blocks (default: receipts.jsonl)",
     )
     parser.add_argument(
         "-v",
@@ -86,6 +126,9 @@ def main(args: list[str] | None = None) -> int:
     add_output_args(parser)
     opts = parser.parse_args(args)
 
+    if opts.input_blocks is not None:
+        return _run_stream(opts)
+
     try:
         alloc_raw = load_json_file(opts.input_alloc)
         txs_raw = load_json_file(opts.input_txs)
@@ -110,7 +153,7 @@ def main(args: list[str] | None = None) -> int:
         output = t8n.run()
 
         write_json_file(opts.output_result, output.result.to_dict())
-        write_json_file(opts.output_alloc, output.alloc)
+        write_json_file(opts.output_alloc or "alloc-out.json", output.alloc)
 
         if opts.verbose:
             print(f"Gas used: {output.result.gas_used}", file=sys.stderr)
@@ -121,5 +164,43 @@ def main(args: list[str] | None = None) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+def _run_stream(opts: argparse.Namespace) -> int:
+    """Apply ``--input-blocks`` to one snapshot, writing results per block."""
+    from neo.tools.t8n.t8n import T8N
+
+    try:
+        alloc = load_json_file(opts.input_alloc)
+        if not isinstance(alloc, dict):
+            raise ValueError("alloc input must be a JSON object")
+
+        t8n = T8N(alloc=alloc, strict=opts.strict)
+        with ExitStack() as stack:
+            if opts.output_receipts == "-":
+                out = sys.stdout
+            else:
+                out = stack.enter_context(open(opts.output_receipts, "w"))
+
+            blocks = 0
+            total_gas = 0
+            for result in t8n.run_blocks(iter_blocks(opts.input_blocks)):
+                record = {"blockNumber": t8n.env.current_block_number, **result.to_dict()}
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                blocks += 1
+                total_gas += result.gas_used
+
+        if opts.output_alloc is not None:
+            write_json_file(opts.output_alloc, t8n.post_alloc())
+
+        if opts.verbose:
+            print(f"Applied {blocks} blocks", file=sys.stderr)
+            print(f"Gas used: {total_gas}", file=sys.stderr)
+
+        return 0
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -5,14 +5,18 @@ Executes transactions against a pre-state and produces post-state.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import hashlib
+from bisect import bisect_left, insort
+from collections.abc import Iterable, Iterator
 from types import SimpleNamespace
 from typing import Any
 
 from neo.crypto.hash import hash256
+from neo.io.binary_writer import get_var_size
 from neo.persistence.snapshot import MemorySnapshot
 from neo.protocol_settings import ProtocolSettings
 from neo.smartcontract.application_engine import ApplicationEngine, VMState
+from neo.smartcontract.capture_policy import CapturePolicy
 from neo.smartcontract.trigger import TriggerType
 from neo.tools.t8n.types import (
     AccountState,
@@ -109,16 +113,6 @@ def _validate_compressed_ecpoint(value: bytes, field_name: str) -> None:
         raise ValueError(f"{field_name} must use compressed ECPoint format")
 
 
-def _var_int_size(value: int) -> int:
-    if value < 0xFD:
-        return 1
-    if value <= 0xFFFF:
-        return 3
-    if value <= 0xFFFF_FFFF:
-        return 5
-    return 9
-
-
 def _estimate_witness_condition_size(condition: Any) -> int:
     cond_type = getattr(condition, "type", None)
     if cond_type == 0x00:  # Boolean
@@ -132,7 +126,7 @@ def _estimate_witness_condition_size(condition: Any) -> int:
         expressions = getattr(condition, "expressions", None)
         if expressions is None:
             raise ValueError("And/Or witness condition is missing expressions")
-        return 1 + _var_int_size(len(expressions)) + sum(_estimate_witness_condition_size(expr) for expr in expressions)
+        return 1 + get_var_size(len(expressions)) + sum(_estimate_witness_condition_size(expr) for expr in expressions)
     if cond_type in (0x18, 0x28):  # ScriptHash / CalledByContract
         return 1 + 20
     if cond_type in (0x19, 0x29):  # Group / CalledByGroup
@@ -319,29 +313,40 @@ class T8N:
     """Neo state transition tool.
 
     Executes transactions against a pre-state allocation
-    and produces the resulting post-state.
+    and produces the resulting post-state. :meth:`run` applies a single
+    block; :meth:`run_blocks` applies a stream of blocks to one persistent
+    snapshot and yields each block's result as soon as it is committed.
     """
 
     def __init__(
         self,
         alloc: dict[str, Any],
-        env: dict[str, Any],
-        txs: list[dict[str, Any]],
+        env: dict[str, Any] | None = None,
+        txs: list[dict[str, Any]] | None = None,
         strict: bool = False,
+        capture_policy: CapturePolicy | None = None,
     ):
         """Initialize t8n with input data.
 
         Args:
             alloc: Pre-state allocation (address -> account state)
-            env: Block environment
+            env: Block environment (per-block environments come with each
+                block in streaming mode)
             txs: List of transactions to execute
             strict: When True, fail fast on transaction validation/execution errors
+            capture_policy: Notification/log capture policy for every
+                transaction; its sink receives the events of each HALTed
+                transaction as it finishes. Receipts only list the
+                notifications the policy retains.
         """
         self.pre_alloc = self._parse_alloc(alloc)
-        self.env = Environment.from_dict(env)
-        self.txs = [TransactionInput.from_dict(tx) for tx in txs]
+        self.env = Environment.from_dict(env or {})
+        self.txs = [TransactionInput.from_dict(tx) for tx in txs or []]
         self.strict = strict
+        self.capture_policy = capture_policy
         self.snapshot = MemorySnapshot()
+        # Sorted keys of the committed store, kept in step by _commit().
+        self._state_keys: list[bytes] | None = None
         self.protocol_settings = self._resolve_protocol_settings(self.env.network)
         self._bind_snapshot_context()
         self.receipts: list[Receipt] = []
@@ -479,7 +484,7 @@ class T8N:
 
         # Unsigned tx size:
         # version(1) + nonce(4) + systemFee(8) + networkFee(8) + validUntilBlock(4)
-        estimated_tx_size = 25 + _var_int_size(len(tx.signers))
+        estimated_tx_size = 25 + get_var_size(len(tx.signers))
 
         seen_accounts: set[bytes] = set()
         for signer in tx.signers:
@@ -531,7 +536,7 @@ class T8N:
             if signer.allowed_contracts and not (scope & custom_contracts_scope):
                 raise ValueError("Signer allowedContracts require CUSTOM_CONTRACTS scope")
             if scope & custom_contracts_scope:
-                signer_size += _var_int_size(len(signer.allowed_contracts))
+                signer_size += get_var_size(len(signer.allowed_contracts))
                 signer_size += 20 * len(signer.allowed_contracts)
 
             if signer.allowed_groups is None:
@@ -543,7 +548,7 @@ class T8N:
             if signer.allowed_groups and not (scope & custom_groups_scope):
                 raise ValueError("Signer allowedGroups require CUSTOM_GROUPS scope")
             if scope & custom_groups_scope:
-                signer_size += _var_int_size(len(signer.allowed_groups))
+                signer_size += get_var_size(len(signer.allowed_groups))
                 signer_size += 33 * len(signer.allowed_groups)
 
             for allowed in signer.allowed_contracts:
@@ -575,13 +580,13 @@ class T8N:
                 raise ValueError(f"Invalid witness rule: {exc}") from exc
 
             if scope & witness_rules_scope:
-                signer_size += _var_int_size(len(parsed_rules))
+                signer_size += get_var_size(len(parsed_rules))
                 signer_size += sum(_estimate_witness_rule_size(rule) for rule in parsed_rules)
 
             estimated_tx_size += signer_size
 
-        estimated_tx_size += _var_int_size(0)  # attributes count
-        estimated_tx_size += _var_int_size(len(script)) + len(script)
+        estimated_tx_size += get_var_size(0)  # attributes count
+        estimated_tx_size += get_var_size(len(script)) + len(script)
         if estimated_tx_size > _MAX_TRANSACTION_SIZE:
             raise ValueError(
                 f"Transaction size exceeds max transaction size: {estimated_tx_size} > {_MAX_TRANSACTION_SIZE}"
@@ -702,6 +707,7 @@ class T8N:
                 script_container=self._build_script_container(tx),
                 network=self.env.network,
                 protocol_settings=self.protocol_settings,
+                capture_policy=self.capture_policy,
             )
             setattr(engine, "persisting_block", getattr(self.snapshot, "persisting_block", None))
             engine.load_script(script)
@@ -747,7 +753,9 @@ class T8N:
     def _iter_snapshot_items(self) -> Iterable[tuple[bytes, bytes]]:
         store = getattr(self.snapshot, "_store", None)
         if isinstance(store, dict):
-            for key in sorted(store):
+            if self._state_keys is None or len(self._state_keys) != len(store):
+                self._state_keys = sorted(store)
+            for key in self._state_keys:
                 value = store[key]
                 if isinstance(value, bytes):
                     yield key, value
@@ -802,10 +810,34 @@ class T8N:
 
     def _compute_state_root(self) -> str:
         """Compute state root hash."""
-        data = b"".join(key + value for key, value in self._iter_snapshot_items())
-        if not data:
-            data = b"\x00"
-        return _bytes_to_hex(hash256(data))
+        # Equivalent to hash256(b"".join(key + value)) without materializing
+        # the concatenated state; the key order comes from _state_keys, so
+        # a block costs one pass over the state rather than a sort.
+        inner = hashlib.sha256()
+        empty = True
+        for key, value in self._iter_snapshot_items():
+            inner.update(key)
+            inner.update(value)
+            empty = False
+        if empty:
+            inner.update(b"\x00")
+        return _bytes_to_hex(hashlib.sha256(inner.digest()).digest())
+
+    def _commit(self) -> None:
+        """Commit the snapshot, folding its change set into the sorted keys."""
+        keys = self._state_keys
+        store = getattr(self.snapshot, "_store", None)
+        changes = getattr(self.snapshot, "_changes", None)
+        if keys is not None and isinstance(store, dict) and isinstance(changes, dict):
+            for key, value in changes.items():
+                if value is None:
+                    if key in store:
+                        del keys[bisect_left(keys, key)]
+                elif key not in store:
+                    insort(keys, key)
+        else:
+            self._state_keys = None
+        self.snapshot.commit()
 
     def _validate_block_envelope(self) -> str | None:
         max_txs = int(self.protocol_settings.max_transactions_per_block)
@@ -813,16 +845,24 @@ class T8N:
             return f"Transaction list exceeds max transactions per block: {len(self.txs)} > {max_txs}"
         return None
 
-    def run(self) -> T8NOutput:
-        """Execute all transactions and return result."""
-        self._init_state()
+    def _begin_block(self, env: dict[str, Any], txs: list[dict[str, Any]]) -> None:
+        """Reset per-block inputs and bind the next block's context."""
+        self.env = Environment.from_dict(env)
+        self.txs = [TransactionInput.from_dict(tx) for tx in txs]
+        if self.env.network != self.protocol_settings.network:
+            self.protocol_settings = self._resolve_protocol_settings(self.env.network)
+        self._bind_snapshot_context()
+        self.receipts = []
+        self.total_gas_used = 0
 
+    def _apply_block(self) -> T8NResult:
+        """Execute the current block's transactions and commit them."""
         block_error = self._validate_block_envelope()
         if block_error is not None:
             if self.strict:
                 raise ValueError(block_error)
             # Preserve no-op state semantics for overflowed blocks.
-            self.snapshot.commit()
+            self._commit()
             self.receipts = [
                 Receipt(
                     tx_hash=self._compute_tx_hash(tx, index),
@@ -834,21 +874,45 @@ class T8N:
                 )
                 for index, tx in enumerate(self.txs)
             ]
-            result = T8NResult(
-                state_root=self._compute_state_root(),
-                receipts=self.receipts,
-                gas_used=self.total_gas_used,
-            )
-            return T8NOutput(result=result, alloc=self._extract_post_alloc())
-
-        for index, tx in enumerate(self.txs):
-            self.receipts.append(self._execute_tx(tx, index))
-
-        self.snapshot.commit()
+        else:
+            for index, tx in enumerate(self.txs):
+                self.receipts.append(self._execute_tx(tx, index))
+            self._commit()
 
-        result = T8NResult(
+        return T8NResult(
             state_root=self._compute_state_root(),
             receipts=self.receipts,
             gas_used=self.total_gas_used,
         )
+
+    def run(self) -> T8NOutput:
+        """Execute all transactions and return result."""
+        self._init_state()
+        result = self._apply_block()
         return T8NOutput(result=result, alloc=self._extract_post_alloc())
+
+    def run_blocks(self, blocks: Iterable[dict[str, Any]]) -> Iterator[T8NResult]:
+        """Apply a stream of blocks to one snapshot, yielding each result.
+
+        Each block is a mapping with an ``env`` object and a ``txs`` array.
+        The pre-state allocation is loaded once; every block then builds on
+        the committed state of the previous one. Blocks are consumed lazily,
+        so callers can emit receipts and roots while later blocks are still
+        being read. Use :meth:`post_alloc` for the final allocation.
+        """
+        self._init_state()
+        for number, block in enumerate(blocks):
+            if not isinstance(block, dict):
+                raise ValueError(f"block {number} must be a JSON object")
+            env = block.get("env", {})
+            txs = block.get("txs", [])
+            if not isinstance(env, dict):
+                raise ValueError(f"block {number} env must be a JSON object")
+            if not isinstance(txs, list):
+                raise ValueError(f"block {number} txs must be a JSON array")
+            self._begin_block(env, txs)
+            yield self._apply_block()
+
+    def post_alloc(self) -> dict[str, dict[str, Any]]:
+        """Return the post-state allocation of the committed snapshot."""
+        return self._extract_post_alloc()
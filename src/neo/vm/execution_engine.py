@@ -38,7 +38,8 @@ class VMUnhandledException(Exception):
         self.exception = exception
         super().__init__(f"Unhandled VM exception: {exception}")
 
-@dataclass
+# Engines compare by identity so per-engine caches can use them as keys.
+@dataclass(eq=False)
 class ExecutionEngine:
     limits: ExecutionEngineLimits = field(default_factory=ExecutionEngineLimits)
     invocation_stack: list[ExecutionContext] = field(default_factory=list)
@@ -158,3 +158,64 @@ class TestBloomFilter:
         bf = BloomFilter(m=64, k=3)
         bf.add(b"")
         assert bf.check(b"")
+
+
+class TestBloomFilterBatch:
+    """Batch APIs and the optional NumPy path."""
+
+    ELEMENTS = [bytes([i]) * (i % 40) for i in range(120)]
+
+    def _reference(self, m, k, seed, elements):
+        from neo.crypto.murmur3 import murmur32
+
+        bits = bytearray((m + 7) // 8)
+        for element in elements:
+            for i in range(k):
+                h = murmur32(element, (i * 0xFBA4C795 + seed) & 0xFFFFFFFF) % m
+                bits[h // 8] |= 1 << (h % 8)
+        return bytes(bits)
+
+    def test_add_many_matches_reference(self):
+        bf = BloomFilter(m=1021, k=5, seed=99)
+        bf.add_many(self.ELEMENTS[:60])
+        assert bf.get_bits() == self._reference(1021, 5, 99, self.ELEMENTS[:60])
+
+    def test_check_many_matches_check(self):
+        bf = BloomFilter(m=512, k=4, seed=3)
+        bf.add_many(self.ELEMENTS[::2])
+        assert bf.check_many(self.ELEMENTS) == [bf.check(e) for e in self.ELEMENTS]
+        assert all(bf.check_many(self.ELEMENTS[::2]))
+
+    def test_python_path_matches_numpy_path(self, monkeypatch):
+        from neo.crypto import bloom_filter
+
+        if not bloom_filter.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        probes = self.ELEMENTS + [b"absent" + bytes([i]) for i in range(60)]
+        fast = BloomFilter(m=2048, k=7, seed=1)
+        fast.add_many(self.ELEMENTS)
+        fast_hits = fast.check_many(probes)
+        monkeypatch.setattr(bloom_filter, "HAS_NUMPY", False)
+        slow = BloomFilter(m=2048, k=7, seed=1)
+        slow.add_many(self.ELEMENTS)
+        assert fast.get_bits() == slow.get_bits()
+        assert fast.get_bits() == self._reference(2048, 7, 1, self.ELEMENTS)
+        assert fast_hits == slow.check_many(probes)
+        assert fast_hits == [slow.check(e) for e in probes]
+
+    def test_match_transactions_by_hash_or_signer(self):
+        from types import SimpleNamespace
+
+        from neo.types import UInt160, UInt256
+
+        def tx(n):
+            return SimpleNamespace(
+                hash=UInt256(bytes([n]) * 32),
+                signers=[SimpleNamespace(account=UInt160(bytes([n + 100]) * 20))],
+            )
+
+        txs = [tx(n) for n in range(4)]
+        bf = BloomFilter(m=4096, k=3, seed=0)
+        bf.add(bytes(txs[1].hash))
+        bf.add(bytes(txs[3].signers[0].account))
+        assert bf.match_transactions(txs) == [False, True, False, True]
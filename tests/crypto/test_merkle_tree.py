@@ -1,6 +1,10 @@
 """Tests for Merkle Tree."""
 
-from neo.crypto.merkle_tree import compute_root
+import random
+
+import pytest
+
+from neo.crypto.merkle_tree import MerkleTree, compute_root
 from neo.crypto.hash import hash256
 
 
@@ -25,3 +29,92 @@ class TestMerkleTree:
         result = compute_root([h1, h2])
         expected = hash256(h1 + h2)
         assert result == expected
+
+
+def _leaves(count):
+    return [hash256(bytes([i])) for i in range(count)]
+
+
+class _Node:
+    """Object tree built like C# MerkleTree, as a reference for trimming."""
+
+    def __init__(self, hash, left=None, right=None):
+        self.hash, self.left, self.right = hash, left, right
+
+
+def _reference_partial(leaves, flags):
+    level = [_Node(h) for h in leaves]
+    depth = 1
+    while len(level) > 1:
+        pairs = []
+        for i in range(0, len(level), 2):
+            left = level[i]
+            right = level[i + 1] if i + 1 < len(level) else left
+            pairs.append(_Node(hash256(left.hash + right.hash), left, right))
+        level = pairs
+        depth += 1
+    bits = [i < len(flags) and flags[i] for i in range(1 << (depth - 1))]
+
+    def trim(node, index, d):
+        if d == 1 or node.left is None:
+            return
+        if d == 2:
+            if not bits[index * 2] and not bits[index * 2 + 1]:
+                node.left = node.right = None
+        else:
+            trim(node.left, index * 2, d - 1)
+            trim(node.right, index * 2 + 1, d - 1)
+            if node.left.left is None and node.right.right is None:
+                node.left = node.right = None
+
+    trim(level[0], 0, depth)
+    out = []
+
+    def collect(node):
+        if node.left is None:
+            out.append(node.hash)
+        else:
+            collect(node.left)
+            collect(node.right)
+
+    collect(level[0])
+    return out
+
+
+class TestIncrementalMerkleTree:
+    """Stored levels, appends, batch proofs and partial trees."""
+
+    def test_append_matches_rebuild(self):
+        tree = MerkleTree()
+        assert tree.root == bytes(32)
+        for count in range(1, 20):
+            tree.append(_leaves(count)[-1])
+            assert tree.root == compute_root(_leaves(count))
+            assert tree.depth == MerkleTree(_leaves(count)).depth
+
+    def test_batch_proofs(self):
+        leaves = _leaves(11)
+        tree = MerkleTree(leaves)
+        indices = [0, 5, 10, 3]
+        proofs = tree.get_proofs(indices)
+        for index, proof in zip(indices, proofs):
+            assert proof == tree.get_proof(index)
+            assert MerkleTree.verify_proof(leaves[index], proof, tree.root, index)
+        chosen = [leaves[i] for i in indices]
+        assert MerkleTree.verify_proofs(chosen, proofs, tree.root, indices)
+
+        chosen[1] = hash256(b"forged")
+        assert not MerkleTree.verify_proofs(chosen, proofs, tree.root, indices)
+
+    def test_get_proofs_out_of_range(self):
+        with pytest.raises(IndexError):
+            MerkleTree(_leaves(3)).get_proofs([0, 3])
+
+    def test_partial_hashes_match_reference(self):
+        rng = random.Random(7)
+        for count in range(1, 14):
+            leaves = _leaves(count)
+            tree = MerkleTree(leaves)
+            for _ in range(8):
+                flags = [rng.random() < 0.3 for _ in range(count)]
+                assert tree.get_partial_hashes(flags) == _reference_partial(leaves, flags)
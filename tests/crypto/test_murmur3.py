@@ -106,3 +106,12 @@ class TestMurmur32:
         # Verify seed affects output
         h3 = murmur32(b"Neo", 12345)
         assert h1 != h3
+
+
+def test_murmur32_many_matches_single_seed():
+    from neo.crypto.murmur3 import murmur32, murmur32_many
+
+    seeds = [0, 1, 0xFBA4C795, 0xFFFFFFFF]
+    for length in range(9):
+        data = bytes(range(length))
+        assert murmur32_many(data, seeds) == [murmur32(data, s) for s in seeds]
@@ -0,0 +1,163 @@
+"""Tests for the pipelined block importer."""
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, utils
+
+from neo.crypto.ecc.curve import SECP256R1
+from neo.crypto.ecc.point import ECPoint
+from neo.crypto.hash import hash160
+from neo.crypto.merkle_tree import MerkleTree
+from neo.exceptions import InvalidOperationException
+from neo.io.binary_writer import BinaryWriter
+from neo.ledger.block_importer import BlockImporter, prepare_block
+from neo.ledger.blockchain import Blockchain
+from neo.ledger.verify_result import VerifyResult
+from neo.network.payloads.block import Block
+from neo.network.payloads.signer import Signer
+from neo.network.payloads.transaction import Transaction
+from neo.network.payloads.witness import Witness
+from neo.persistence.memory_store import MemoryStore
+from neo.smartcontract.syscalls.contract import (
+    _create_multisig_redeem_script,
+    _create_signature_redeem_script,
+)
+from neo.types import UInt160, UInt256
+from neo.vm.script_builder import ScriptBuilder
+
+
+def _consensus_key(secret: int) -> tuple[ec.EllipticCurvePrivateKey, bytes]:
+    """A validator key and its 1-of-1 multisig redeem script."""
+    key = ec.derive_private_key(secret, ec.SECP256R1())
+    numbers = key.public_key().public_numbers()
+    pubkey = ECPoint(numbers.x, numbers.y, SECP256R1).encode(compressed=True)
+    return key, _create_multisig_redeem_script(1, [pubkey])
+
+
+VALIDATOR, CONSENSUS_SCRIPT = _consensus_key(0xC0FFEE)
+
+
+def _sign(block: Block, key: ec.EllipticCurvePrivateKey = VALIDATOR, script=CONSENSUS_SCRIPT):
+    der = key.sign(block.hash.data, ec.ECDSA(utils.Prehashed(hashes.SHA256())))
+    r, s = utils.decode_dss_signature(der)
+    sb = ScriptBuilder()
+    sb.emit_push(r.to_bytes(32, "big") + s.to_bytes(32, "big"))
+    block.witness = Witness(sb.to_bytes(), script)
+
+
+def _tx(nonce: int, verification: bytes = b"") -> Transaction:
+    """A transaction whose witness defers to chain state unless ``verification`` is set."""
+    return Transaction(
+        nonce=nonce,
+        valid_until_block=100,
+        signers=[Signer(account=UInt160(b"\x01" * 20))],
+        script=b"\x11\x40",
+        witnesses=[Witness(b"", verification)],
+    )
+
+
+def _block(index: int, prev: Block | None, txs=()) -> Block:
+    txs = list(txs)
+    merkle = MerkleTree.compute_root([tx.hash.data for tx in txs]) if txs else bytes(32)
+    block = Block(
+        index=index,
+        timestamp=1_000 + index,
+        prev_hash=prev.hash if prev is not None else UInt256.ZERO,
+        merkle_root=merkle,
+        next_consensus=hash160(CONSENSUS_SCRIPT),
+        transactions=txs,
+    )
+    _sign(block)
+    return block
+
+
+def _chain(count: int, txs_at=None) -> list[Block]:
+    blocks: list[Block] = []
+    for index in range(count):
+        txs = txs_at.get(index, []) if txs_at else []
+        blocks.append(_block(index, blocks[-1] if blocks else None, txs))
+    return blocks
+
+
+class TestPrepareBlock:
+    """Stateless verification run on the worker pool."""
+
+    def test_valid_block_and_wire_bytes(self):
+        block = _block(0, None, [_tx(1)])
+        assert prepare_block(block).result == VerifyResult.SUCCEED
+
+        writer = BinaryWriter()
+        block.serialize(writer)
+        prepared = prepare_block(writer.to_bytes())
+        assert prepared.result == VerifyResult.SUCCEED
+        assert prepared.block.hash == block.hash
+
+    def test_verification_script_must_match_signer(self):
+        script = _create_signature_redeem_script(b"\x02" + b"\x22" * 32)
+        block = _block(0, None, [_tx(1, verification=script)])
+        assert prepare_block(block).result == VerifyResult.INVALID_SIGNATURE
+
+    def test_custom_verification_script_is_left_unverified(self):
+        # Non-standard scripts may read chain state, so they are not run here.
+        block = _block(0, None, [_tx(1, verification=b"\x11")])
+        assert prepare_block(block).result == VerifyResult.SUCCEED
+
+    def test_bad_merkle_root(self):
+        block = _block(0, None, [_tx(1)])
+        block.merkle_root = bytes(32)
+        assert prepare_block(block).result == VerifyResult.INVALID
+
+    def test_block_witness_is_checked(self):
+        genesis = _block(0, None)
+        block = _block(1, genesis)
+        assert prepare_block(block).result == VerifyResult.SUCCEED
+
+        _sign(block, key=_consensus_key(0xBEEF)[0])
+        assert prepare_block(block).result == VerifyResult.INVALID_SIGNATURE
+
+        block.witness = Witness(b"", b"\x11")
+        assert prepare_block(block).result == VerifyResult.INVALID_SIGNATURE
+
+
+class TestBlockImporter:
+    """Ordered persistence of pre-verified blocks."""
+
+    def setup_method(self):
+        from neo.native import initialize_native_contracts
+
+        initialize_native_contracts()
+
+    def test_imports_in_order(self):
+        blocks = _chain(6)
+        bc = Blockchain(MemoryStore())
+        importer = BlockImporter(bc, lookahead=3)
+        imported = [block for block, _results in importer.import_blocks(blocks)]
+        assert imported == blocks
+        assert bc.height == 5
+
+    def test_stops_at_first_invalid_block(self):
+        blocks = _chain(4)
+        blocks[2].version = 1
+        bc = Blockchain(MemoryStore())
+        with pytest.raises(InvalidOperationException, match="Block 2"):
+            list(BlockImporter(bc, lookahead=2).import_blocks(blocks))
+        assert bc.height == 1
+
+    def test_broken_chain_link_rejected(self):
+        blocks = _chain(3)
+        blocks[2].prev_hash = UInt256.ZERO
+        bc = Blockchain(MemoryStore())
+        with pytest.raises(InvalidOperationException, match="Block 2"):
+            list(BlockImporter(bc).import_blocks(blocks))
+        assert bc.height == 1
+
+    def test_witness_must_match_previous_next_consensus(self):
+        blocks = _chain(3)
+        other_key, other_script = _consensus_key(0xBEEF)
+        _sign(blocks[2], key=other_key, script=other_script)
+        assert prepare_block(blocks[2]).result == VerifyResult.SUCCEED
+
+        bc = Blockchain(MemoryStore())
+        with pytest.raises(InvalidOperationException, match="Block 2.*INVALID_SIGNATURE"):
+            list(BlockImporter(bc).import_blocks(blocks))
+        assert bc.height == 1
@@ -16,3 +16,177 @@ class TestBlockchain:
         store = MemoryStore()
         bc = Blockchain(store)
         assert bc.height == -1  # No blocks yet
+
+
+def _tx(nonce: int, script: bytes):
+    from neo.network.payloads.signer import Signer
+    from neo.network.payloads.transaction import Transaction
+    from neo.network.payloads.witness import Witness
+    from neo.protocol_settings import ProtocolSettings
+
+    # The BFT address receives the initial GAS distribution at genesis.
+    return Transaction(
+        nonce=nonce,
+        system_fee=1_000_000,
+        valid_until_block=100,
+        signers=[Signer(account=ProtocolSettings().get_bft_address())],
+        script=script,
+        witnesses=[Witness.empty()],
+    )
+
+
+def _block(index: int, prev_hash=None, txs=()):
+    from neo.network.payloads.block import Block
+    from neo.network.payloads.witness import Witness
+
+    block = Block(index=index, witness=Witness(b"\x00", b"\x00"), transactions=list(txs))
+    if prev_hash is not None:
+        block.prev_hash = prev_hash
+    return block
+
+
+class TestPersistPipeline:
+    """Blockchain.persist runs the native and transaction phases."""
+
+    def setup_method(self):
+        from neo.native import initialize_native_contracts
+
+        initialize_native_contracts()
+
+    def test_persist_runs_phases_and_commits(self):
+        from neo.native.native_contract import NativeContract
+        from neo.persistence.data_cache import DataCache
+        from neo.vm.execution_engine import VMState
+
+        store = MemoryStore()
+        bc = Blockchain(store)
+        genesis = _block(0)
+        results = bc.persist(genesis)
+        assert [r.trigger for r in results] == ["OnPersist", "PostPersist"]
+        assert all(r.vm_state == "HALT" for r in results)
+
+        halting, faulting = _tx(1, b"\x11\x40"), _tx(2, b"\x38")  # PUSH1 RET / ABORT
+        results = bc.persist(_block(1, genesis.hash, [halting, faulting]))
+        assert [(r.trigger, r.vm_state) for r in results] == [
+            ("OnPersist", "HALT"),
+            ("Application", "HALT"),
+            ("Application", "FAULT"),
+            ("PostPersist", "HALT"),
+        ]
+        assert results[1].tx_hash == halting.hash
+        assert int(results[1].stack[0].get_integer()) == 1
+
+        ledger = NativeContract.get_contract_by_name("LedgerContract")
+        assert ledger.current_index(DataCache(store)) == 1
+        states = [
+            ledger.get_transaction_state(DataCache(store), tx.hash).state
+            for tx in (halting, faulting)
+        ]
+        assert states == [VMState.HALT, VMState.FAULT]
+        assert bc.height == 1
+
+        timings = bc.last_timings
+        assert len(timings.transactions) == 2
+        assert timings.total >= timings.commit >= 0
+
+    def test_failed_system_phase_leaves_store_untouched(self, monkeypatch):
+        import pytest
+
+        from neo.exceptions import InvalidOperationException
+        from neo.native.native_contract import NativeContract
+
+        store = MemoryStore()
+        bc = Blockchain(store)
+        ledger = NativeContract.get_contract_by_name("LedgerContract")
+
+        def fail(_engine):
+            raise InvalidOperationException("boom")
+
+        monkeypatch.setattr(ledger, "post_persist", fail)
+        with pytest.raises(InvalidOperationException, match="PostPersist"):
+            bc.persist(_block(0))
+        assert store._data == {}  # noqa: SLF001
+        assert bc.height == -1
+
+    def test_attached_mempool_follows_committed_blocks(self):
+        from neo.ledger.mempool import MemoryPool
+        from neo.ledger.verify_result import VerifyResult
+        from neo.native.native_contract import NativeContract
+
+        ledger = NativeContract.get_contract_by_name("LedgerContract")
+        heights: list[int] = []
+
+        class _Verifier:
+            @staticmethod
+            def verify_state_independent(tx):
+                return VerifyResult.SUCCEED
+
+            @staticmethod
+            def verify_state_dependent(tx, snapshot, height):
+                heights.append(ledger.current_index(snapshot))
+                return VerifyResult.SUCCEED
+
+        bc = Blockchain(MemoryStore())
+        genesis = _block(0)
+        bc.persist(genesis)
+        pool = MemoryPool(verifier=_Verifier)
+        bc.attach_mempool(pool)
+        included, pending = _tx(1, b"\x11\x40"), _tx(2, b"\x12\x40")
+        pool.try_add(included)
+        pool.try_add(pending)
+
+        bc.persist(_block(1, genesis.hash, [included]))
+        assert not pool.contains_key(included.hash)
+        assert pool.verified_count == 1 and pool.contains_key(pending.hash)
+        assert heights == [1]
+
+
+class TestBlockIndexAndCache:
+    """Height index, bounded body cache and pinned headers."""
+
+    def setup_method(self):
+        from neo.native import initialize_native_contracts
+
+        initialize_native_contracts()
+
+    def _chain(self, count: int, txs_at: int | None = None):
+        bc = Blockchain(MemoryStore())
+        prev = None
+        blocks = []
+        for index in range(count):
+            txs = [_tx(index, b"\x11\x40")] if index == txs_at else []
+            block = _block(index, prev, txs)
+            bc.persist(block)
+            blocks.append(block)
+            prev = block.hash
+        return bc, blocks
+
+    def test_lookup_by_index_and_hash(self):
+        bc, blocks = self._chain(4)
+        assert bc.get_block_hash(2) == blocks[2].hash
+        assert bc.get_block_by_index(3) is blocks[3]
+        assert bc.get_block_hash(4) is None and bc.get_block_by_index(-1) is None
+        assert bc.contains_block(blocks[1].hash)
+
+    def test_evicted_blocks_are_rebuilt_from_ledger_storage(self, monkeypatch):
+        monkeypatch.setattr(Blockchain, "BLOCK_CACHE_SIZE", 2)
+        bc, blocks = self._chain(5, txs_at=1)
+        assert len(bc._block_cache) == 2  # noqa: SLF001
+
+        rebuilt = bc.get_block_by_index(1)
+        assert rebuilt is not blocks[1]
+        assert rebuilt.hash == blocks[1].hash
+        assert [tx.hash for tx in rebuilt.transactions] == [blocks[1].transactions[0].hash]
+        assert bc.get_block_by_index(1) is rebuilt
+        assert len(bc._block_cache) == 2  # noqa: SLF001
+
+    def test_recent_headers_pinned(self, monkeypatch):
+        monkeypatch.setattr(Blockchain, "PINNED_HEADERS", 2)
+        bc, blocks = self._chain(4)
+
+        pinned = bc.get_header(3)
+        assert pinned is bc.get_header(3)
+        assert pinned.index == 3 and pinned.prev_hash == blocks[2].hash
+        # Older headers come from the stored TrimmedBlock.
+        assert bc.get_header(0).index == 0
+        assert bc.get_header(9) is None
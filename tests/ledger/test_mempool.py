@@ -1,6 +1,7 @@
 """Tests for MemoryPool."""
 
 from neo.ledger.mempool import MemoryPool
+from neo.ledger.tx_removal_reason import TransactionRemovalReason
 from neo.ledger.verify_result import VerifyResult
 from neo.network.payloads.transaction import Transaction
 
@@ -60,3 +61,252 @@ class TestMemoryPool:
         pool.clear()
         assert pool.count == 0
         assert pool.verified_count == 0
+
+
+def _fee_tx(nonce: int, network_fee: int, account: int = 1, system_fee: int = 0) -> Transaction:
+    from neo.network.payloads.signer import Signer
+    from neo.types.uint160 import UInt160
+
+    return Transaction(
+        nonce=nonce,
+        network_fee=network_fee,
+        system_fee=system_fee,
+        script=b"\x40",
+        signers=[Signer(account=UInt160(bytes([account]) * 20))],
+    )
+
+
+class _BalanceSnapshot:
+    def __init__(self, balance: int) -> None:
+        self.balance = balance
+
+    def get_gas_balance(self, _account) -> int:
+        return self.balance
+
+
+class TestMemoryPoolPriority:
+    """Fee ordering, eviction and sender fee accounting."""
+
+    def test_sorted_verified_transactions(self):
+        pool = MemoryPool()
+        txs = [_fee_tx(i, fee) for i, fee in enumerate([5_000, 90_000, 30_000, 60_000])]
+        for tx in txs:
+            pool.try_add(tx)
+
+        fees = [tx.network_fee for tx in pool.get_sorted_verified_transactions()]
+        assert fees == [90_000, 60_000, 30_000, 5_000]
+        top = pool.get_sorted_verified_transactions(2)
+        assert [tx.network_fee for tx in top] == [90_000, 60_000]
+        assert pool.get_verified_transactions() == pool.get_sorted_verified_transactions()
+
+    def test_high_priority_attribute_ranks_first(self):
+        from neo.network.payloads.transaction_attribute import HighPriorityAttribute
+
+        pool = MemoryPool()
+        rich = _fee_tx(1, 1_000_000)
+        urgent = _fee_tx(2, 0)
+        urgent.attributes = [HighPriorityAttribute()]
+        pool.try_add(rich)
+        pool.try_add(urgent)
+        assert pool.get_sorted_verified_transactions(1) == [urgent]
+
+    def test_full_pool_evicts_lowest_priority(self):
+        removed = []
+        pool = MemoryPool(capacity=2, on_removed=lambda tx, reason: removed.append((tx, reason)))
+        low, mid, high = _fee_tx(1, 1_000), _fee_tx(2, 50_000), _fee_tx(3, 90_000)
+        pool.try_add(low)
+        pool.try_add(mid)
+
+        assert pool.try_add(high) == VerifyResult.SUCCEED
+        assert pool.count == 2
+        assert not pool.contains_key(low.hash)
+        assert removed == [(low, TransactionRemovalReason.CAPACITY_EXCEEDED)]
+
+        assert pool.try_add(_fee_tx(4, 10)) == VerifyResult.OUT_OF_MEMORY
+        assert pool.count == 2
+
+    def test_unverified_evicted_before_verified_peer(self):
+        pool = MemoryPool(capacity=2)
+        old = _fee_tx(1, 40_000)
+        pool.try_add(old)
+        pool.invalidate_verified_transactions()
+        fresh = _fee_tx(2, 20_000)
+        pool.try_add(fresh)
+
+        assert pool.try_add(_fee_tx(3, 60_000)) == VerifyResult.SUCCEED
+        assert pool.contains_key(old.hash)
+        assert not pool.contains_key(fresh.hash)
+
+    def test_sender_fees_are_cumulative(self):
+        pool = MemoryPool()
+        snapshot = _BalanceSnapshot(balance=100)
+        first = _fee_tx(1, 40, system_fee=20)
+        second = _fee_tx(2, 31, system_fee=10)
+        other_sender = _fee_tx(3, 60, account=2)
+
+        assert pool.try_add(first, snapshot) == VerifyResult.SUCCEED
+        assert pool.try_add(second, snapshot) == VerifyResult.INSUFFICIENT_FUNDS
+        assert pool.try_add(other_sender, snapshot) == VerifyResult.SUCCEED
+        assert pool.verification_context.sender_fee[first.sender] == 60
+
+        pool.remove(first.hash)
+        assert pool.try_add(second, snapshot) == VerifyResult.SUCCEED
+        assert pool.verification_context.sender_fee[second.sender] == 41
+
+    def test_invalidate_keeps_priority_order(self):
+        pool = MemoryPool()
+        txs = [_fee_tx(i, fee) for i, fee in enumerate([7, 3, 9, 1])]
+        for tx in txs[:2]:
+            pool.try_add(tx)
+        pool.invalidate_verified_transactions()
+        for tx in txs[2:]:
+            pool.try_add(tx)
+        pool.invalidate_verified_transactions()
+
+        assert pool.verified_count == 0
+        assert pool.verification_context.sender_fee == {}
+        ordered = [item.tx.network_fee for item in pool._unverified.descending()]  # noqa: SLF001
+        assert ordered == [9, 7, 3, 1]
+
+    def test_removed_items_leave_the_priority_order(self):
+        pool = MemoryPool(capacity=10)
+        txs = [_fee_tx(i, fee) for i, fee in enumerate(range(100, 160))]
+        for tx in txs[:10]:
+            pool.try_add(tx)
+        for tx in txs[:8]:
+            pool.remove(tx.hash)
+        pool.try_add(txs[0])
+        # 100 is back; the other removed fees must not resurface.
+        for tx in txs[20:28]:
+            assert pool.try_add(tx) == VerifyResult.SUCCEED
+        fees = [tx.network_fee for tx in pool.get_sorted_verified_transactions()]
+        assert fees == sorted(fees, reverse=True)
+        assert fees == [127, 126, 125, 124, 123, 122, 121, 120, 109, 108]
+        top = pool.get_sorted_verified_transactions(3)
+        assert [tx.network_fee for tx in top] == [127, 126, 125]
+
+
+class _StubVerifier:
+    """Counts verifier calls; transactions in ``invalid`` fail state checks."""
+
+    def __init__(self, invalid=()) -> None:
+        self.invalid = set(invalid)
+        self.independent = 0
+        self.dependent: list = []
+
+    def verify_state_independent(self, tx):
+        self.independent += 1
+        return VerifyResult.SUCCEED
+
+    def verify_state_dependent(self, tx, snapshot, block_height):
+        self.dependent.append(tx.hash)
+        if tx.valid_until_block and tx.valid_until_block <= block_height:
+            return VerifyResult.EXPIRED
+        return VerifyResult.INVALID if tx.hash in self.invalid else VerifyResult.SUCCEED
+
+
+def _block(index: int, txs: list):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(index=index, transactions=txs)
+
+
+class TestMemoryPoolReverification:
+    """Pool maintenance after a block is persisted."""
+
+    def _pool(self, verifier, txs):
+        removed = []
+        pool = MemoryPool(
+            on_removed=lambda tx, reason: removed.append((tx.hash, reason)), verifier=verifier
+        )
+        for tx in txs:
+            pool.try_add(tx)
+        return pool, removed
+
+    def test_block_transactions_leave_pool_and_rest_reverified(self):
+        verifier = _StubVerifier()
+        txs = [_fee_tx(i, 1_000 * (i + 1)) for i in range(4)]
+        pool, removed = self._pool(verifier, txs)
+
+        moved = pool.update_pool_for_block_persisted(_block(1, [txs[0]]), _BalanceSnapshot(10**9))
+        assert moved == 3
+        assert not pool.contains_key(txs[0].hash)
+        assert pool.verified_count == 3 and pool.unverified_count == 0
+        assert removed == []
+
+    def test_highest_priority_reverified_first_within_budget(self):
+        verifier = _StubVerifier()
+        txs = [_fee_tx(i, 1_000 * (i + 1)) for i in range(5)]
+        pool, _removed = self._pool(verifier, txs)
+
+        moved = pool.update_pool_for_block_persisted(
+            _block(1, []), _BalanceSnapshot(10**9), max_count=2
+        )
+        assert moved == 2
+        assert verifier.dependent == [txs[4].hash, txs[3].hash]
+        assert pool.unverified_count == 3
+
+        pool.reverify_top_unverified(_BalanceSnapshot(10**9), 1, max_count=10)
+        assert pool.verified_count == 5
+
+    def test_zero_time_budget_defers_everything(self):
+        pool, _removed = self._pool(_StubVerifier(), [_fee_tx(1, 10)])
+        moved = pool.update_pool_for_block_persisted(
+            _block(1, []), _BalanceSnapshot(1), time_budget=0
+        )
+        assert moved == 0
+        assert pool.unverified_count == 1
+
+    def test_state_independent_result_is_cached(self):
+        verifier = _StubVerifier()
+        pool, _removed = self._pool(verifier, [_fee_tx(1, 10), _fee_tx(2, 20)])
+        snapshot = _BalanceSnapshot(10**9)
+
+        pool.update_pool_for_block_persisted(_block(1, []), snapshot)
+        pool.update_pool_for_block_persisted(_block(2, []), snapshot)
+        assert verifier.independent == 2
+        assert len(verifier.dependent) == 4
+
+    def test_invalid_and_expired_transactions_removed(self):
+        bad = _fee_tx(1, 10)
+        expired = _fee_tx(2, 20)
+        expired.valid_until_block = 1
+        good = _fee_tx(3, 30)
+        pool, removed = self._pool(_StubVerifier(invalid={bad.hash}), [bad, expired, good])
+
+        pool.update_pool_for_block_persisted(_block(1, []), _BalanceSnapshot(10**9))
+        assert pool.count == 1 and pool.contains_key(good.hash)
+        assert set(removed) == {
+            (bad.hash, TransactionRemovalReason.INVALID),
+            (expired.hash, TransactionRemovalReason.EXPIRED),
+        }
+
+    def test_sender_balance_checked_cumulatively(self):
+        first = _fee_tx(1, 60)
+        second = _fee_tx(2, 50)
+        pool, removed = self._pool(_StubVerifier(), [first, second])
+
+        pool.update_pool_for_block_persisted(_block(1, []), _BalanceSnapshot(100))
+        assert pool.contains_key(first.hash) and not pool.contains_key(second.hash)
+        assert removed == [(second.hash, TransactionRemovalReason.INVALID)]
+
+    def test_conflicting_transactions_removed(self):
+        from neo.network.payloads.transaction_attribute import ConflictsAttribute
+
+        pooled = _fee_tx(1, 10)
+        other_signer = _fee_tx(2, 10, account=7)
+        declares = _fee_tx(3, 10, account=8)
+        on_chain = _fee_tx(4, 10)
+        on_chain.attributes = [
+            ConflictsAttribute(hash=pooled.hash.data),
+            ConflictsAttribute(hash=other_signer.hash.data),
+        ]
+        declares.attributes = [ConflictsAttribute(hash=on_chain.hash.data)]
+        pool, removed = self._pool(_StubVerifier(), [pooled, other_signer, declares])
+
+        pool.update_pool_for_block_persisted(_block(1, [on_chain]), _BalanceSnapshot(10**9))
+        assert pool.count == 1 and pool.contains_key(other_signer.hash)
+        assert set(removed) == {
+            (pooled.hash, TransactionRemovalReason.CONFLICT),
+            (declares.hash, TransactionRemovalReason.CONFLICT),
+        }
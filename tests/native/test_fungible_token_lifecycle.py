@@ -14,10 +14,11 @@ import pytest
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from neo.types import UInt160
-from neo.native.native_contract import NativeContract, StorageKey
+from neo.native.native_contract import NativeContract, StorageItem, StorageKey
 from neo.native.fungible_token import (
     FungibleToken,
     AccountState,
+    PREFIX_ACCOUNT,
 )
 
 
@@ -332,3 +333,102 @@ class TestTransfer:
         result = token.transfer(engine, ALICE, BOB, 100)
         assert result is True
         assert token.balance_of(snap, ALICE) == 400
+
+
+# ---------------------------------------------------------------------------
+# Decoded state cache
+# ---------------------------------------------------------------------------
+
+class TestDecodedStateCache:
+    """Account states are decoded once per storage item and re-encoded lazily."""
+
+    def test_repeated_transfers_decode_sender_once(self, monkeypatch):
+        token, snap, engine = _setup()
+        token.mint(engine, ALICE, 1_000, call_on_payment=False)
+
+        decodes = []
+        original = AccountState.from_bytes.__func__
+        monkeypatch.setattr(
+            AccountState,
+            "from_bytes",
+            classmethod(lambda cls, data: decodes.append(data) or original(cls, data)),
+        )
+
+        for _ in range(50):
+            assert token.transfer(engine, ALICE, BOB, 1) is True
+
+        assert len(decodes) == 1  # only the recipient's freshly created item
+        key = token._create_storage_key(PREFIX_ACCOUNT, ALICE.data)
+        assert AccountState.from_bytes(snap.get(key).value).balance == 950
+        assert token.balance_of(snap, BOB) == 50
+
+    def test_value_reencodes_after_mutation(self):
+        item = StorageItem(AccountState(balance=5).to_bytes())
+        state = item.get_interoperable(AccountState)
+        assert item.get_interoperable(AccountState) is state
+        state.balance = 9
+        assert item.value == AccountState(balance=9).to_bytes()
+
+        item.value = AccountState(balance=1).to_bytes()
+        assert item.get_interoperable(AccountState) is not state
+        assert item.get_interoperable(AccountState).balance == 1
+
+    def test_integer_cache(self):
+        item = StorageItem()
+        item.add(300)
+        item.add(-1)
+        assert int(item) == 299
+        assert item.value == (299).to_bytes(2, "little", signed=True)
+        item.set(0)
+        assert item.value == b"\x00"
+
+
+# ---------------------------------------------------------------------------
+# Bulk API tests
+# ---------------------------------------------------------------------------
+
+class SeekableSnapshot(MockSnapshot):
+    """MockSnapshot with an ordered prefix find()."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seeks = 0
+
+    def find(self, prefix):
+        self.seeks += 1
+        for (cid, key), item in sorted(self._store.items()):
+            if cid == prefix.id and key.startswith(prefix.key):
+                yield StorageKey(cid, key), item
+
+
+class TestBulkApis:
+    """Batch balance reads match the single-account calls."""
+
+    def _accounts(self, n: int) -> List[UInt160]:
+        return [UInt160(i.to_bytes(20, "little")) for i in range(1, n + 1)]
+
+    def test_balances_of_uses_point_lookups(self):
+        token = _fresh_token()
+        snap = SeekableSnapshot()
+        engine = MockEngine(snap)
+        accounts = self._accounts(40)
+        for i, account in enumerate(accounts):
+            token.mint(engine, account, i + 1, call_on_payment=False)
+
+        query = [accounts[5], UInt160(b"\xee" * 20)] + accounts[::-1]
+        expected = [token.balance_of(snap, a) for a in query]
+        assert token.balances_of(snap, query) == expected
+        assert snap.seeks == 0
+
+    def test_iter_balances_walks_holders_in_key_order(self):
+        token = _fresh_token()
+        snap = SeekableSnapshot()
+        engine = MockEngine(snap)
+        accounts = self._accounts(3)
+        for i, account in enumerate(accounts):
+            token.mint(engine, account, i + 1, call_on_payment=False)
+
+        holders = list(token.iter_balances(snap))
+        assert sorted(holders, key=lambda entry: entry[0].data) == holders
+        assert sorted(balance for _account, balance in holders) == [1, 2, 3]
+        assert snap.seeks == 1
@@ -229,3 +229,131 @@ class TestLedgerContract:
         assert isinstance(elements[8], ByteString)
         # Final element is the transaction count, not the hashes themselves.
         assert isinstance(elements[9], Integer) and int(elements[9].value) == 2
+
+
+class TestLedgerLookupCache:
+    """Decoded-record cache, traceability window and conflict peeking."""
+
+    def _persisted(self, index: int = 9):
+        ledger = LedgerContract()
+        snapshot = _Snapshot()
+        tx = _tx(1, 0x11)
+        block = _block_with_transactions(index=index, txs=[tx])
+        engine = _Engine(snapshot=snapshot, persisting_block=block)
+        ledger.on_persist(engine)
+        ledger.post_persist(engine)
+        return ledger, snapshot, engine, block, tx
+
+    def test_repeated_lookups_reuse_decoded_records(self, monkeypatch):
+        from neo.native.ledger import TransactionState
+
+        ledger, _snapshot, engine, block, tx = self._persisted()
+        first = ledger.get_block(engine, block.hash.data)
+        state = ledger.get_transaction_state(engine.snapshot, tx.hash)
+
+        def fail(_data):
+            raise AssertionError("record decoded twice")
+
+        monkeypatch.setattr(TrimmedBlock, "from_bytes", fail)
+        monkeypatch.setattr(TransactionState, "from_bytes", fail)
+        assert ledger.get_block(engine, block.hash.data) is first
+        assert ledger.get_transaction_state(engine.snapshot, tx.hash) is state
+        assert ledger.get_transaction_from_block(engine, block.hash.data, 0) is state.transaction
+
+    def test_rewritten_record_is_decoded_again(self):
+        from neo.native.ledger import PREFIX_TRANSACTION, TransactionState
+
+        ledger, snapshot, engine, _block, tx = self._persisted()
+        assert ledger.get_transaction_height(engine, tx.hash) == 9
+
+        key = ledger._create_storage_key(PREFIX_TRANSACTION, tx.hash.data)  # noqa: SLF001
+        snapshot.get(key).value = TransactionState(block_index=4, transaction=tx).to_bytes()
+        assert ledger.get_transaction_height(engine, tx.hash) == 4
+
+    def test_cache_is_bounded(self, monkeypatch):
+        import neo.native.ledger as ledger_module
+
+        monkeypatch.setattr(ledger_module, "RECORD_CACHE_SIZE", 2)
+        ledger = LedgerContract()
+        snapshot = _Snapshot()
+        txs = [_tx(n, 0x20 + n) for n in range(4)]
+        engine = _Engine(snapshot, _block_with_transactions(index=1, txs=txs))
+        ledger.on_persist(engine)
+        ledger.post_persist(engine)
+        for tx in txs:
+            assert ledger.get_transaction(engine, tx.hash) is not None
+        assert len(ledger._records) == 2  # noqa: SLF001
+
+    def test_trace_window_resolved_once_per_engine(self):
+        ledger, _snapshot, engine, block, _tx_ = self._persisted()
+        calls = [0]
+        original = ledger._max_traceable_blocks  # noqa: SLF001
+
+        def counting(e):
+            calls[0] += 1
+            return original(e)
+
+        ledger._max_traceable_blocks = counting  # noqa: SLF001
+        for _ in range(3):
+            assert ledger.get_block(engine, block.hash.data) is not None
+        assert calls[0] == 1
+
+        ledger.invalidate_trace_window(engine)
+        ledger.get_block(engine, block.hash.data)
+        assert calls[0] == 2
+
+    def test_trace_window_cached_on_application_engine(self):
+        from neo.smartcontract.application_engine import ApplicationEngine
+
+        ledger, snapshot, _engine, block, _tx_ = self._persisted()
+        engine = ApplicationEngine(snapshot=snapshot)
+        calls = [0]
+        original = ledger._max_traceable_blocks  # noqa: SLF001
+
+        def counting(e):
+            calls[0] += 1
+            return original(e)
+
+        ledger._max_traceable_blocks = counting  # noqa: SLF001
+        for _ in range(5):
+            assert ledger.get_block(engine, block.hash.data) is not None
+        assert calls[0] == 1
+        assert engine in ledger._trace_windows  # noqa: SLF001
+
+    def test_post_persist_advances_trace_window(self):
+        ledger, snapshot, engine, _block, _tx_ = self._persisted(index=3)
+        assert ledger._trace_window(engine)[0] == 3  # noqa: SLF001
+
+        engine.persisting_block = _block_with_transactions(index=4, txs=[])
+        ledger.on_persist(engine)
+        ledger.post_persist(engine)
+        assert ledger._trace_window(engine)[0] == 4  # noqa: SLF001
+
+    def test_peek_matches_from_bytes(self):
+        from neo.native.ledger import TransactionState
+
+        tx = _tx(5, 0x33)
+        for state in (
+            TransactionState(block_index=7, transaction=None),
+            TransactionState(block_index=8, transaction=tx, state=1),
+        ):
+            data = state.to_bytes()
+            decoded = TransactionState.from_bytes(data)
+            assert TransactionState.peek(data) == (
+                decoded.block_index,
+                decoded.transaction is not None,
+            )
+        assert TransactionState.peek(b"") == (0, False)
+        assert TransactionState.peek(b"\x01\x00\x00\x00") == (1, False)
+
+    def test_conflict_check_does_not_decode_transactions(self, monkeypatch):
+        from neo.native.ledger import TransactionState
+
+        ledger, snapshot, _engine, _block, tx = self._persisted()
+
+        def fail(_data):
+            raise AssertionError("conflict check decoded a transaction")
+
+        monkeypatch.setattr(TransactionState, "from_bytes", fail)
+        # A real transaction under the hash is not a conflict stub.
+        assert ledger.contains_conflict_hash(snapshot, tx.hash, tx.signers, 2_102_400) is False
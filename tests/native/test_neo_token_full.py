@@ -1,6 +1,7 @@
 """Extended tests for NeoToken native contract."""
 
 from neo.native.neo_token import NeoToken, NeoAccountState, CandidateState
+from neo.persistence.snapshot import MemorySnapshot
 
 
 class TestNeoAccountState:
@@ -117,3 +118,279 @@ class TestNeoToken:
         """Test total amount."""
         token = NeoToken()
         assert token.total_amount == 100_000_000
+
+
+def _reference_sum(records, start, end):
+    """C# CalculateReward window sum over records scanned backward from end-1."""
+    total, cur_end = 0, end
+    for index, value in sorted(((i, v) for i, v in records if i <= end - 1), reverse=True):
+        if index > start:
+            total += value * (cur_end - index)
+            cur_end = index
+        else:
+            total += value * (cur_end - start)
+            break
+    return total
+
+
+class _GasSnapshot:
+    """Snapshot exposing only Prefix_GasPerBlock records to find()."""
+
+    def __init__(self, records):
+        self.records = dict(records)
+        self.scans = 0
+
+    def find(self, prefix):
+        from neo.native.native_contract import StorageItem, StorageKey
+
+        self.scans += 1
+        for index, value in self.records.items():
+            item = StorageItem()
+            item.set(value)
+            yield StorageKey.create(prefix.id, prefix.key[0], index), item
+
+
+class _CountingMemorySnapshot(MemorySnapshot):
+    """MemorySnapshot counting prefix scans."""
+
+    scans = 0
+
+    def find(self, prefix):
+        self.scans += 1
+        return super().find(prefix)
+
+
+class TestGasRecordIndex:
+    """GasPerBlock index matches the backward record scan."""
+
+    def test_sum_matches_reference(self):
+        import random
+
+        from neo.native.neo_token import GasRecordIndex
+
+        rng = random.Random(7)
+        for _ in range(200):
+            records = {
+                rng.randrange(0, 60): rng.randrange(0, 10) for _ in range(rng.randrange(0, 6))
+            }
+            index = GasRecordIndex(records.items())
+            start = rng.randrange(0, 70)
+            end = start + rng.randrange(1, 30)
+            assert index.sum_between(start, end) == _reference_sum(records.items(), start, end)
+
+    def test_set_appends_and_replaces(self):
+        from neo.native.neo_token import GasRecordIndex
+
+        index = GasRecordIndex([(0, 5)])
+        index.set(10, 2)
+        index.set(10, 3)
+        index.set(4, 1)
+        records = [(0, 5), (4, 1), (10, 3)]
+        assert index.indices == [0, 4, 10]
+        assert index.value_at(9) == 1
+        assert index.sum_between(2, 15) == _reference_sum(records, 2, 15)
+
+    def test_bonus_scans_records_once_per_snapshot(self):
+        from types import SimpleNamespace
+
+        neo = NeoToken()
+        snapshot = _GasSnapshot({0: 5 * 10**8, 100: 2 * 10**8})
+        state = NeoAccountState(balance=1000, balance_height=50)
+        first = neo._calculate_bonus(snapshot, state, 150)
+        assert neo._calculate_bonus(snapshot, state, 150) == first
+        assert snapshot.scans == 1
+
+        snapshot.get_and_change = lambda key, factory: factory()
+        engine = SimpleNamespace(
+            snapshot=snapshot,
+            persisting_block=SimpleNamespace(index=119),
+            check_committee=lambda: True,
+        )
+        neo.set_gas_per_block(engine, 10**8)
+        records = [(0, 5 * 10**8), (100, 2 * 10**8), (120, 10**8)]
+        expected = 1000 * _reference_sum(records, 50, 150) * 10 // 100 // neo.total_amount
+        assert neo._calculate_bonus(snapshot, state, 150) == expected
+        assert snapshot.scans == 1
+
+    def test_index_is_kept_on_memory_snapshot(self):
+        from neo.native.native_contract import StorageItem
+        from neo.native.neo_token import PREFIX_GAS_PER_BLOCK
+
+        neo = NeoToken()
+        snapshot = _CountingMemorySnapshot()
+        item = StorageItem()
+        item.set(5 * 10**8)
+        snapshot.put(neo._create_storage_key(PREFIX_GAS_PER_BLOCK, 0), item)
+        state = NeoAccountState(balance=1000, balance_height=0)
+        for _ in range(5):
+            neo._calculate_bonus(snapshot, state, 10)
+        assert snapshot.scans == 1
+
+    def test_index_follows_commits_from_clones(self):
+        from types import SimpleNamespace
+
+        from neo.native import initialize_native_contracts
+        from neo.native.native_contract import StorageItem
+        from neo.native.neo_token import PREFIX_GAS_PER_BLOCK
+        from neo.persistence.data_cache import ClonedCache, DataCache
+        from neo.persistence.memory_store import MemoryStore
+
+        neo = initialize_native_contracts()["NeoToken"]
+        base = DataCache(MemoryStore())
+        item = StorageItem()
+        item.set(5 * 10**8)
+        base.add(neo._create_storage_key(PREFIX_GAS_PER_BLOCK, 0), item)
+        assert neo.get_gas_per_block(base) == 5 * 10**8
+
+        clone = ClonedCache(base)
+        engine = SimpleNamespace(
+            snapshot=clone,
+            persisting_block=SimpleNamespace(index=0),
+            check_committee=lambda: True,
+        )
+        neo.set_gas_per_block(engine, 10**8)
+        sibling = ClonedCache(base)
+        assert neo.get_gas_per_block(sibling) == 5 * 10**8
+        clone.commit()
+
+        assert neo.get_gas_per_block(base) == 10**8
+        assert neo.get_gas_per_block(sibling) == 10**8
+        assert neo.get_gas_per_block(ClonedCache(base)) == 10**8
+
+
+class _CandidateSnapshot:
+    """Dict snapshot with prefix find() over StorageKey-keyed items."""
+
+    def __init__(self):
+        self.data = {}
+        self.scans = 0
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def add(self, key, item):
+        self.data[key] = item
+
+    def contains(self, key):
+        return key in self.data
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def get_and_change(self, key, factory=None):
+        if key not in self.data:
+            if factory is None:
+                return None
+            self.data[key] = factory()
+        return self.data[key]
+
+    def find(self, prefix):
+        self.scans += 1
+        return sorted(
+            ((k, v) for k, v in self.data.items() if k.startswith(prefix)), key=lambda kv: kv[0]
+        )
+
+
+class TestCandidateIndex:
+    """Vote-ordered candidate index and its maintenance."""
+
+    @staticmethod
+    def _pubkey(n):
+        return b"\x02" + bytes([n]) * 32
+
+    def test_top_and_key_order_skip_blocked(self):
+        from neo.native.neo_token import CandidateIndex
+        from neo.types import UInt160
+
+        index = CandidateIndex()
+        for n, votes in ((1, 10), (2, 30), (3, 30), (4, 5)):
+            index.add(self._pubkey(n), votes, UInt160(bytes([n]) * 20), False)
+        assert index.top(3) == [(self._pubkey(2), 30), (self._pubkey(3), 30), (self._pubkey(1), 10)]
+
+        index.set_blocked(UInt160(b"\x02" * 20), True)
+        index.set_votes(self._pubkey(4), 50)
+        assert len(index) == 3
+        assert index.top(2) == [(self._pubkey(4), 50), (self._pubkey(3), 30)]
+        assert [p for p, _ in index.by_key()] == [self._pubkey(n) for n in (1, 3, 4)]
+
+        index.remove(self._pubkey(4))
+        assert index.votes(self._pubkey(4)) is None
+        assert index.top(5) == [(self._pubkey(3), 30), (self._pubkey(1), 10)]
+
+    def test_register_vote_and_block_update_index(self):
+        from types import SimpleNamespace
+
+        from neo.native import initialize_native_contracts
+        from neo.types import UInt160
+
+        contracts = initialize_native_contracts()
+        neo, policy = contracts["NeoToken"], contracts["PolicyContract"]
+        snapshot = _CandidateSnapshot()
+        engine = SimpleNamespace(
+            snapshot=snapshot,
+            persisting_block=None,
+            check_witness=lambda _account: True,
+            check_witness_pubkey=lambda _pubkey: True,
+            check_committee=lambda: True,
+            is_contract=lambda _account: False,
+            send_notification=lambda *args: None,
+        )
+        a, b = self._pubkey(0x0A), self._pubkey(0x0B)
+        assert neo.get_candidates(snapshot) == []
+
+        neo.register_internal(engine, a)
+        neo.register_internal(engine, b)
+        voter = UInt160(b"\x44" * 20)
+        neo.mint(engine, voter, 25)
+        assert neo.vote_internal(engine, voter, b) is True
+        assert neo.get_candidates(snapshot) == [(a, 0), (b, 25)]
+
+        policy.block_account_internal(engine, neo._candidate_account(b))
+        assert neo.get_candidates(snapshot) == [(a, 0)]
+        policy.unblock_account(engine, neo._candidate_account(b))
+        assert neo.get_candidates(snapshot) == [(a, 0), (b, 25)]
+        assert snapshot.scans == 1
+
+    def test_index_is_kept_on_memory_snapshot(self):
+        from types import SimpleNamespace
+
+        from neo.native import initialize_native_contracts
+
+        neo = initialize_native_contracts()["NeoToken"]
+        snapshot = _CountingMemorySnapshot()
+        engine = SimpleNamespace(
+            snapshot=snapshot,
+            persisting_block=None,
+            check_witness_pubkey=lambda _pubkey: True,
+            send_notification=lambda *args: None,
+        )
+        a = self._pubkey(0x0A)
+        neo.register_internal(engine, a)
+        for _ in range(5):
+            assert neo.get_candidates(snapshot) == [(a, 0)]
+        assert snapshot.scans == 1
+
+    def test_index_follows_commits_from_clones(self):
+        from types import SimpleNamespace
+
+        from neo.native import initialize_native_contracts
+        from neo.persistence.data_cache import ClonedCache, DataCache
+        from neo.persistence.memory_store import MemoryStore
+
+        neo = initialize_native_contracts()["NeoToken"]
+        base = DataCache(MemoryStore())
+        assert neo.get_candidates(base) == []
+
+        clone = ClonedCache(base)
+        engine = SimpleNamespace(
+            snapshot=clone,
+            persisting_block=None,
+            check_witness_pubkey=lambda _pubkey: True,
+            send_notification=lambda *args: None,
+        )
+        a = self._pubkey(0x0A)
+        assert neo.register_internal(engine, a) is True
+        clone.commit()
+
+        assert neo.get_candidates(base) == [(a, 0)]
+        assert neo.get_candidates(ClonedCache(base)) == [(a, 0)]
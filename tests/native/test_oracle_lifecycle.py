@@ -548,6 +548,24 @@ class TestIdListSerialization:
         restored = oc._deserialize_id_list(data)
         assert restored == [7]
 
+    def test_matches_stack_item_encoding(self):
+        from neo.native.oracle import IdList
+        from neo.smartcontract.binary_serializer import BinarySerializer
+        from neo.vm.types import Array, Integer
+
+        for ids in ([], [0, 1, 128, 2**40], list(range(300))):
+            expected = BinarySerializer.serialize(Array(items=[Integer(i) for i in ids]))
+            assert IdList(ids).to_bytes() == expected
+
+    def test_remove_preserves_order(self):
+        from neo.native.oracle import IdList
+
+        id_list = IdList([3, 1, 2])
+        assert id_list.remove(1) is True
+        assert id_list.remove(9) is False
+        id_list.append(5)
+        assert list(IdList.from_bytes(id_list.to_bytes())) == [3, 2, 5]
+
 
 # ===========================================================================
 # Tests: Request retrieval and URL indexing
@@ -613,6 +631,36 @@ class TestOracleRequestRetrieval:
         assert len(remaining) == 1
         assert remaining[0][0] == 1
 
+    def test_get_requests_by_url_pages(self):
+        oc, snap, engine = _initialized_oracle()
+        for i in range(5):
+            oc.request(engine, "https://a.com", None, f"cb{i}", b'', 10_000_000)
+
+        page = list(oc.get_requests_by_url(snap, "https://a.com", offset=1, limit=2))
+        assert [request_id for request_id, _ in page] == [1, 2]
+        assert [r.callback_method for _, r in page] == ["cb1", "cb2"]
+        assert len(list(oc.get_requests_by_url(snap, "https://a.com", offset=4))) == 1
+
+    def test_id_list_decoded_once_per_snapshot(self, monkeypatch):
+        from neo.native.oracle import IdList
+
+        oc, snap, engine = _initialized_oracle()
+        oc.request(engine, "https://a.com", None, "cb", b'', 10_000_000)
+        decodes = []
+        original = IdList.from_bytes.__func__
+        monkeypatch.setattr(
+            IdList,
+            "from_bytes",
+            classmethod(lambda cls, data: decodes.append(data) or original(cls, data)),
+        )
+
+        for i in range(10):
+            oc.request(engine, "https://a.com", None, f"cb{i}", b'', 10_000_000)
+        oc._remove_request(snap, 3, "https://a.com")
+
+        assert decodes == []
+        assert [i for i, _ in oc.get_requests_by_url(snap, "https://a.com")][:4] == [0, 1, 2, 4]
+
 
 # ===========================================================================
 # Tests: Oracle finish
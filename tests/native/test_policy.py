@@ -25,6 +25,7 @@ from neo.native.policy import (
     PREFIX_BLOCKED_ACCOUNT,
     PREFIX_MAX_TRACEABLE_BLOCKS,
     PREFIX_MAX_VALID_UNTIL_BLOCK_INCREMENT,
+    PREFIX_STORAGE_PRICE,
     PREFIX_WHITELIST_FEE,
     PolicyContract,
 )
@@ -708,3 +709,99 @@ class TestPolicyContract:
 
         with pytest.raises(PermissionError, match="Almost full committee"):
             policy.recover_fund(engine, blocked, gas.hash)
+
+
+class _CountingSnapshot(_Snapshot):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get(self, key: Any) -> StorageItem | None:
+        self.reads += 1
+        return super().get(key)
+
+    def contains(self, key: Any) -> bool:
+        self.reads += 1
+        return super().contains(key)
+
+
+class TestPolicyValueCache:
+    def _engine(self) -> _Engine:
+        engine = _Engine()
+        engine.snapshot = _CountingSnapshot()
+        engine.snapshot.persisting_block = SimpleNamespace(index=5)  # type: ignore[attr-defined]
+        return engine
+
+    def test_repeated_reads_hit_storage_once(self) -> None:
+        policy: PolicyContract = _fresh_native_contracts()["PolicyContract"]
+        engine = self._engine()
+        account = UInt160(b"\x21" * 20)
+
+        for _ in range(100):
+            assert policy.get_fee_per_byte(engine.snapshot) == DEFAULT_FEE_PER_BYTE
+            assert policy.get_storage_price(engine.snapshot) == DEFAULT_STORAGE_PRICE
+            assert policy.is_blocked(engine.snapshot, account) is False
+
+        assert engine.snapshot.reads == 3
+
+    def test_setters_and_block_invalidate(self) -> None:
+        policy: PolicyContract = _fresh_native_contracts()["PolicyContract"]
+        engine = self._engine()
+        account = UInt160(b"\x22" * 20)
+
+        assert policy.get_fee_per_byte(engine.snapshot) == DEFAULT_FEE_PER_BYTE
+        assert policy.is_blocked(engine.snapshot, account) is False
+        policy.set_fee_per_byte(engine, 1234)
+        policy.block_account(engine, account)
+        assert policy.get_fee_per_byte(engine.snapshot) == 1234
+        assert policy.is_blocked(engine.snapshot, account) is True
+
+        policy.unblock_account(engine, account)
+        assert policy.is_blocked(engine.snapshot, account) is False
+
+    def test_new_block_height_rereads_storage(self) -> None:
+        policy: PolicyContract = _fresh_native_contracts()["PolicyContract"]
+        engine = self._engine()
+        key = policy._create_storage_key(PREFIX_STORAGE_PRICE)
+
+        assert policy.get_storage_price(engine.snapshot) == DEFAULT_STORAGE_PRICE
+        item = StorageItem()
+        item.set(42)
+        engine.snapshot.add(key, item)  # written outside the Policy setters
+        assert policy.get_storage_price(engine.snapshot) == DEFAULT_STORAGE_PRICE
+
+        engine.snapshot.persisting_block = SimpleNamespace(index=6)  # type: ignore[attr-defined]
+        assert policy.get_storage_price(engine.snapshot) == 42
+
+    def test_commit_from_clone_rereads_storage(self) -> None:
+        from neo.persistence.data_cache import ClonedCache, DataCache
+        from neo.persistence.memory_store import MemoryStore
+
+        policy: PolicyContract = _fresh_native_contracts()["PolicyContract"]
+        base = DataCache(MemoryStore())
+        assert policy.get_fee_per_byte(base) == DEFAULT_FEE_PER_BYTE
+
+        engine = _Engine()
+        clone = ClonedCache(base)
+        engine.snapshot = clone  # type: ignore[assignment]
+        policy.set_fee_per_byte(engine, 7)
+        clone.commit()
+
+        assert policy.get_fee_per_byte(base) == 7
+        assert policy.get_fee_per_byte(ClonedCache(base)) == 7
+
+    def test_memory_snapshot_keeps_its_cache(self) -> None:
+        from neo.persistence.snapshot import MemorySnapshot
+
+        class CountingMemorySnapshot(MemorySnapshot):
+            reads = 0
+
+            def get(self, key: bytes) -> bytes | None:
+                self.reads += 1
+                return super().get(key)
+
+        policy: PolicyContract = _fresh_native_contracts()["PolicyContract"]
+        snapshot = CountingMemorySnapshot()
+        for _ in range(5):
+            assert policy.get_fee_per_byte(snapshot) == DEFAULT_FEE_PER_BYTE
+        assert snapshot.reads == 1
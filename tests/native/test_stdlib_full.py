@@ -2,6 +2,23 @@
 
 import pytest
 from neo.native.std_lib import StdLib
+from neo.smartcontract.binary_serializer import BinarySerializer
+from neo.vm.types import Array, Boolean, Buffer, ByteString, Integer, Map, StackItem, Struct
+
+
+def _plain(item: StackItem):
+    """Flatten a deserialized stack item into Python values for comparison."""
+    if item.is_null:
+        return None
+    if isinstance(item, (Boolean, Integer)):
+        return int(item.get_integer()) if isinstance(item, Integer) else item.get_boolean()
+    if isinstance(item, (ByteString, Buffer)):
+        return bytes(item.get_bytes_unsafe())
+    if isinstance(item, Array):
+        return [_plain(x) for x in item]
+    if isinstance(item, Map):
+        return {_plain(k): _plain(v) for k, v in item.items()}
+    return item
 
 
 class TestStdLibEncoding:
@@ -215,4 +232,123 @@ class TestStdLibSerialization:
     def test_json_deserialize(self):
         """Test JSON deserialization."""
         result = self.stdlib.json_deserialize(b'{"key": "value"}')
-        assert result == {"key": "value"}
+        assert isinstance(result, Map)
+        assert _plain(result) == {b"key": b"value"}
+
+
+# Outputs of the previous StdLib-local encoders, which the shared
+# BinarySerializer/JsonSerializer codec must reproduce byte for byte.
+_LEGACY_BINARY = [
+    (None, "00"),
+    (True, "2001"),
+    (0, "2100"),
+    (-1, "2101ff"),
+    (128, "21028000"),
+    (-129, "21027fff"),
+    (2**63, "2109000000000000008000"),
+    (b"hello", "280568656c6c6f"),
+    ("h\u00e9", "280368c3a9"),
+    ([1, b"a", [None, True]], "40032101012801614002002001"),
+    ({b"k": 1, "s": [2]}, "480228016b2101012801734001210102"),
+    ({}, "4800"),
+]
+
+_LEGACY_JSON = [
+    (None, b"null"),
+    (-(2**53) + 1, b"-9007199254740991"),
+    (b"abc", b'"abc"'),
+    (
+        "<a href='x'>&+\u00e9\U0001F600\n\"\\",
+        b'"\\u003Ca href=\\u0027x\\u0027\\u003E\\u0026\\u002B\\u00E9\\uD83D\\uDE00\\n\\"\\\\"',
+    ),
+    ([1, [2, {}]], b"[1,[2,{}]]"),
+    ({b"k": [True, None], "z": "q"}, b'{"k":[true,null],"z":"q"}'),
+]
+
+
+class TestStdLibCodec:
+    """StdLib (de)serialization runs on the shared smart-contract codecs."""
+
+    def setup_method(self):
+        self.stdlib = StdLib()
+
+    @pytest.mark.parametrize(("value", "expected"), _LEGACY_BINARY)
+    def test_binary_matches_legacy_output(self, value, expected):
+        data = self.stdlib.serialize(value)
+        assert data.hex() == expected
+        assert BinarySerializer.serialize(BinarySerializer.deserialize(data)) == data
+
+    @pytest.mark.parametrize(("value", "expected"), _LEGACY_JSON)
+    def test_json_matches_legacy_output(self, value, expected):
+        assert self.stdlib.json_serialize(value) == expected
+
+    def test_long_bytestring_and_array_use_var_int_lengths(self):
+        payload = b"x" * 300
+        data = self.stdlib.serialize([payload] * 260)
+        assert data[:4] == bytes([0x40, 0xFD, 0x04, 0x01])
+        assert data[4:8] == bytes([0x28, 0xFD, 0x2C, 0x01])
+        assert _plain(self.stdlib.deserialize(data)) == [payload] * 260
+
+    def test_negative_integer_encoding_is_minimal(self):
+        assert self.stdlib.serialize(-128).hex() == "210180"
+        assert _plain(self.stdlib.deserialize(bytes.fromhex("210180"))) == -128
+
+    def test_cycles_rejected_shared_references_allowed(self):
+        shared = [1]
+        round_trip = self.stdlib.deserialize(self.stdlib.serialize([shared, shared]))
+        assert _plain(round_trip) == [[1], [1]]
+        cyclic: list = [1]
+        cyclic.append(cyclic)
+        with pytest.raises(ValueError, match="Circular reference"):
+            self.stdlib.serialize(cyclic)
+        with pytest.raises(ValueError, match="Circular reference"):
+            self.stdlib.json_serialize(cyclic)
+
+    def test_output_bounded_by_max_item_size(self):
+        from neo.native.std_lib import MAX_ITEM_SIZE
+
+        with pytest.raises(ValueError, match=f"exceeds max {MAX_ITEM_SIZE}"):
+            self.stdlib.serialize([b"x" * 60000] * 3)
+        with pytest.raises(ValueError, match=f"exceeds max {MAX_ITEM_SIZE}"):
+            self.stdlib.json_serialize(["x" * 60000] * 3)
+
+    def test_json_deserialize_whole_float_and_fraction(self):
+        assert _plain(self.stdlib.json_deserialize(b"[1.0]")) == [1]
+        with pytest.raises(ValueError, match="Decimal value"):
+            self.stdlib.json_deserialize(b"1.5")
+
+    def test_deserialize_keeps_item_types_through_the_vm(self):
+        from typing import Any, cast
+
+        from neo.native import initialize_native_contracts
+        from neo.smartcontract.application_engine import ApplicationEngine
+        from neo.smartcontract.call_flags import CallFlags
+
+        stdlib = initialize_native_contracts()["StdLib"]
+        engine = ApplicationEngine(snapshot=cast(Any, _EmptySnapshot()))
+        engine.load_script(b"\x00")
+
+        def call(method: str, arg: StackItem) -> StackItem:
+            engine.push(Array(items=[arg]))
+            engine.push(ByteString(bytes(stdlib.hash)))
+            engine.push(ByteString(method.encode()))
+            engine.push(Integer(int(CallFlags.NONE)))
+            engine._contract_call(engine)
+            return engine.pop()
+
+        original = Struct(items=[Integer(7), Boolean(True), Buffer(b"\x01\x02")])
+        result = call("deserialize", call("serialize", original))
+        assert type(result) is Struct
+        assert [type(item) for item in result] == [Integer, Boolean, Buffer]
+        assert _plain(result) == [7, True, b"\x01\x02"]
+
+        parsed = call("jsonDeserialize", ByteString(b'[true, "a"]'))
+        assert [type(item) for item in parsed] == [Boolean, ByteString]
+
+
+class _EmptySnapshot:
+    def get(self, key):
+        return None
+
+    def contains(self, key):
+        return False
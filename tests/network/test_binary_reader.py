@@ -1,5 +1,7 @@
 """Tests for BinaryReader."""
 
+import pytest
+
 from neo.io.binary_reader import BinaryReader
 
 
@@ -29,3 +31,33 @@ class TestBinaryReader:
         assert r.remaining == 3
         r.read_byte()
         assert r.remaining == 2
+
+
+class TestBinaryReaderViews:
+    """Zero-copy reads over buffer inputs."""
+
+    def test_memoryview_input_returns_owned_bytes(self):
+        data = bytearray(b"\x03abc\xfd\x01\x02")
+        r = BinaryReader(memoryview(data))
+        value = r.read_var_bytes()
+        assert type(value) is bytes and value == b"abc"
+        assert r.read_var_int() == 0x0201
+        assert r.remaining == 0
+
+    def test_read_var_view_shares_buffer(self):
+        data = bytearray(b"\x02xy\x00")
+        r = BinaryReader(data)
+        view = r.read_var_view()
+        data[1] = ord("z")
+        assert view.tobytes() == b"zy"
+        assert r.position == 3
+
+    def test_skip_and_span(self):
+        r = BinaryReader(b"\x01\x02\x03\x04")
+        r.skip(1)
+        r.read_uint16()
+        assert r.get_span(1) == b"\x02\x03"
+
+    def test_var_int_truncated(self):
+        with pytest.raises(ValueError):
+            BinaryReader(b"\xfe\x01\x02").read_var_int()
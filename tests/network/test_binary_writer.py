@@ -1,5 +1,7 @@
 """Tests for BinaryWriter."""
 
+import pytest
+
 from neo.io.binary_writer import BinaryWriter
 
 
@@ -29,3 +31,44 @@ class TestBinaryWriter:
         w = BinaryWriter()
         w.write_var_int(100)
         assert w.to_bytes() == b"\x64"
+
+
+class TestSizedBinaryWriter:
+    """Preallocated writers and the shared var-int helpers."""
+
+    def _fill(self, writer):
+        writer.write_byte(1)
+        writer.write_uint16(0x0203)
+        writer.write_int32(-4)
+        writer.write_uint64(5)
+        writer.write_var_bytes(b"x" * 300)
+        writer.write_var_int(0x10000)
+        return writer.to_bytes()
+
+    def test_matches_growable_writer(self):
+        expected = self._fill(BinaryWriter())
+        sized = BinaryWriter.sized(len(expected))
+        assert type(sized) is not BinaryWriter
+        assert self._fill(sized) == expected
+        assert sized.length == len(expected)
+
+    def test_wrong_size_hint(self):
+        expected = self._fill(BinaryWriter())
+        assert self._fill(BinaryWriter.sized(7)) == expected
+        assert self._fill(BinaryWriter.sized(len(expected) + 9)) == expected
+
+    def test_var_int_helpers(self):
+        from neo.io.binary_writer import append_var_bytes, encode_var_int, get_var_size
+
+        for value in (0, 0xFC, 0xFD, 0xFFFF, 0x10000, 0xFFFFFFFF, 0x100000000):
+            writer = BinaryWriter()
+            writer.write_var_int(value)
+            assert encode_var_int(value) == writer.to_bytes()
+            assert get_var_size(value) == len(writer.to_bytes())
+        buf = bytearray()
+        append_var_bytes(buf, b"ab")
+        assert buf == b"\x02ab"
+
+    def test_negative_var_int(self):
+        with pytest.raises(ValueError):
+            BinaryWriter().write_var_int(-1)
@@ -30,3 +30,51 @@ class TestBlock:
         )
         h = block.hash
         assert len(h.data) == 32
+
+
+class TestBlockCaches:
+    """Cached wire bytes and hash data."""
+
+    def _block(self):
+        from neo.network.payloads.witness import Witness
+
+        return Block(index=3, timestamp=5, witness=Witness(b"\x00", b"\x11"))
+
+    def test_deserialize_keeps_wire_bytes(self):
+        from neo.io.binary_reader import BinaryReader
+
+        raw = self._block().to_bytes()
+        block = Block.deserialize(BinaryReader(raw))
+        assert block._raw == raw
+        assert block.size == len(raw)
+        assert block.hash == self._block().hash
+
+    def test_header_field_invalidates_hash(self):
+        block = self._block()
+        old_hash = block.hash
+        block.index = 4
+        assert block.hash != old_hash
+
+    def test_transactions_keep_hash_but_not_bytes(self):
+        block = self._block()
+        old_hash, old_raw = block.hash, block.to_bytes()
+        block.transactions = []
+        assert block._hash is old_hash
+        assert block._raw is None
+        assert block.to_bytes() == old_raw
+
+    def test_size_is_computed_without_serializing(self):
+        from neo.network.payloads.signer import Signer
+        from neo.network.payloads.transaction import Transaction
+        from neo.network.payloads.witness import Witness
+
+        tx = Transaction(
+            signers=[Signer(account=UInt160(b"\x01" * 20))],
+            script=b"\x11\x40",
+            witnesses=[Witness(b"\x00", b"\x11")],
+        )
+        block = self._block()
+        block.transactions = [tx]
+        size = block.size
+        assert block._raw is None
+        assert size == len(block.to_bytes())
@@ -106,3 +106,48 @@ def test_merkle_block_payload_shape_and_bounds() -> None:
             hashes=[],
             flags=b"\x00\x00",
         )
+
+
+def test_merkle_block_payload_create_trims_and_packs_flags() -> None:
+    from neo.network.payloads.block import Block
+    from neo.network.payloads.signer import Signer
+    from neo.network.payloads.transaction import Transaction
+    from neo.types import UInt160
+
+    txs = [
+        Transaction(nonce=n, signers=[Signer(account=UInt160(b"\x01" * 20))], script=b"\x40")
+        for n in range(3)
+    ]
+    block = Block(index=9, transactions=txs)
+    payload = MerkleBlockPayload.create(block, [False, True, False])
+
+    assert payload.tx_count == 3
+    assert payload.flags == b"\x02"
+    assert payload.header.hash == block.hash.data
+    # Left pair expanded to expose tx 1; the right subtree collapses.
+    assert payload.hashes[:2] == [txs[0].hash.data, txs[1].hash.data]
+    assert len(payload.hashes) == 3
+
+
+def test_filter_load_match_block_feeds_merkle_block() -> None:
+    from neo.crypto.bloom_filter import BloomFilter
+    from neo.network.payloads.block import Block
+    from neo.network.payloads.signer import Signer
+    from neo.network.payloads.transaction import Transaction
+    from neo.types import UInt160
+
+    txs = [
+        Transaction(nonce=n, signers=[Signer(account=UInt160(bytes([n + 1]) * 20))], script=b"\x40")
+        for n in range(4)
+    ]
+    bloom = BloomFilter(m=1024, k=3, seed=11)
+    bloom.add(bytes(txs[2].signers[0].account))
+    payload = FilterLoadPayload(filter=bloom.get_bits(), k=3, tweak=11)
+
+    block = Block(index=1, transactions=txs)
+    flags = payload.match_block(block)
+    assert flags == [False, False, True, False]
+    assert MerkleBlockPayload.create(block, flags).flags == b"\x04"
+
+    with pytest.raises(ValueError):
+        FilterLoadPayload(filter=b"", k=3, tweak=0).create_filter()
@@ -28,3 +28,70 @@ class TestTransaction:
         """Test sender with no signers."""
         tx = Transaction()
         assert tx.sender == b"\x00" * 20
+
+
+class TestTransactionCaches:
+    """Cached wire bytes, size, hash and sign digest."""
+
+    def _tx(self):
+        from neo.network.payloads.signer import Signer
+        from neo.network.payloads.witness import Witness
+        from neo.types.uint160 import UInt160
+
+        return Transaction(
+            nonce=7,
+            valid_until_block=10,
+            signers=[Signer(account=UInt160(b"\x01" * 20))],
+            script=b"\x11\x40",
+            witnesses=[Witness(b"\x00", b"\x11")],
+        )
+
+    def test_deserialize_keeps_wire_bytes(self):
+        from neo.io.binary_reader import BinaryReader
+
+        raw = self._tx().to_bytes()
+        tx = Transaction.deserialize(BinaryReader(raw + b"\xff"))
+        assert tx._raw == raw
+        assert tx.to_bytes() == raw
+        assert tx.size == len(raw) == tx._compute_size()
+        assert tx.hash == self._tx().hash
+
+    def test_field_assignment_invalidates(self):
+        tx = self._tx()
+        old_hash, old_size = tx.hash, tx.size
+        tx.script = b"\x12\x40"
+        assert tx.hash != old_hash
+        assert tx.size == old_size
+
+    def test_witness_assignment_keeps_hash(self):
+        from neo.network.payloads.witness import Witness
+
+        tx = self._tx()
+        old_hash, old_size = tx.hash, tx.size
+        tx.witnesses = [Witness(b"\x00" * 3, b"\x11")]
+        assert tx._hash is old_hash
+        assert tx.size == old_size + 2
+
+    def test_invalidate_after_in_place_mutation(self):
+        from neo.network.payloads.signer import Signer
+        from neo.types.uint160 import UInt160
+
+        tx = self._tx()
+        old_hash = tx.hash
+        tx.signers.append(Signer(account=UInt160(b"\x02" * 20)))
+        assert tx.hash == old_hash
+        tx.invalidate()
+        assert tx.hash != old_hash
+
+    def test_sign_digest(self):
+        from hashlib import sha256
+
+        tx = self._tx()
+        expected = sha256((860833102).to_bytes(4, "little") + tx.hash.data).digest()
+        assert tx.get_sign_digest(860833102) == expected
+        assert tx.get_sign_digest(860833102) is tx.get_sign_digest(860833102)
+
+    def test_caches_ignored_by_equality(self):
+        tx = self._tx()
+        assert tx.hash == self._tx().hash  # fills tx's hash cache
+        assert tx == self._tx()
@@ -170,3 +170,45 @@ class TestClonedCache:
         
         # Now should be in parent
         assert parent.get(b"key") == b"value"
+
+    def test_commit_version_moves_on_commit(self):
+        """Test commits from a clone advance the versions below the parent."""
+        parent = DataCache(MemoryStore())
+        first = ClonedCache(parent)
+        second = ClonedCache(parent)
+        before = (parent.commit_version, first.commit_version, second.commit_version)
+
+        first.put(b"key", b"value")
+        assert first.commit_version == before[1]
+        first.commit()
+
+        assert parent.commit_version != before[0]
+        assert first.commit_version != before[1]
+        assert second.commit_version != before[2]
+
+    def test_clone_seek_merges_layers(self):
+        """Test seek over a clone merges store, parent and local changes."""
+        store = MemoryStore()
+        store.put(b"k1", b"s1")
+        store.put(b"k3", b"s3")
+        parent = DataCache(store)
+        parent.put(b"k2", b"p2")
+        parent.delete(b"k3")
+        clone = ClonedCache(parent)
+        clone.put(b"k4", b"c4")
+        clone.delete(b"k1")
+
+        expected = [(b"k2", b"p2"), (b"k4", b"c4")]
+        assert list(clone.seek(b"k")) == expected
+        assert list(clone.seek(b"k", -1)) == expected[::-1]
+        assert list(clone.find(b"k")) == expected
+
+    def test_seek_ignores_later_writes(self):
+        """Test seek cursor is isolated from writes made after it opens."""
+        store = MemoryStore()
+        store.put(b"k1", b"v1")
+        cache = DataCache(store)
+        cursor = cache.seek(b"k")
+        cache.put(b"k2", b"v2")
+        cache.delete(b"k1")
+        assert list(cursor) == [(b"k1", b"v1")]
@@ -52,6 +52,34 @@ class TestMemorySnapshot:
         
         results = list(snap.find(b"prefix_"))
         assert len(results) == 2
+
+    def test_seek_matches_find(self):
+        """Test seek merges pending changes over committed entries."""
+        snap = MemorySnapshot()
+        snap.put(b"p1", b"a")
+        snap.put(b"p3", b"c")
+        snap.put(b"p4", b"d")
+        snap.commit()
+        snap.put(b"p2", b"b")
+        snap.put(b"p3", b"C")
+        snap.delete(b"p4")
+
+        expected = list(snap.find(b"p"))
+        assert list(snap.seek(b"p")) == expected
+        assert list(snap.seek(b"p", -1)) == expected[::-1]
+
+    def test_seek_ignores_later_writes(self):
+        """Test seek cursor is isolated from writes made after it opens."""
+        snap = MemorySnapshot()
+        snap.put(b"p1", b"a")
+        snap.commit()
+        snap.put(b"p2", b"b")
+
+        cursor = snap.seek(b"p")
+        snap.put(b"p3", b"c")
+        snap.put(b"p2", b"changed")
+        snap.delete(b"p1")
+        assert list(cursor) == [(b"p1", b"a"), (b"p2", b"b")]
     
     def test_clone(self):
         """Test clone snapshot."""
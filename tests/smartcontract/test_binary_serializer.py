@@ -1,7 +1,9 @@
 """Tests for binary serializer."""
 
+import pytest
+
 from neo.smartcontract.binary_serializer import BinarySerializer
-from neo.vm.types import Integer, Boolean, ByteString, Array, NULL
+from neo.vm.types import Integer, Boolean, Buffer, ByteString, Array, Map, Struct, NULL
 
 
 class TestBinarySerializer:
@@ -45,3 +47,39 @@ class TestBinarySerializer:
         data = BinarySerializer.serialize(arr)
         result = BinarySerializer.deserialize(data)
         assert len(result._items) == 2
+
+    def test_nested_containers_round_trip(self):
+        """Nested containers serialize in pre-order and round-trip."""
+        m = Map()
+        m[Integer(1)] = Struct(items=[Buffer(bytearray(b"ab")), NULL])
+        arr = Array(items=[m, Boolean(True), Integer(-129)])
+        data = BinarySerializer.serialize(arr)
+        assert data == bytes.fromhex("4003480121010141023002616200200121027fff")
+        assert BinarySerializer.serialize(BinarySerializer.deserialize(data)) == data
+
+    def test_shared_reference_allowed(self):
+        """The same container may appear twice as long as it is not a cycle."""
+        inner = Array(items=[Integer(1)])
+        data = BinarySerializer.serialize(Array(items=[inner, inner]))
+        assert data == bytes.fromhex("400240012101014001210101")
+        assert len(BinarySerializer.deserialize(data)._items) == 2
+
+    def test_cycle_rejected(self):
+        """A container reachable from itself is rejected."""
+        outer = Array(items=[])
+        outer._items.append(Array(items=[outer]))
+        with pytest.raises(ValueError, match="Circular reference"):
+            BinarySerializer.serialize(outer)
+
+    def test_size_budget_aborts(self):
+        """Output larger than max_size is rejected."""
+        item = Array(items=[ByteString(b"x" * 64)] * 4)
+        with pytest.raises(ValueError, match="exceeds max 100"):
+            BinarySerializer.serialize(item, max_size=100)
+
+    def test_deserialize_memoryview_and_truncation(self):
+        """Deserialization accepts memoryviews and faults on truncated input."""
+        data = BinarySerializer.serialize(ByteString(b"hello"))
+        assert BinarySerializer.deserialize(memoryview(data)).value == b"hello"
+        with pytest.raises(ValueError, match="Unexpected end of data"):
+            BinarySerializer.deserialize(data[:-1])
@@ -0,0 +1,102 @@
+"""Tests for the per-engine contract-call target cache."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from neo.crypto import hash160
+from neo.native.contract_management import PREFIX_CONTRACT, ContractState
+from neo.smartcontract.application_engine import ApplicationEngine
+from neo.smartcontract.call_flags import CallFlags
+from neo.types import UInt160
+from neo.vm.types import Array, ByteString, Integer
+
+_SCRIPT = b"\x11\x40"  # PUSH1, RET
+_HASH = UInt160(hash160(_SCRIPT))
+_MANIFEST = {
+    "abi": {"methods": [{"name": "main", "parameters": [], "safe": True}]},
+    "permissions": [{"contract": "*", "methods": "*"}],
+}
+
+
+class _Snapshot:
+    def __init__(self) -> None:
+        self._data: dict[Any, Any] = {}
+        self.persisting_block = SimpleNamespace(index=0)
+
+    def get(self, key: Any) -> Any | None:
+        return self._data.get(key)
+
+    def put(self, key: Any, value: Any) -> None:
+        self._data[key] = value
+
+
+def _engine() -> ApplicationEngine:
+    snapshot = _Snapshot()
+    state = ContractState(
+        id=1, hash=_HASH, nef=_SCRIPT, manifest=json.dumps(_MANIFEST).encode("utf-8")
+    )
+    snapshot.put(bytes([PREFIX_CONTRACT]) + bytes(_HASH), state.to_bytes())
+    engine = ApplicationEngine(snapshot=snapshot)  # type: ignore[arg-type]
+    engine.load_script(b"\x40")
+    return engine
+
+
+def _call(engine: ApplicationEngine) -> None:
+    engine.push(Array(items=[]))
+    engine.push(ByteString(bytes(_HASH)))
+    engine.push(ByteString(b"main"))
+    engine.push(Integer(int(CallFlags.READ_STATES)))
+    engine._contract_call(engine)
+
+
+def _counting(engine: ApplicationEngine, name: str) -> list[int]:
+    calls = [0]
+    original = getattr(engine, name)
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        calls[0] += 1
+        return original(*args, **kwargs)
+
+    setattr(engine, name, wrapper)
+    return calls
+
+
+def test_repeated_calls_reuse_resolved_target() -> None:
+    engine = _engine()
+    extracts = _counting(engine, "_extract_script_from_nef")
+    permissions = _counting(engine, "_check_method_permission")
+
+    for _ in range(3):
+        _call(engine)
+        assert engine.current_context.script == _SCRIPT
+        engine.invocation_stack.pop()
+
+    assert extracts[0] == 1
+    assert permissions[0] == 1
+    assert engine._invocation_counters[bytes(_HASH)] == 3
+
+
+def test_invalidate_contract_cache_forces_resolution() -> None:
+    engine = _engine()
+    extracts = _counting(engine, "_extract_script_from_nef")
+
+    _call(engine)
+    engine.invocation_stack.pop()
+    engine.invalidate_contract_cache(_HASH)
+    _call(engine)
+
+    assert extracts[0] == 2
+    assert engine._call_permissions
+
+
+def test_ad_hoc_contract_object_is_not_served_from_cache() -> None:
+    engine = _engine()
+    _call(engine)
+    engine.invocation_stack.pop()
+
+    other = SimpleNamespace(hash=_HASH, script=b"\x12\x40", manifest=None)
+    engine._call_contract_internal(other, "main", Array(items=[]), CallFlags.ALL)
+    assert engine.current_context.script == b"\x12\x40"
@@ -0,0 +1,122 @@
+"""Tests for ApplicationEngine notification/log capture policies."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from neo.exceptions import InvalidOperationException
+from neo.hardfork import Hardfork
+from neo.smartcontract.application_engine import ApplicationEngine, LogEntry, Notification
+from neo.smartcontract.capture_policy import CaptureMode, CapturePolicy
+from neo.types import UInt160
+from neo.vm.execution_engine import VMState
+from neo.vm.opcode import OpCode
+from neo.vm.types import NULL, Array, Integer
+
+A = UInt160(b"\x01" * 20)
+B = UInt160(b"\x02" * 20)
+
+
+def _emit(engine: ApplicationEngine) -> None:
+    engine.send_notification(A, "Transfer", Array(items=[Integer(1)]))
+    engine.send_notification(A, "Approval", Array(items=[Integer(2)]))
+    engine.send_notification(B, "Transfer", Array(items=[Integer(3)]))
+    engine.write_log(A, "a")
+    engine.write_log(B, "b")
+    assert engine.execute() == VMState.HALT
+
+
+class TestCapturePolicy:
+    """Retention and streaming behaviour per capture mode."""
+
+    def test_default_is_full(self):
+        engine = ApplicationEngine()
+        _emit(engine)
+        assert len(engine.notifications) == 3
+        assert len(engine.logs) == 2
+        assert engine.notification_count == 3
+        assert engine.log_count == 2
+
+    def test_none_retains_nothing_but_counts(self):
+        engine = ApplicationEngine(capture_policy=CapturePolicy(mode=CaptureMode.NONE))
+        _emit(engine)
+        assert engine.notifications == []
+        assert engine.logs == []
+        assert engine.notification_count == 3
+        assert engine.log_count == 2
+        assert not engine.notification_counts
+
+    def test_count_tallies_per_event(self):
+        engine = ApplicationEngine(capture_policy=CapturePolicy(mode=CaptureMode.COUNT))
+        _emit(engine)
+        assert engine.notifications == []
+        assert engine.notification_counts[(A, "Transfer")] == 1
+        assert engine.notification_counts[(A, "Approval")] == 1
+        assert engine.notification_counts[(B, "Transfer")] == 1
+
+    def test_filter_by_contract_and_event(self):
+        policy = CapturePolicy(
+            mode=CaptureMode.FILTER,
+            contracts=frozenset({A}),
+            event_names=frozenset({"Transfer"}),
+        )
+        engine = ApplicationEngine(capture_policy=policy)
+        _emit(engine)
+        assert [(n.script_hash, n.event_name) for n in engine.notifications] == [(A, "Transfer")]
+        assert [log.message for log in engine.logs] == ["a"]
+
+    def test_sink_streams_selected_events_without_retaining(self):
+        seen: list = []
+        policy = CapturePolicy(
+            mode=CaptureMode.NONE,
+            event_names=frozenset({"Transfer"}),
+            sink=seen.append,
+        )
+        engine = ApplicationEngine(capture_policy=policy)
+        _emit(engine)
+        assert engine.notifications == []
+        notifications = [e for e in seen if isinstance(e, Notification)]
+        logs = [e for e in seen if isinstance(e, LogEntry)]
+        assert [n.script_hash for n in notifications] == [A, B]
+        assert [log.message for log in logs] == ["a", "b"]
+
+    def test_full_with_sink_retains_everything(self):
+        seen: list = []
+        policy = CapturePolicy(contracts=frozenset({B}), sink=seen.append)
+        engine = ApplicationEngine(capture_policy=policy)
+        _emit(engine)
+        assert len(engine.notifications) == 3
+        assert len(seen) == 2  # B's notification and log
+
+    def test_limit_enforced_on_true_count(self):
+        engine = ApplicationEngine(
+            protocol_settings=SimpleNamespace(hardforks={Hardfork.HF_ECHIDNA: 0}),
+            capture_policy=CapturePolicy(mode=CaptureMode.NONE),
+        )
+        for _ in range(engine.MAX_NOTIFICATION_COUNT):
+            engine.send_notification(A, "Transfer", Array(items=[]))
+        with pytest.raises(InvalidOperationException, match="Maximum number of notifications"):
+            engine.send_notification(A, "Transfer", Array(items=[]))
+
+    def test_get_notifications_sees_every_event_before_the_policy_applies(self):
+        engine = ApplicationEngine(capture_policy=CapturePolicy(mode=CaptureMode.NONE))
+        engine.send_notification(A, "Transfer", Array(items=[Integer(1)]))
+        engine.send_notification(B, "Transfer", Array(items=[Integer(2)]))
+        engine.pop = lambda: NULL  # type: ignore
+        pushed: list = []
+        engine.push = pushed.append  # type: ignore
+        engine._runtime_get_notifications(engine)
+        assert len(pushed[0]) == 2
+        engine.execute()
+        assert engine.notifications == []
+
+    def test_sink_and_counts_skip_faulted_executions(self):
+        seen: list = []
+        policy = CapturePolicy(mode=CaptureMode.COUNT, sink=seen.append)
+        engine = ApplicationEngine(capture_policy=policy)
+        engine.load_script(bytes([OpCode.ABORT]))
+        engine.send_notification(A, "Transfer", Array(items=[]))
+        engine.write_log(A, "a")
+        assert engine.execute() == VMState.FAULT
+        assert seen == []
+        assert not engine.notification_counts
@@ -0,0 +1,36 @@
+"""Tests for the standard redeem script recognizers."""
+
+from neo.smartcontract.helper import is_multi_sig_contract, is_signature_contract
+from neo.smartcontract.syscalls.contract import (
+    _create_multisig_redeem_script,
+    _create_signature_redeem_script,
+)
+
+KEYS = [bytes([2]) + bytes([i]) * 32 for i in range(1, 21)]
+
+
+class TestStandardScripts:
+    """Mirrors C# Helper.IsSignatureContract / IsMultiSigContract."""
+
+    def test_signature_contract(self):
+        script = _create_signature_redeem_script(KEYS[0])
+        assert is_signature_contract(script)
+        assert not is_multi_sig_contract(script)
+        assert not is_signature_contract(script[:-1])
+        assert not is_signature_contract(script[:-4] + b"\x00" * 4)
+
+    def test_multi_sig_contract(self):
+        for m, n in ((1, 1), (2, 3), (16, 16), (17, 20)):
+            script = _create_multisig_redeem_script(m, KEYS[:n])
+            assert is_multi_sig_contract(script), (m, n)
+            assert not is_signature_contract(script)
+
+    def test_multi_sig_contract_rejects_bad_counts(self):
+        script = bytearray(_create_multisig_redeem_script(2, KEYS[:3]))
+        assert not is_multi_sig_contract(bytes(script[:-1]))
+        script[-6] = 0x14  # declare n = 4 for three keys
+        assert not is_multi_sig_contract(bytes(script))
+
+    def test_arbitrary_script(self):
+        assert not is_signature_contract(b"\x11")
+        assert not is_multi_sig_contract(b"\x11" * 50)
@@ -6,6 +6,7 @@ Covers:
 - FindOptions: DESERIALIZE_VALUES, PICK_FIELD0, PICK_FIELD1
 - Combined option flags
 - Edge cases: value before next, value after exhaustion
+- Engine path: lazy streaming from the snapshot, BACKWARDS, isolation
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from typing import List, Tuple
 from neo.smartcontract.iterators import StorageIterator
 from neo.smartcontract.storage.find_options import FindOptions
 from neo.smartcontract.storage import StorageKey, StorageItem
+from neo.persistence.snapshot import MemorySnapshot
 from neo.vm.types import ByteString, Struct, Array
 
 
@@ -251,3 +253,73 @@ class TestPickField:
         v = it.value()
         assert isinstance(v, ByteString)
         assert v.value == b"field1"
+
+
+# ---------------------------------------------------------------------------
+# Engine path (snapshot-backed cursor)
+# ---------------------------------------------------------------------------
+
+class _Engine:
+    """Minimal engine stand-in exposing only a snapshot."""
+
+    def __init__(self, snapshot) -> None:
+        self.snapshot = snapshot
+
+
+class _CountingPairs:
+    """Iterator that records how many pairs have been pulled."""
+
+    def __init__(self, pairs):
+        self._pairs = iter(pairs)
+        self.pulled = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        pair = next(self._pairs)
+        self.pulled += 1
+        return pair
+
+
+class TestEnginePath:
+    """StorageIterator created from an engine streams from snapshot.seek."""
+
+    def _snapshot(self) -> MemorySnapshot:
+        snap = MemorySnapshot()
+        snap.put(b"\x01\x02\x01", b"a")
+        snap.put(b"\x01\x02\x03", b"c")
+        snap.commit()
+        snap.put(b"\x01\x02\x02", b"b")
+        return snap
+
+    def test_forward_order(self):
+        it = StorageIterator(_Engine(self._snapshot()), b"\x01\x02", FindOptions.VALUES_ONLY)
+        assert [v.value for v in _collect(it)] == [b"a", b"b", b"c"]
+
+    def test_backwards_order(self):
+        it = StorageIterator(
+            _Engine(self._snapshot()),
+            b"\x01\x02",
+            FindOptions.KEYS_ONLY | FindOptions.REMOVE_PREFIX | FindOptions.BACKWARDS,
+        )
+        assert [v.value for v in _collect(it)] == [b"\x03", b"\x02", b"\x01"]
+
+    def test_writes_after_creation_not_observed(self):
+        snap = self._snapshot()
+        it = StorageIterator(_Engine(snap), b"\x01\x02", FindOptions.VALUES_ONLY)
+        snap.put(b"\x01\x02\x04", b"d")
+        snap.put(b"\x01\x02\x02", b"changed")
+        snap.delete(b"\x01\x02\x01")
+        assert [v.value for v in _collect(it)] == [b"a", b"b", b"c"]
+
+    def test_no_snapshot_is_empty(self):
+        it = StorageIterator(_Engine(None), b"\x01", 0)
+        assert it.next() is False
+
+    def test_pairs_pulled_on_demand(self):
+        source = _CountingPairs([(b"\x01\x02\x01", b"a"), (b"\x01\x02\x02", b"b")])
+        it = StorageIterator(source, 2, FindOptions.VALUES_ONLY)
+        assert source.pulled == 0
+        assert it.next() is True
+        assert source.pulled == 1
@@ -1,5 +1,7 @@
 """Tests for storage module."""
 
+import pytest
+
 from neo.smartcontract.storage.storage_key import StorageKey
 
 
@@ -16,3 +18,41 @@ class TestStorageKey:
         key = StorageKey(id=1, key=b"test")
         data = key.to_bytes()
         assert len(data) == 8
+
+    def test_negative_id_round_trip(self):
+        """Native ids are negative and encode as signed int32."""
+        key = StorageKey(id=-5, key=b"\x01\x02")
+        assert key.to_bytes() == (-5).to_bytes(4, "little", signed=True) + b"\x01\x02"
+        assert StorageKey.from_bytes(key.to_bytes()) == key
+
+    def test_equal_and_hash_match_raw_bytes(self):
+        """Keys interoperate with stores keyed by serialized bytes."""
+        key = StorageKey.create(-6, 0x14, b"\xaa" * 20)
+        raw = StorageKey.encode(-6, b"\x14" + b"\xaa" * 20)
+        assert key == raw
+        assert {raw: 1}[key] == 1
+        assert key == StorageKey(-6, b"\x14" + b"\xaa" * 20)
+
+    def test_create_encoding(self):
+        """create() appends ints as 4-byte LE and bytes verbatim."""
+        key = StorageKey.create(3, 0x0B, 7, b"\xff")
+        assert key.key == b"\x0b\x07\x00\x00\x00\xff"
+
+    def test_prefix_keys_are_cached(self):
+        """Bare-prefix keys are built once per (contract id, prefix)."""
+        assert StorageKey.create(-1, 8) is StorageKey.create(-1, 8)
+        assert StorageKey.create(-1, 8) is not StorageKey.create(-2, 8)
+
+    def test_ordering_and_startswith(self):
+        """Ordering and prefix checks compare serialized bytes."""
+        prefix = StorageKey.create(-1, 0x0C)
+        keys = [StorageKey(-1, b"\x0c\x02"), StorageKey(-1, b"\x0c\x01"), StorageKey(-1, b"\x0d")]
+        assert sorted(keys) == [keys[1], keys[0], keys[2]]
+        assert keys[0].startswith(prefix)
+        assert not keys[2].startswith(prefix)
+
+    def test_immutable(self):
+        """Keys cannot be mutated once built."""
+        key = StorageKey(id=1, key=b"a")
+        with pytest.raises(AttributeError):
+            key.key = b"b"  # type: ignore[misc]
@@ -0,0 +1,118 @@
+"""Tests for precompiled CheckWitness evaluation and its memoization."""
+
+from types import SimpleNamespace
+
+from neo.network.payloads.witness_scope import WitnessScope
+from neo.smartcontract.application_engine import ApplicationEngine
+from neo.smartcontract.witness_evaluator import CompiledSigner, compile_condition
+from neo.types import UInt160
+
+ACCOUNT = UInt160(b"\x11" * 20)
+GROUP = bytes.fromhex("02" + "33" * 32)
+
+
+def _frame(current=None, calling=None, entry=None, groups=None):
+    """WitnessFrame over a stand-in engine with fixed call-site hashes."""
+    from neo.smartcontract.witness_evaluator import WitnessFrame
+
+    engine = SimpleNamespace(
+        current_script_hash=current,
+        calling_script_hash=calling,
+        entry_script_hash=entry,
+        _contract_groups=lambda h: (groups or {}).get(h, frozenset()),
+    )
+    return WitnessFrame(engine)
+
+
+class TestCompileCondition:
+    """Compiled predicates match the WitnessCondition semantics."""
+
+    def test_boolean_not_and_or(self):
+        t = SimpleNamespace(type=0x00, expression=True)
+        f = SimpleNamespace(type=0x00, expression=False)
+        frame = _frame()
+        assert compile_condition(t)(frame) is True
+        assert compile_condition(SimpleNamespace(type=0x01, expression=t))(frame) is False
+        assert compile_condition(SimpleNamespace(type=0x02, expressions=[t, f]))(frame) is False
+        assert compile_condition(SimpleNamespace(type=0x03, expressions=[f, t]))(frame) is True
+
+    def test_script_hash_and_called_by_contract(self):
+        a, b = b"\xaa" * 20, b"\xbb" * 20
+        frame = _frame(current=a, calling=b)
+        assert compile_condition(SimpleNamespace(type=0x18, hash=a))(frame) is True
+        assert compile_condition(SimpleNamespace(type=0x18, hash=b))(frame) is False
+        assert compile_condition(SimpleNamespace(type=0x28, hash=b))(frame) is True
+
+    def test_group_and_called_by_group(self):
+        a, b = b"\xaa" * 20, b"\xbb" * 20
+        frame = _frame(current=a, calling=b, groups={b: frozenset({GROUP})})
+        assert compile_condition(SimpleNamespace(type=0x19, group=GROUP))(frame) is False
+        assert compile_condition(SimpleNamespace(type=0x29, group=GROUP))(frame) is True
+
+    def test_called_by_entry(self):
+        a = b"\xaa" * 20
+        assert compile_condition(SimpleNamespace(type=0x20))(_frame(current=a, entry=a)) is True
+        assert compile_condition(SimpleNamespace(type=0x20))(_frame(current=a)) is False
+
+
+class TestCompiledSigner:
+    """Compiled signer scope checks."""
+
+    def test_custom_contracts(self):
+        a = b"\xaa" * 20
+        signer = SimpleNamespace(
+            scopes=WitnessScope.CUSTOM_CONTRACTS,
+            allowed_contracts=[a.hex()],
+            allowed_groups=[],
+            rules=[],
+        )
+        compiled = CompiledSigner(signer)
+        assert compiled.check(_frame(current=a)) is True
+        assert compiled.check(_frame(current=b"\xbb" * 20)) is False
+
+    def test_first_matching_rule_wins(self):
+        deny = SimpleNamespace(action=0, condition=SimpleNamespace(type=0x00, expression=True))
+        allow = SimpleNamespace(action=1, condition=SimpleNamespace(type=0x00, expression=True))
+        signer = SimpleNamespace(scopes=WitnessScope.WITNESS_RULES, rules=[deny, allow])
+        assert CompiledSigner(signer).check(_frame()) is False
+
+
+class TestCheckWitnessMemo:
+    """ApplicationEngine reuses compiled signers and memoized results."""
+
+    def _engine(self, scopes=WitnessScope.CALLED_BY_ENTRY, **signer_fields):
+        from neo.vm.script_builder import ScriptBuilder
+
+        signer = SimpleNamespace(account=ACCOUNT, scopes=scopes, **signer_fields)
+        engine = ApplicationEngine(script_container=SimpleNamespace(signers=[signer]))
+        engine.load_script(ScriptBuilder().emit_push(1).to_array())
+        return engine
+
+    def test_result_memoized_per_call_site(self):
+        engine = self._engine()
+        assert engine._check_witness_internal(ACCOUNT) is True
+        signers = engine._witness_signers
+        assert len(engine._witness_memo) == 1
+
+        assert engine._check_witness_internal(ACCOUNT) is True
+        assert engine._witness_signers is signers
+        assert len(engine._witness_memo) == 1
+
+    def test_unknown_account_not_memoized(self):
+        engine = self._engine()
+        assert engine._check_witness_internal(UInt160(b"\x99" * 20)) is False
+        assert engine._witness_memo == {}
+
+    def test_invalidate_contract_cache_drops_groups(self, monkeypatch):
+        engine = self._engine(scopes=WitnessScope.CUSTOM_GROUPS, allowed_groups=[GROUP])
+        manifest = {"groups": []}
+        contract = SimpleNamespace(manifest=manifest)
+        monkeypatch.setattr(engine, "_get_contract", lambda _hash: contract)
+
+        assert engine._check_witness_internal(ACCOUNT) is False
+
+        manifest["groups"] = [{"pubkey": GROUP.hex()}]
+        assert engine._check_witness_internal(ACCOUNT) is False  # memoized
+
+        engine.invalidate_contract_cache(engine.current_script_hash)
+        assert engine._check_witness_internal(ACCOUNT) is True
@@ -1253,3 +1253,92 @@ class TestT8N:
         ).run()
 
         assert overflow_output.result.state_root == noop_output.result.state_root
+
+
+class TestT8NStreaming:
+    """Multi-block streaming over one persistent snapshot."""
+
+    ALLOC = {"11" * 20: {"neoBalance": 10, "gasBalance": 20, "storage": {"aa": "bb"}}}
+
+    def test_state_root_matches_concatenated_hash(self):
+        from neo.crypto.hash import hash256
+
+        t8n = T8N(alloc=self.ALLOC, env={"currentBlockNumber": 1}, txs=[])
+        output = t8n.run()
+
+        data = b"".join(k + v for k, v in t8n._iter_snapshot_items())
+        assert output.result.state_root == "0x" + hash256(data).hex()
+        assert T8N(alloc={}).run().result.state_root == "0x" + hash256(b"\x00").hex()
+
+    def test_run_blocks_yields_per_block_results(self):
+        script = _build_script_hex(lambda sb: sb.emit_push(1))
+        blocks = [
+            {"env": {"currentBlockNumber": n}, "txs": [{"script": script, "signers": []}] * n}
+            for n in (1, 2, 3)
+        ]
+        t8n = T8N(alloc=self.ALLOC)
+
+        results = []
+        for result in t8n.run_blocks(iter(blocks)):
+            results.append(result)
+            assert t8n.env.current_block_number == len(results)
+
+        assert [len(r.receipts) for r in results] == [1, 2, 3]
+        assert all(r.gas_used > 0 for r in results)
+        single = T8N(alloc=self.ALLOC, env=blocks[0]["env"], txs=blocks[0]["txs"]).run()
+        assert results[0].state_root == single.result.state_root
+        assert t8n.post_alloc() == single.alloc
+
+    def test_state_keys_follow_each_commit(self):
+        from neo.crypto.hash import hash256
+
+        t8n = T8N(alloc=self.ALLOC)
+        t8n._init_state()
+        t8n._commit()
+        before = t8n._compute_state_root()
+        snapshot = t8n.snapshot
+        snapshot.delete(min(snapshot._store))
+        snapshot.delete(max(snapshot._store))
+        snapshot.put(b"\x00low", b"w")
+        snapshot.put(b"\x01new", b"v")
+        snapshot.put(b"\xfftransient", b"x")
+        snapshot.delete(b"\xfftransient")
+        t8n._commit()
+
+        store = snapshot._store
+        assert t8n._state_keys == sorted(store)
+        data = b"".join(key + store[key] for key in sorted(store))
+        assert t8n._compute_state_root() == "0x" + hash256(data).hex() != before
+
+    def test_run_blocks_rejects_malformed_block(self):
+        import pytest
+
+        with pytest.raises(ValueError, match="txs must be a JSON array"):
+            list(T8N(alloc={}).run_blocks([{"env": {}, "txs": {}}]))
+
+    def test_capture_policy_sink_receives_halted_transaction_logs(self):
+        from neo.smartcontract.application_engine import LogEntry
+        from neo.smartcontract.capture_policy import CaptureMode, CapturePolicy
+
+        log_hash = get_interop_hash("System.Runtime.Log")
+
+        def _log(message: str, fault: bool) -> str:
+            def build(sb: ScriptBuilder) -> None:
+                sb.emit_push(message)
+                sb.emit_syscall(log_hash)
+                sb.emit(OpCode.ABORT if fault else OpCode.PUSH1)
+
+            return _build_script_hex(build)
+
+        seen: list = []
+        policy = CapturePolicy(mode=CaptureMode.NONE, sink=seen.append)
+        txs = [
+            {"script": _log("kept", False), "signers": []},
+            {"script": _log("dropped", True), "signers": [], "nonce": 1},
+        ]
+        t8n = T8N(alloc={}, env={"currentBlockNumber": 1}, txs=txs, capture_policy=policy)
+        output = t8n.run()
+
+        assert [r.vm_state for r in output.result.receipts] == ["HALT", "FAULT"]
+        assert all(isinstance(event, LogEntry) for event in seen)
+        assert [event.message for event in seen] == ["kept"]
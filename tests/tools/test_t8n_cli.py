@@ -785,3 +785,61 @@ def test_t8n_cli_tx_hash_is_canonical_for_hex_numeric_fields(tmp_path: Path) ->
     assert result_hex["receipts"][0]["vmState"] == "HALT"
     assert result_int["receipts"][0]["vmState"] == "HALT"
     assert result_hex["receipts"][0]["txHash"] == result_int["receipts"][0]["txHash"]
+
+
+def test_t8n_cli_streams_blocks_from_jsonl(tmp_path: Path) -> None:
+    alloc_path = tmp_path / "alloc.json"
+    blocks_path = tmp_path / "blocks.jsonl"
+    receipts_path = tmp_path / "receipts.jsonl"
+    alloc_out_path = tmp_path / "alloc-out.json"
+
+    _write_json(alloc_path, {"11" * 20: {"gasBalance": 5}})
+    tx = {"script": _push_int_script_hex(1), "signers": []}
+    blocks_path.write_text(
+        "\n".join(
+            json.dumps({"env": {"currentBlockNumber": n}, "txs": [tx]}) for n in (7, 8)
+        )
+        + "\n\n",
+        encoding="utf-8",
+    )
+
+    args = ["--input-alloc", str(alloc_path), "--input-blocks", str(blocks_path)]
+    exit_code = main([*args, "--output-receipts", str(receipts_path)])
+
+    assert exit_code == 0
+    assert not alloc_out_path.exists()
+    records = [json.loads(line) for line in receipts_path.read_text(encoding="utf-8").splitlines()]
+    assert [r["blockNumber"] for r in records] == [7, 8]
+    assert all(r["receipts"][0]["vmState"] == "HALT" for r in records)
+
+    exit_code = main(
+        [*args, "--output-receipts", str(receipts_path), "--output-alloc", str(alloc_out_path)]
+    )
+    assert exit_code == 0
+    assert json.loads(alloc_out_path.read_text(encoding="utf-8")) == {"11" * 20: {"gasBalance": 5}}
+
+
+def test_t8n_cli_streams_blocks_from_directory(tmp_path: Path) -> None:
+    alloc_path = tmp_path / "alloc.json"
+    blocks_dir = tmp_path / "blocks"
+    receipts_path = tmp_path / "receipts.jsonl"
+    blocks_dir.mkdir()
+
+    _write_json(alloc_path, {})
+    for n in (2, 1):
+        _write_json(blocks_dir / f"{n:04d}.json", {"env": {"currentBlockNumber": n}, "txs": []})
+
+    exit_code = main(
+        [
+            "--input-alloc",
+            str(alloc_path),
+            "--input-blocks",
+            str(blocks_dir),
+            "--output-receipts",
+            str(receipts_path),
+        ]
+    )
+
+    assert exit_code == 0
+    records = [json.loads(line) for line in receipts_path.read_text(encoding="utf-8").splitlines()]
+    assert [r["blockNumber"] for r in records] == [1, 2]